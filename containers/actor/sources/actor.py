@@ -15,6 +15,7 @@ from utils import terminate
 from utils.actor import ActorMessageHandler
 from utils.actor import ActorProfiler
 from utils.actor import Initiator
+from utils.actor import WarmPoolManager
 
 
 class Actor:
@@ -24,7 +25,10 @@ class Actor:
             masterAddr,
             remoteLoggerAddr,
             logLevel=logging.DEBUG,
-            containerName=''):
+            containerName='',
+            warmPoolSize: int = 0,
+            inProcessTaskExecutors: bool = False,
+            maxConcurrentLaunches: int = 4):
         self.basicComponent = BasicComponent(
             ignoreSocketError=True,
             role=ComponentRole.ACTOR,
@@ -46,13 +50,23 @@ class Actor:
             basicComponent=self.basicComponent,
             isContainerMode=self.containerManager.isContainerMode,
             dockerClient=self.containerManager.dockerClient,
-            cpu=self.profiler.resources.cpu)
+            cpu=self.profiler.resources.cpu,
+            isInProcessMode=inProcessTaskExecutors,
+            maxConcurrentLaunches=maxConcurrentLaunches)
+        self.warmPool = WarmPoolManager(
+            basicComponent=self.basicComponent,
+            initiator=self.initiator,
+            isContainerMode=self.containerManager.isContainerMode,
+            poolSize=warmPoolSize)
         self.messageHandler = ActorMessageHandler(
             resourcesDiscovery=self.resourcesDiscovery,
             containerManager=self.containerManager,
             basicComponent=self.basicComponent,
             initiator=self.initiator,
-            profiler=self.profiler)
+            profiler=self.profiler,
+            warmPool=self.warmPool)
+        self.profiler.inventory.onChange = self.pushInventoryDelta
+        self.profiler.inventory.start()
         periodicTasks = self.preparePeriodTasks()
         self.periodicTaskRunner = PeriodicTaskRunner(
             basicComponent=self.basicComponent,
@@ -79,9 +93,18 @@ class Actor:
     def preparePeriodTasks(self) -> PeriodicTasks:
         periodicTasks = [
             (self.uploadResources, 60),
-            (self.uploadImages, 1800)]
+            (self.uploadImages, 1800),
+            (self.uploadLaunchTimes, 60),
+            (self.pushInventoryDelta, 10),
+            (self.profiler.inventory.sampleContainers, 30)]
+        if self.warmPool.isEnabled:
+            periodicTasks.append((self.maintainWarmPool, 10))
         return periodicTasks
 
+    def maintainWarmPool(self):
+        self.warmPool.maintain(
+            canInitComponent=self.messageHandler.canInitComponent())
+
     def uploadResources(self):
         self.profiler.profileAll()
         data = {
@@ -104,6 +127,30 @@ class Actor:
             data=data,
             destination=self.basicComponent.remoteLogger)
 
+    def pushInventoryDelta(self):
+        # Changes before registration are part of the registration data and
+        # are flushed by the periodic task once registered
+        if not self.basicComponent.isRegistered.is_set():
+            return
+        delta = self.profiler.inventory.takeDelta()
+        if delta is None:
+            return
+        self.basicComponent.sendMessage(
+            messageType=MessageType.PROFILING,
+            messageSubType=MessageSubType.INVENTORY_DELTA,
+            data={'inventoryDelta': delta},
+            destination=self.basicComponent.master)
+
+    def uploadLaunchTimes(self):
+        launchTimes = self.initiator.launchTimes.calculateAll()
+        if not len(launchTimes):
+            return
+        self.basicComponent.sendMessage(
+            messageType=MessageType.LOG,
+            messageSubType=MessageSubType.LAUNCH_TIMES,
+            data={'launchTimes': launchTimes},
+            destination=self.basicComponent.remoteLogger)
+
     def register(self):
         self.basicComponent.debugLogger.info('Profiling...')
         self.profiler.profileAll()
@@ -175,6 +222,29 @@ def parseArg():
         default=10,
         type=int,
         help='Reference python logging level, from 0 to 50 integer to show log')
+    parser.add_argument(
+        '--warmPoolSize',
+        metavar='WarmPoolSize',
+        nargs='?',
+        default=0,
+        type=int,
+        help='Max count of pre-started TaskExecutors waiting for users, '
+             '0 to disable')
+    parser.add_argument(
+        '--inProcessTaskExecutors',
+        metavar='InProcessTaskExecutors',
+        nargs='?',
+        default=0,
+        type=int,
+        help='1 to host all TaskExecutors of this Actor in one shared '
+             'process, only when not running in containers')
+    parser.add_argument(
+        '--maxConcurrentLaunches',
+        metavar='MaxConcurrentLaunches',
+        nargs='?',
+        default=4,
+        type=int,
+        help='Max count of TaskExecutors being started at the same time')
 
     return parser.parse_args()
 
@@ -186,5 +256,8 @@ if __name__ == '__main__':
         masterAddr=(args.masterIP, args.masterPort),
         remoteLoggerAddr=(args.remoteLoggerIP, args.remoteLoggerPort),
         containerName=args.containerName,
-        logLevel=args.verbose)
+        logLevel=args.verbose,
+        warmPoolSize=args.warmPoolSize,
+        inProcessTaskExecutors=args.inProcessTaskExecutors == 1,
+        maxConcurrentLaunches=args.maxConcurrentLaunches)
     actor_.run()
@@ -3,6 +3,10 @@ from .initiator import BaseInitiator
 from .initiator import Initiator
 from .initiator import MasterInitiator
 from .initiator import TaskExecutorInitiator
+from .inventory import ContainerInventory
+from .launcher import ImageNameResolver
+from .launcher import LaunchTimes
 from .messageHandler import ActorMessageHandler
 from .profiler import ActorProfiler
 from .profiler import ImagesProfiler
+from .warmPool import WarmPoolManager
@@ -14,7 +14,9 @@ class Initiator(TaskExecutorInitiator, ActorInitiator, MasterInitiator):
             basicComponent: BasicComponent,
             isContainerMode: bool,
             dockerClient: DockerClient,
-            cpu: CPU):
+            cpu: CPU,
+            isInProcessMode: bool = False,
+            maxConcurrentLaunches: int = 4):
         self.basicComponent = basicComponent
         self.dockerClient = dockerClient
         TaskExecutorInitiator.__init__(
@@ -22,7 +24,9 @@ class Initiator(TaskExecutorInitiator, ActorInitiator, MasterInitiator):
             basicComponent=basicComponent,
             isContainerMode=isContainerMode,
             dockerClient=dockerClient,
-            cpu=cpu)
+            cpu=cpu,
+            isInProcessMode=isInProcessMode,
+            maxConcurrentLaunches=maxConcurrentLaunches)
         ActorInitiator.__init__(
             self,
             basicComponent=basicComponent,
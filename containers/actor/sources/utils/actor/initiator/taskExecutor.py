@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from os import system
+from threading import Lock
 from time import time
+from traceback import print_exc
+from typing import Dict
 from typing import List
 from typing import Tuple
 
@@ -7,10 +11,15 @@ from docker.client import DockerClient
 from docker.errors import APIError
 
 from .base import BaseInitiator
+from ..launcher import ImageNameResolver
+from ..launcher import LaunchTimes
 from ...component.basic import BasicComponent
 from ...tools import camelToSnake
 from ...tools import filterIllegalCharacter
+from ...types import Component
 from ...types import CPU
+from ...types import MessageSubType
+from ...types import MessageType
 
 
 class TaskExecutorInitiator(BaseInitiator):
@@ -20,13 +29,52 @@ class TaskExecutorInitiator(BaseInitiator):
             basicComponent: BasicComponent,
             isContainerMode: bool,
             dockerClient: DockerClient,
-            cpu: CPU):
+            cpu: CPU,
+            isInProcessMode: bool = False,
+            maxConcurrentLaunches: int = 4):
         BaseInitiator.__init__(
             self,
             basicComponent=basicComponent,
             isContainerMode=isContainerMode,
             dockerClient=dockerClient)
         self.cpu = cpu
+        # On host mode, run TaskExecutors in one shared runtime process
+        # instead of one process each
+        self.isInProcessMode = isInProcessMode
+        self.taskExecutorRuntime: Component = None
+        self.pendingRuntimeRequests: List[Dict] = []
+        self.isRuntimeStarting = False
+        self.runtimeLock: Lock = Lock()
+        self.imageResolver = ImageNameResolver(dockerClient=dockerClient)
+        self.launchTimes = LaunchTimes()
+        self.launchPool = ThreadPoolExecutor(
+            max_workers=maxConcurrentLaunches,
+            thread_name_prefix='TaskExecutorLauncher')
+
+    def initTaskExecutors(
+            self,
+            userID: str,
+            userName: str,
+            tasks: List[Dict],
+            isContainerMode: bool):
+        # Starts every TaskExecutor of a placement manifest concurrently
+        for task in tasks:
+            self.launchPool.submit(
+                self.launchTaskExecutor,
+                userID=userID,
+                userName=userName,
+                taskName=task['taskName'],
+                taskToken=task['taskToken'],
+                childTaskTokens=task['childrenTaskTokens'],
+                isContainerMode=isContainerMode)
+
+    def launchTaskExecutor(self, **kwargs):
+        try:
+            self.initTaskExecutor(**kwargs)
+        except Exception:
+            print_exc()
+            self.basicComponent.debugLogger.warning(
+                'Failed to init TaskExecutor for %s', kwargs['taskName'])
 
     def initTaskExecutor(
             self,
@@ -35,11 +83,25 @@ class TaskExecutorInitiator(BaseInitiator):
             taskName: str,
             taskToken: str,
             childTaskTokens: List[str],
-            isContainerMode: bool):
+            isContainerMode: bool,
+            isWarm: bool = False) -> bool:
+        # False if the TaskExecutor could not be launched
         baseTaskName, label = self.covertTaskName(taskName)
         actor = self.basicComponent.me
         master = self.basicComponent.master
         remoteLogger = self.basicComponent.remoteLogger
+        if not isContainerMode and self.isInProcessMode:
+            data = {
+                'userID': userID,
+                'taskName': baseTaskName,
+                'taskToken': taskToken,
+                'childrenTaskTokens': childTaskTokens,
+                'actorID': actor.componentID,
+                'totalCPUCores': self.cpu.cores,
+                'cpuFrequency': self.cpu.frequency,
+                'isWarm': isWarm}
+            self.initTaskExecutorInRuntime(data=data)
+            return True
         childTaskTokens = self.serialize(childTaskTokens)
         args = ' --bindIP %s' % actor.addr[0] + \
                ' --masterIP %s' % master.addr[0] + \
@@ -54,9 +116,11 @@ class TaskExecutorInitiator(BaseInitiator):
                ' --totalCPUCores %d' % self.cpu.cores + \
                ' --cpuFrequency %f' % self.cpu.frequency + \
                ' --verbose %d' % self.basicComponent.debugLogger.level
+        if isWarm:
+            args += ' --warm 1'
         if not isContainerMode:
             self.initTaskExecutorOnHost(args=args)
-            return
+            return True
 
         containerName = '%s_%s_%s_%s' % (
             taskName,
@@ -66,7 +130,7 @@ class TaskExecutorInitiator(BaseInitiator):
         containerName = filterIllegalCharacter(string=containerName)
         args += ' --containerName %s' % containerName
         imageName = 'fogbus2-%s' % camelToSnake(baseTaskName)
-        self.initTaskExecutorInContainer(
+        return self.initTaskExecutorInContainer(
             imageName=imageName, containerName=containerName, args=args)
 
     def initTaskExecutorOnHost(self, args: str):
@@ -75,14 +139,68 @@ class TaskExecutorInitiator(BaseInitiator):
         self.basicComponent.debugLogger.debug(
             'Init TaskExecutor on host:\n %s', args)
 
+    def initTaskExecutorInRuntime(self, data: Dict):
+        self.runtimeLock.acquire()
+        if self.taskExecutorRuntime is None:
+            self.pendingRuntimeRequests.append(data)
+            if not self.isRuntimeStarting:
+                self.isRuntimeStarting = True
+                self.startTaskExecutorRuntime()
+            self.runtimeLock.release()
+            return
+        self.runtimeLock.release()
+        self.sendToTaskExecutorRuntime(data)
+
+    def startTaskExecutorRuntime(self):
+        actor = self.basicComponent.me
+        master = self.basicComponent.master
+        remoteLogger = self.basicComponent.remoteLogger
+        args = ' --bindIP %s' % actor.addr[0] + \
+               ' --masterIP %s' % master.addr[0] + \
+               ' --masterPort %d' % master.addr[1] + \
+               ' --remoteLoggerIP %s' % remoteLogger.addr[0] + \
+               ' --remoteLoggerPort %d' % remoteLogger.addr[1] + \
+               ' --actorIP %s' % actor.addr[0] + \
+               ' --actorPort %d' % actor.addr[1] + \
+               ' --verbose %d' % self.basicComponent.debugLogger.level
+        system('cd ../../taskExecutor/sources/ &&'
+               ' python taskExecutorRuntime.py %s &' % args)
+        self.basicComponent.debugLogger.debug(
+            'Init TaskExecutor runtime on host:\n %s', args)
+
+    def setTaskExecutorRuntime(self, runtime: Component):
+        self.runtimeLock.acquire()
+        self.taskExecutorRuntime = runtime
+        self.isRuntimeStarting = False
+        pendingRequests = self.pendingRuntimeRequests
+        self.pendingRuntimeRequests = []
+        self.runtimeLock.release()
+        self.basicComponent.debugLogger.info(
+            'TaskExecutor runtime is at %s', str(runtime.addr))
+        for data in pendingRequests:
+            self.sendToTaskExecutorRuntime(data)
+
+    def sendToTaskExecutorRuntime(self, data: Dict):
+        self.basicComponent.sendMessage(
+            messageType=MessageType.PLACEMENT,
+            messageSubType=MessageSubType.RUN_TASK_EXECUTOR,
+            data=data,
+            destination=self.taskExecutorRuntime)
+        self.basicComponent.debugLogger.debug(
+            'Init TaskExecutor in runtime: %s', data['taskName'])
+
     def initTaskExecutorInContainer(
-            self, args: str, imageName: str, containerName: str):
+            self, args: str, imageName: str, containerName: str) -> bool:
+        # The container keeps the name it is created with, the TaskExecutor
+        # does not rename it after registration
+        startedAt = time()
         try:
-            self.dockerClient.containers.run(
+            resolvedImageName = self.imageResolver.resolve(imageName)
+            startedAt = self.launchTimes.record('resolve', startedAt)
+            container = self.dockerClient.containers.create(
                 name=containerName,
-                detach=True,
                 auto_remove=True,
-                image=imageName,
+                image=resolvedImageName,
                 network_mode='host',
                 working_dir='/workplace',
                 volumes={
@@ -91,15 +209,16 @@ class TaskExecutorInitiator(BaseInitiator):
                             'bind': '/var/run/docker.sock',
                             'mode': 'rw'}},
                 command=args)
+            startedAt = self.launchTimes.record('create', startedAt)
+            container.start()
+            self.launchTimes.record('start', startedAt)
             self.basicComponent.debugLogger.debug(
                 'Init TaskExecutor in container:\n%s', args)
+            return True
         except APIError as e:
-            if 'cloudslab/' != imageName[:10]:
-                return self.initTaskExecutorInContainer(
-                    args=args,
-                    imageName='cloudslab/'+imageName,
-                    containerName=containerName)
+            self.imageResolver.forget(imageName)
             self.basicComponent.debugLogger.warning(str(e))
+            return False
 
     @staticmethod
     def serialize(childrenTaskTokens: List[str]) -> str:
@@ -111,8 +230,7 @@ class TaskExecutorInitiator(BaseInitiator):
     def covertTaskName(taskName: str) -> Tuple[str, str]:
         dashIndex = taskName.find('-')
         if dashIndex == -1:
-            label = 'None'
-        else:
-            label = taskName[dashIndex:]
+            return taskName, 'None'
+        label = taskName[dashIndex:]
         baseTaskName = taskName[:dashIndex]
         return baseTaskName, label
@@ -0,0 +1,3 @@
+from .cgroup import CgroupReader
+from .cgroup import ContainerUsage
+from .inventory import ContainerInventory
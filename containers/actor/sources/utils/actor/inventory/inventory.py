@@ -0,0 +1,251 @@
+import threading
+from threading import Lock
+from time import sleep
+from time import time
+from traceback import print_exc
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from psutil import cpu_count as cpuCount
+from psutil import virtual_memory as virtualMemory
+
+from .cgroup import CgroupReader
+
+InventoryDelta = Dict[str, Set[str]]
+
+
+# Keeps the images and running containers of this host up to date from the
+# Docker events stream instead of listing everything through the Docker API.
+# Changes are collected as a delta until they are taken, together with the
+# usage of every container if it has been sampled since
+class ContainerInventory:
+
+    def __init__(
+            self,
+            dockerClient,
+            cgroupReader: CgroupReader = None,
+            onChange: Callable[[], None] = None,
+            reconnectInterval: float = 5):
+        self.dockerClient = dockerClient
+        if cgroupReader is None:
+            cgroupReader = CgroupReader()
+        self.cgroupReader = cgroupReader
+        self.onChange = onChange
+        self.reconnectInterval = reconnectInterval
+        self.images: Set[str] = set()
+        # container id -> container name
+        self.containers: Dict[str, str] = {}
+        self.delta: InventoryDelta = self.emptyDelta()
+        self.lock: Lock = Lock()
+        # container name -> latest cgroup based usage
+        self.containerStats: Dict[str, Dict] = {}
+        self.isSampled = False
+        self.previousCPU: Dict[str, Tuple[float, float]] = {}
+        self.peakMemory: Dict[str, int] = {}
+        self.cores = cpuCount(logical=True)
+        self.hostMemory = virtualMemory().total
+
+    @staticmethod
+    def emptyDelta() -> InventoryDelta:
+        return {
+            'imagesAdded': set(),
+            'imagesRemoved': set(),
+            'containersAdded': set(),
+            'containersRemoved': set()}
+
+    def start(self):
+        self.resync()
+        threading.Thread(
+            target=self.watch,
+            name='ContainerInventory',
+            daemon=True).start()
+
+    def watch(self):
+        while True:
+            try:
+                events = self.dockerClient.events(
+                    decode=True,
+                    filters={'type': ['container', 'image']})
+                for event in events:
+                    self.handleEvent(event)
+            except Exception:
+                print_exc()
+            # Events may have been missed while disconnected
+            sleep(self.reconnectInterval)
+            try:
+                self.resync()
+            except Exception:
+                print_exc()
+
+    def resync(self):
+        images = set()
+        for image in self.dockerClient.images.list():
+            images.update(image.tags)
+        containers = {}
+        for container in self.dockerClient.containers.list():
+            if not len(container.name):
+                continue
+            containers[container.id] = container.name
+        self.lock.acquire()
+        self._setImages(images)
+        for containerID in set(self.containers) - set(containers):
+            self._removeContainer(containerID)
+        for containerID, name in containers.items():
+            self._addContainer(containerID, name)
+        self.lock.release()
+        self.notify()
+
+    def handleEvent(self, event: Dict):
+        eventType = event.get('Type')
+        action = event.get('Action', '')
+        actor = event.get('Actor', {})
+        attributes = actor.get('Attributes', {})
+        if eventType == 'container':
+            self.handleContainerEvent(action, actor.get('ID', ''), attributes)
+            return
+        if eventType == 'image':
+            self.handleImageEvent(action, actor.get('ID', ''), attributes)
+
+    def handleContainerEvent(
+            self, action: str, containerID: str, attributes: Dict):
+        self.lock.acquire()
+        if action == 'start':
+            self._addContainer(containerID, attributes.get('name', ''))
+        elif action in {'die', 'destroy'}:
+            self._removeContainer(containerID)
+        elif action == 'rename' and containerID in self.containers:
+            self._removeContainer(containerID)
+            self._addContainer(containerID, attributes.get('name', ''))
+        else:
+            self.lock.release()
+            return
+        self.lock.release()
+        self.notify()
+
+    def handleImageEvent(self, action: str, imageID: str, attributes: Dict):
+        if action not in {'pull', 'tag', 'untag', 'delete', 'load', 'import'}:
+            return
+        tag = attributes.get('name', imageID)
+        if action in {'pull', 'tag'} and ':' in tag.rsplit('/', 1)[-1]:
+            self.lock.acquire()
+            self._addImage(tag)
+            self.lock.release()
+            self.notify()
+            return
+        # Removals only carry the image ID, so list the tags that are left
+        images = set()
+        for image in self.dockerClient.images.list():
+            images.update(image.tags)
+        self.lock.acquire()
+        self._setImages(images)
+        self.lock.release()
+        self.notify()
+
+    def _addImage(self, tag: str):
+        self.images.add(tag)
+        self.delta['imagesAdded'].add(tag)
+        self.delta['imagesRemoved'].discard(tag)
+
+    def _setImages(self, images: Set[str]):
+        for tag in self.images - images:
+            self.delta['imagesRemoved'].add(tag)
+            self.delta['imagesAdded'].discard(tag)
+        for tag in images - self.images:
+            self._addImage(tag)
+        self.images = images
+
+    def _addContainer(self, containerID: str, name: str):
+        name = name.lstrip('/')
+        if not len(name):
+            return
+        if self.containers.get(containerID) == name:
+            return
+        self.containers[containerID] = name
+        self.delta['containersAdded'].add(name)
+        self.delta['containersRemoved'].discard(name)
+
+    def _removeContainer(self, containerID: str):
+        if containerID not in self.containers:
+            return
+        name = self.containers.pop(containerID)
+        self.delta['containersRemoved'].add(name)
+        self.delta['containersAdded'].discard(name)
+        self.containerStats.pop(name, None)
+        self.previousCPU.pop(containerID, None)
+        self.peakMemory.pop(containerID, None)
+        self.cgroupReader.forget(containerID)
+
+    def notify(self):
+        if self.onChange is None:
+            return
+        self.onChange()
+
+    def hasDelta(self) -> bool:
+        return any(len(changes) for changes in self.delta.values())
+
+    def takeDelta(self) -> Optional[Dict]:
+        self.lock.acquire()
+        if not self.hasDelta() and not self.isSampled:
+            self.lock.release()
+            return None
+        delta = {key: list(value) for key, value in self.delta.items()}
+        self.delta = self.emptyDelta()
+        if self.isSampled:
+            delta['containerStats'] = dict(self.containerStats)
+            self.isSampled = False
+        self.lock.release()
+        return delta
+
+    def snapshot(self) -> Tuple[Set[str], Set[str]]:
+        # A delta holds the latest state of every name in it, so it can
+        # still be applied after a snapshot that already includes it
+        self.lock.acquire()
+        images = set(self.images)
+        runningContainers = set(self.containers.values())
+        self.lock.release()
+        return images, runningContainers
+
+    def sampleContainers(self) -> Dict[str, Dict]:
+        self.lock.acquire()
+        containers = dict(self.containers)
+        self.lock.release()
+        now = time()
+        containerStats = {}
+        for containerID, name in containers.items():
+            usage = self.cgroupReader.read(containerID)
+            if usage is None:
+                continue
+            cpuUtilization = 0.
+            if containerID in self.previousCPU:
+                previousSeconds, previousTime = self.previousCPU[containerID]
+                elapsed = now - previousTime
+                if elapsed > 0:
+                    cpuUtilization = (usage.cpuSeconds - previousSeconds) \
+                                     / elapsed / self.cores
+            self.previousCPU[containerID] = (usage.cpuSeconds, now)
+            memoryPeak = usage.memoryPeak
+            if memoryPeak is None:
+                memoryPeak = max(
+                    self.peakMemory.get(containerID, 0), usage.memory)
+            self.peakMemory[containerID] = memoryPeak
+            maxMemory = usage.memoryLimit
+            if maxMemory is None or maxMemory > self.hostMemory:
+                maxMemory = self.hostMemory
+            containerStats[name] = {
+                'cpuUtilization': round(cpuUtilization, 3),
+                'memoryUtilization': round(usage.memory / maxMemory, 3),
+                'memoryUtilizationPeak': round(memoryPeak / maxMemory, 3),
+                'maxMemory': maxMemory}
+        self.lock.acquire()
+        # Containers removed while they were read are left out
+        runningContainers = set(self.containers.values())
+        for name, stats in containerStats.items():
+            if name in runningContainers:
+                self.containerStats[name] = stats
+        self.isSampled = True
+        containerStats = dict(self.containerStats)
+        self.lock.release()
+        return containerStats
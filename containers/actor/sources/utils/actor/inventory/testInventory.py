@@ -0,0 +1,118 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from .cgroup import CgroupReader
+from .inventory import ContainerInventory
+
+
+def writeFile(path: str, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def containerEvent(action: str, containerID: str, name: str):
+    return {
+        'Type': 'container',
+        'Action': action,
+        'Actor': {'ID': containerID, 'Attributes': {'name': name}}}
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # Stands in for /sys/fs/cgroup
+        self.root = TemporaryDirectory()
+        self.inventory = ContainerInventory(
+            dockerClient=None,
+            cgroupReader=CgroupReader(root=self.root.name))
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def testContainerEvents(self):
+        self.inventory.handleEvent(containerEvent('start', 'a', 'ocr'))
+        self.inventory.handleEvent(containerEvent('start', 'b', 'blur'))
+        self.inventory.handleEvent(containerEvent('die', 'b', 'blur'))
+        delta = self.inventory.takeDelta()
+        self.assertEqual(['ocr'], delta['containersAdded'])
+        self.assertEqual(['blur'], delta['containersRemoved'])
+        self.assertIsNone(self.inventory.takeDelta())
+
+        self.inventory.handleEvent(containerEvent('die', 'a', 'ocr'))
+        delta = self.inventory.takeDelta()
+        self.assertEqual(['ocr'], delta['containersRemoved'])
+        self.assertEqual({}, self.inventory.containers)
+
+    def testImagePulled(self):
+        self.inventory.handleEvent({
+            'Type': 'image',
+            'Action': 'pull',
+            'Actor': {
+                'ID': 'cloudslab/fogbus2-ocr:latest',
+                'Attributes': {'name': 'cloudslab/fogbus2-ocr:latest'}}})
+        images, _ = self.inventory.snapshot()
+        self.assertEqual({'cloudslab/fogbus2-ocr:latest'}, images)
+        delta = self.inventory.takeDelta()
+        self.assertEqual(['cloudslab/fogbus2-ocr:latest'], delta['imagesAdded'])
+
+    def testCgroupV2(self):
+        directory = os.path.join(
+            self.root.name, 'system.slice', 'docker-a.scope')
+        writeFile(os.path.join(directory, 'cpu.stat'), 'usage_usec 1000000\n')
+        writeFile(os.path.join(directory, 'memory.current'), '100\n')
+        writeFile(os.path.join(directory, 'memory.max'), '1000\n')
+        self.inventory.handleEvent(containerEvent('start', 'a', 'ocr'))
+        self.inventory.sampleContainers()
+        writeFile(os.path.join(directory, 'cpu.stat'), 'usage_usec 2000000\n')
+        writeFile(os.path.join(directory, 'memory.current'), '50\n')
+        stats = self.inventory.sampleContainers()['ocr']
+        self.assertGreater(stats['cpuUtilization'], 0)
+        self.assertEqual(.05, stats['memoryUtilization'])
+        self.assertEqual(.1, stats['memoryUtilizationPeak'])
+        self.assertEqual(1000, stats['maxMemory'])
+
+    def testCgroupV1(self):
+        writeFile(
+            os.path.join(
+                self.root.name, 'cpuacct', 'docker', 'a', 'cpuacct.usage'),
+            '1000000000\n')
+        memoryDirectory = os.path.join(self.root.name, 'memory', 'docker', 'a')
+        writeFile(
+            os.path.join(memoryDirectory, 'memory.usage_in_bytes'), '200\n')
+        writeFile(
+            os.path.join(memoryDirectory, 'memory.max_usage_in_bytes'),
+            '400\n')
+        writeFile(
+            os.path.join(memoryDirectory, 'memory.limit_in_bytes'), '800\n')
+        usage = CgroupReader(root=self.root.name).read('a')
+        self.assertEqual(1., usage.cpuSeconds)
+        self.assertEqual(200, usage.memory)
+        self.assertEqual(400, usage.memoryPeak)
+        self.assertEqual(800, usage.memoryLimit)
+
+    def testStatsSentWithDelta(self):
+        directory = os.path.join(
+            self.root.name, 'system.slice', 'docker-a.scope')
+        writeFile(os.path.join(directory, 'cpu.stat'), 'usage_usec 1000000\n')
+        writeFile(os.path.join(directory, 'memory.current'), '100\n')
+        writeFile(os.path.join(directory, 'memory.max'), '1000\n')
+        self.inventory.handleEvent(containerEvent('start', 'a', 'ocr'))
+        self.assertNotIn('containerStats', self.inventory.takeDelta())
+        # Sampled usage alone is enough to be sent
+        self.inventory.sampleContainers()
+        delta = self.inventory.takeDelta()
+        self.assertEqual([], delta['containersAdded'])
+        stats = delta['containerStats']['ocr']
+        self.assertEqual(.1, stats['memoryUtilization'])
+        self.assertIsNone(self.inventory.takeDelta())
+        self.inventory.handleEvent(containerEvent('die', 'a', 'ocr'))
+        self.assertEqual({}, self.inventory.containerStats)
+
+    def testMissingContainer(self):
+        self.assertIsNone(CgroupReader(root=self.root.name).read('missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
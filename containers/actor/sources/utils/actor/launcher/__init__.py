@@ -0,0 +1,2 @@
+from .imageResolver import ImageNameResolver
+from .launchTimes import LaunchTimes
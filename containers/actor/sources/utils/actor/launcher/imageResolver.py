@@ -0,0 +1,49 @@
+from collections import defaultdict
+from threading import Lock
+from typing import DefaultDict
+from typing import Dict
+
+from docker.client import DockerClient
+from docker.errors import ImageNotFound
+
+
+# Remembers whether an image is available locally under its own name or
+# has to come from the cloudslab/ repository, so each launch costs no
+# extra Docker API calls
+class ImageNameResolver:
+
+    def __init__(
+            self,
+            dockerClient: DockerClient,
+            repository: str = 'cloudslab/'):
+        self.dockerClient = dockerClient
+        self.repository = repository
+        self.resolved: Dict[str, str] = {}
+        self.locks: DefaultDict[str, Lock] = defaultdict(Lock)
+
+    def resolve(self, imageName: str) -> str:
+        if imageName in self.resolved:
+            return self.resolved[imageName]
+        # Launches of the same image wait for a single lookup or pull
+        with self.locks[imageName]:
+            if imageName in self.resolved:
+                return self.resolved[imageName]
+            candidates = [imageName]
+            if not imageName.startswith(self.repository):
+                candidates.append(self.repository + imageName)
+            for candidate in candidates:
+                try:
+                    self.dockerClient.images.get(candidate)
+                except ImageNotFound:
+                    continue
+                self.resolved[imageName] = candidate
+                return candidate
+            self.dockerClient.images.pull(candidates[-1])
+            self.resolved[imageName] = candidates[-1]
+            return candidates[-1]
+
+    def forget(self, imageName: str):
+        self.resolved.pop(imageName, None)
+        for name, resolved in list(self.resolved.items()):
+            if resolved == imageName:
+                self.resolved.pop(name, None)
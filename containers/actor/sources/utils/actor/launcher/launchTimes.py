@@ -0,0 +1,20 @@
+from time import time
+from typing import Dict
+
+from ...types import PairsMedian
+from ...types import SequenceMedian
+
+
+class LaunchTimes:
+
+    def __init__(self):
+        # phase -> ms each TaskExecutor launch spent on it
+        self.phases: PairsMedian[str, SequenceMedian] = PairsMedian()
+
+    def record(self, phase: str, startedAt: float) -> float:
+        now = time()
+        self.phases[phase].update((now - startedAt) * 1000)
+        return now
+
+    def calculateAll(self) -> Dict[str, float]:
+        return self.phases.calculateAll()
@@ -8,6 +8,7 @@ from pythonping import ping as testLatency
 
 from ..initiator.complete import Initiator
 from ..profiler.actor import ActorProfiler
+from ..warmPool import WarmPoolManager
 from ...component import BasicComponent
 from ...connection.message.received import MessageReceived
 from ...container.manager import ContainerManager
@@ -26,11 +27,13 @@ class ActorMessageHandler:
             containerManager: ContainerManager,
             basicComponent: BasicComponent,
             initiator: Initiator,
-            profiler: ActorProfiler):
+            profiler: ActorProfiler,
+            warmPool: WarmPoolManager = None):
         self.resourcesDiscovery = resourcesDiscovery
         self.containerManager = containerManager
         self.profiler = profiler
         self.initiator = initiator
+        self.warmPool = warmPool
         self.basicComponent = basicComponent
         self.basicComponent.handleMessage = self.handleMessage
         self._runningIperfClient = Lock()
@@ -42,6 +45,21 @@ class ActorMessageHandler:
                 messageSubType=MessageSubType.RUN_TASK_EXECUTOR):
             self.handleInitTaskExecutor(message)
             return
+        if message.typeIs(
+                messageType=MessageType.PLACEMENT,
+                messageSubType=MessageSubType.WARM_EXECUTOR_BOUND):
+            self.handleWarmExecutorBound(message)
+            return
+        if message.typeIs(
+                messageType=MessageType.PLACEMENT,
+                messageSubType=MessageSubType.WARM_EXECUTOR_EXITED):
+            self.handleWarmExecutorExited(message)
+            return
+        if message.typeIs(
+                messageType=MessageType.PLACEMENT,
+                messageSubType=MessageSubType.TASK_EXECUTOR_RUNTIME):
+            self.initiator.setTaskExecutorRuntime(message.source)
+            return
         if message.typeIs(
                 messageType=MessageType.RESOURCE_DISCOVERY,
                 messageSubType=MessageSubType.ADVERTISE_MASTER):
@@ -99,24 +117,34 @@ class ActorMessageHandler:
 
     def handleInitTaskExecutor(self, message: MessageReceived):
         data = message.data
+        userID = data['userID']
+        userName = data['userName']
+        tasks = data['tasks']
+        if self.warmPool is not None:
+            for task in tasks:
+                baseTaskName, _ = self.initiator.covertTaskName(
+                    task['taskName'])
+                self.warmPool.recordRequest(baseTaskName)
         if self.profiler.resources.cpu.utilization > .8:
             return
         if self.profiler.resources.memory.utilization > .8:
             return
-
-        userID = data['userID']
-        userName = data['userName']
-        taskName = data['taskName']
-        taskToken = data['taskToken']
-        childTaskTokens = data['childrenTaskTokens']
-        self.initiator.initTaskExecutor(
+        self.initiator.initTaskExecutors(
             userID=userID,
             userName=userName,
-            taskName=taskName,
-            taskToken=taskToken,
-            childTaskTokens=childTaskTokens,
+            tasks=tasks,
             isContainerMode=self.containerManager.isContainerMode)
 
+    def handleWarmExecutorBound(self, message: MessageReceived):
+        if self.warmPool is None:
+            return
+        self.warmPool.markBound(message.data['taskName'])
+
+    def handleWarmExecutorExited(self, message: MessageReceived):
+        if self.warmPool is None:
+            return
+        self.warmPool.markGone(message.data['taskName'])
+
     def canInitComponent(
             self,
             cpuUtilizationThreshold: float = .8,
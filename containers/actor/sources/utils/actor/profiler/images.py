@@ -1,6 +1,7 @@
 from docker import from_env as initDockerClient
 
 from .resources import ResourcesProfiler
+from ..inventory import ContainerInventory
 from ...component.basic import BasicComponent
 from ...types.hostProfiles import ActorResources
 
@@ -15,25 +16,12 @@ class ImagesProfiler(ResourcesProfiler):
         ResourcesProfiler.__init__(
             self, basicComponent=basicComponent, resources=resources)
         self.dockerClient = dockerClient
+        self.inventory = ContainerInventory(dockerClient=dockerClient)
 
     def profileImages(self):
-        # self.basicComponent.debugLogger.info('Profiling images...')
-        imageObjList = self.dockerClient.images.list()
-        images = set()
-        for image in imageObjList:
-            tags = image.tags
-            if not len(tags):
-                continue
-            images.update(tags)
+        images, _ = self.inventory.snapshot()
         self.resources.images = images
 
     def profileRunningContainers(self):
-        # self.basicComponent.debugLogger.info('Profiling RunningContainers...')
-        containerList = self.dockerClient.containers.list()
-        runningContainers = set()
-        for container in containerList:
-            containerName = container.name
-            if not len(containerName):
-                continue
-            runningContainers.add(containerName)
+        _, runningContainers = self.inventory.snapshot()
         self.resources.runningContainers = runningContainers
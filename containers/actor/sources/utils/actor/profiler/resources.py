@@ -1,8 +1,8 @@
 from psutil import cpu_count as cpuCount
 from psutil import cpu_freq as cpuFrequency
-from psutil import cpu_percent as cpuPercent
 from psutil import virtual_memory as virtualMemory
 
+from .sampler import UtilizationSampler
 from ...component.basic import BasicComponent
 from ...types.hostProfiles import ActorResources
 
@@ -12,11 +12,17 @@ class ResourcesProfiler:
     def __init__(
             self,
             basicComponent: BasicComponent,
-            resources: ActorResources = ActorResources()):
+            resources: ActorResources = ActorResources(),
+            peakWindow: float = 60):
         self.resources = resources
         self.basicComponent = basicComponent
+        # Seconds of samples the peaks are taken over
+        self.peakWindow = peakWindow
+        self.sampler = UtilizationSampler()
+        self.sampler.start()
 
     def profileResources(self):
+        self.sampler.ensureSampled()
         # self.basicComponent.debugLogger.info('Profiling Resources...')
         self.resources.cpu.cores = self.getCPUCores()
         self.resources.cpu.frequency = self.getCPUFrequency()
@@ -39,28 +45,17 @@ class ResourcesProfiler:
         totalCores = cpuCount(logical=True)
         return totalCores
 
-    @staticmethod
-    def getCPUUtilization():
-        utilization = cpuPercent(interval=.5) / 100
-        return round(utilization, 3)
+    def getCPUUtilization(self):
+        return round(self.sampler.cpu.ewma, 3)
 
-    @staticmethod
-    def getCPUUtilizationPeak():
-        # TODO: Implement
-        return 1.
+    def getCPUUtilizationPeak(self):
+        return round(self.sampler.cpu.peak(self.peakWindow), 3)
 
-    @staticmethod
-    def getMemoryUtilization():
-        vMem = virtualMemory()
-        used = vMem.used
-        total = vMem.total
-        utilization = used / total
-        return round(utilization, 3)
+    def getMemoryUtilization(self):
+        return round(self.sampler.memory.current, 3)
 
-    @staticmethod
-    def getMemoryUtilizationPeak():
-        # TODO: Implement
-        return 1.
+    def getMemoryUtilizationPeak(self):
+        return round(self.sampler.memory.peak(self.peakWindow), 3)
 
     @staticmethod
     def getMemoryMaximum():
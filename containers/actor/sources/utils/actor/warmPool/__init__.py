@@ -0,0 +1 @@
+from .manager import WarmPoolManager
@@ -0,0 +1,113 @@
+from threading import Lock
+from traceback import print_exc
+from typing import Dict
+from typing import List
+
+from ..initiator.complete import Initiator
+from ...component import BasicComponent
+
+
+class WarmPoolManager:
+
+    def __init__(
+            self,
+            basicComponent: BasicComponent,
+            initiator: Initiator,
+            isContainerMode: bool,
+            poolSize: int = 0,
+            historyDecay: float = .5):
+        self.basicComponent = basicComponent
+        self.initiator = initiator
+        self.isContainerMode = isContainerMode
+        self.poolSize = poolSize
+        # Older requests count less each time the pool is maintained
+        self.historyDecay = historyDecay
+        self.requestHistory: Dict[str, float] = {}
+        self.warmCount: Dict[str, int] = {}
+        self.lock: Lock = Lock()
+
+    @property
+    def isEnabled(self) -> bool:
+        return self.poolSize > 0
+
+    def recordRequest(self, taskName: str):
+        if not self.isEnabled:
+            return
+        self.lock.acquire()
+        if taskName not in self.requestHistory:
+            self.requestHistory[taskName] = 0
+        self.requestHistory[taskName] += 1
+        self.lock.release()
+
+    def markBound(self, taskName: str):
+        self.markGone(taskName)
+        self.recordRequest(taskName)
+
+    def markGone(self, taskName: str):
+        # Failed to launch, exited or bound to a user
+        self.lock.acquire()
+        if self.warmCount.get(taskName, 0) > 0:
+            self.warmCount[taskName] -= 1
+        self.lock.release()
+
+    def targets(self) -> Dict[str, int]:
+        total = sum(self.requestHistory.values())
+        if total <= 0:
+            return {}
+        # Largest remainder split of the pool by request frequency
+        shares = {
+            taskName: self.poolSize * count / total
+            for taskName, count in self.requestHistory.items()}
+        targets = {taskName: int(share) for taskName, share in shares.items()}
+        remaining = self.poolSize - sum(targets.values())
+        byRemainder = sorted(
+            shares.keys(),
+            key=lambda name: shares[name] - targets[name],
+            reverse=True)
+        for taskName in byRemainder[:remaining]:
+            targets[taskName] += 1
+        return {name: count for name, count in targets.items() if count}
+
+    def maintain(self, canInitComponent: bool) -> List[str]:
+        if not self.isEnabled:
+            return []
+        self.lock.acquire()
+        targets = self.targets()
+        toStart = []
+        for taskName, target in targets.items():
+            missing = target - self.warmCount.get(taskName, 0)
+            toStart += [taskName] * max(missing, 0)
+        for taskName in self.requestHistory:
+            self.requestHistory[taskName] *= self.historyDecay
+        if not canInitComponent:
+            toStart = []
+        for taskName in toStart:
+            if taskName not in self.warmCount:
+                self.warmCount[taskName] = 0
+            self.warmCount[taskName] += 1
+        self.lock.release()
+
+        started = []
+        for taskName in toStart:
+            try:
+                isLaunched = self.initiator.initTaskExecutor(
+                    userID='None',
+                    userName='Warm',
+                    taskName=taskName,
+                    taskToken='None',
+                    childTaskTokens=[],
+                    isContainerMode=self.isContainerMode,
+                    isWarm=True)
+            except Exception:
+                print_exc()
+                isLaunched = False
+            if not isLaunched:
+                self.markGone(taskName)
+                continue
+            started.append(taskName)
+        toStart = started
+        if len(toStart):
+            self.basicComponent.debugLogger.debug(
+                'Started %d warm TaskExecutors: %s',
+                len(toStart), ', '.join(toStart))
+        return toStart
@@ -0,0 +1,74 @@
+import unittest
+from logging import getLogger
+from types import SimpleNamespace
+
+from .manager import WarmPoolManager
+
+
+class Initiator:
+
+    def __init__(self, isLaunched: bool):
+        self.isLaunched = isLaunched
+        self.launched = []
+
+    def initTaskExecutor(self, taskName: str, **kwargs) -> bool:
+        self.launched.append(taskName)
+        return self.isLaunched
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testTargetsFollowRequestHistory(self):
+        warmPool = WarmPoolManager(
+            basicComponent=None,
+            initiator=None,
+            isContainerMode=False,
+            poolSize=4)
+        for _ in range(6):
+            warmPool.recordRequest('FaceDetection')
+        for _ in range(2):
+            warmPool.recordRequest('OCR')
+        targets = warmPool.targets()
+        self.assertEqual(targets, {'FaceDetection': 3, 'OCR': 1})
+        self.assertEqual(sum(targets.values()), warmPool.poolSize)
+
+    def testDisabled(self):
+        warmPool = WarmPoolManager(
+            basicComponent=None,
+            initiator=None,
+            isContainerMode=False)
+        warmPool.recordRequest('OCR')
+        self.assertEqual(warmPool.targets(), {})
+        self.assertEqual(warmPool.maintain(canInitComponent=True), [])
+
+    def testFailedLaunchNotCounted(self):
+        initiator = Initiator(isLaunched=False)
+        warmPool = WarmPoolManager(
+            basicComponent=SimpleNamespace(debugLogger=getLogger()),
+            initiator=initiator,
+            isContainerMode=True,
+            poolSize=1)
+        warmPool.recordRequest('OCR')
+        self.assertEqual(warmPool.maintain(canInitComponent=True), [])
+        self.assertEqual(warmPool.warmCount['OCR'], 0)
+        # Tried again the next time the pool is maintained
+        warmPool.maintain(canInitComponent=True)
+        self.assertEqual(initiator.launched, ['OCR', 'OCR'])
+
+    def testExitedReplaced(self):
+        initiator = Initiator(isLaunched=True)
+        warmPool = WarmPoolManager(
+            basicComponent=SimpleNamespace(debugLogger=getLogger()),
+            initiator=initiator,
+            isContainerMode=True,
+            poolSize=1)
+        warmPool.recordRequest('OCR')
+        self.assertEqual(warmPool.maintain(canInitComponent=True), ['OCR'])
+        self.assertEqual(warmPool.maintain(canInitComponent=True), [])
+        warmPool.markGone('OCR')
+        self.assertEqual(warmPool.warmCount['OCR'], 0)
+        self.assertEqual(warmPool.maintain(canInitComponent=True), ['OCR'])
+
+
+if __name__ == '__main__':
+    unittest.main()
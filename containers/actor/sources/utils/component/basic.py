@@ -1,5 +1,8 @@
 import signal
 from abc import ABC
+from traceback import print_exc
+from typing import Callable
+from typing import List
 from typing import Tuple
 
 from .communicator import Communicator
@@ -37,6 +40,8 @@ class BasicComponent(Communicator, ABC):
         self.setName(addr=self.addr)
         self.exitTries: int = 0
         self.maxExitTries: int = 3
+        # Called before a Master or RemoteLogger exits on a signal
+        self.exitHandlers: List[Callable[[], None]] = []
         self.platform = PlatformInfo()
 
     def signalHandler(self, sig, frame):
@@ -48,6 +53,7 @@ class BasicComponent(Communicator, ABC):
             terminate()
             return
         if self.role in {ComponentRole.MASTER, ComponentRole.REMOTE_LOGGER}:
+            self.runExitHandlers()
             terminate()
             return
         data = {'reason': 'Manually interrupted.'}
@@ -57,6 +63,13 @@ class BasicComponent(Communicator, ABC):
             data=data,
             destination=self.master)
 
+    def runExitHandlers(self):
+        for exitHandler in self.exitHandlers:
+            try:
+                exitHandler()
+            except Exception:
+                print_exc()
+
     def handleSignal(self):
         signal.signal(signal.SIGINT, self.signalHandler)
         signal.signal(signal.SIGTERM, self.signalHandler)
@@ -80,6 +93,19 @@ class BasicComponent(Communicator, ABC):
             data=data,
             destination=self.remoteLogger)
 
+    def uploadLinkEstimates(self):
+        # The Master merges its own estimates locally
+        if self.role in {ComponentRole.MASTER, ComponentRole.REMOTE_LOGGER}:
+            return
+        estimates = self.linkEstimator.estimateAll()
+        if not len(estimates['dataRate']) and not len(estimates['latency']):
+            return
+        self.sendMessage(
+            messageType=MessageType.PROFILING,
+            messageSubType=MessageSubType.LINK_ESTIMATES,
+            data={'linkEstimates': estimates},
+            destination=self.master)
+
     def uploadDelays(self):
         allDelays = self.delays.calculateAll()
         data = {'delays': allDelays}
@@ -10,6 +10,7 @@ from struct import calcsize
 from struct import unpack
 from threading import Event
 from threading import Thread
+from time import time
 from traceback import print_exc
 from typing import Any
 from typing import Tuple
@@ -86,7 +87,8 @@ class MessageReceiver(MessageSender):
         self.serveEvent.set()
         while True:
             clientSocket, clientAddress = self.serverSocket.accept()
-            request = ConnectionRequest(clientSocket, clientAddress)
+            request = ConnectionRequest(
+                clientSocket, clientAddress, acceptedAt=time())
             self.requests.put(request)
 
     def tryListeningOn(self, addr: Address, portRange: Tuple[int, int]) -> bool:
@@ -129,16 +131,21 @@ class MessageReceiver(MessageSender):
         while True:
             try:
                 request = self.requests.get()
-                content, packetSize = self.receiveMessage(request.clientSocket)
+                content, packetSize, transferTime = self.receiveMessage(
+                    request.clientSocket, request.acceptedAt)
                 if packetSize == 0:
                     continue
                 message = MessageReceived.fromDict(content)
+                self.linkEstimator.recordTransfer(
+                    message.source.hostID, packetSize, transferTime)
                 self.messagesReceivedQueue.put((message, packetSize))
             except OSError:
                 continue
 
     @staticmethod
-    def receiveMessage(clientSocket: socket) -> Tuple[Any, int]:
+    def receiveMessage(
+            clientSocket: socket,
+            acceptedAt: float) -> Tuple[Any, int, float]:
         result = None
         buffer = b''
         try:
@@ -154,10 +161,14 @@ class MessageReceiver(MessageSender):
             result = data
         except (OSError, error):
             pass
+        # Bytes that arrived while the request was queued are in the kernel
+        # buffer already, so timing from the first read would overestimate
+        # the data rate
+        transferTime = time() - acceptedAt
         clientSocket.close()
         if result is None:
-            return {}, 0
-        return decrypt(result), len(result)
+            return {}, 0, .0
+        return decrypt(result), len(result), transferTime
 
     @abstractmethod
     def handle(self):
@@ -76,6 +76,8 @@ class Master:
             self.basicComponent.debugLogger.error(
                 'Scheduler name is invalid: %s', schedulerName)
             terminate()
+        # Stops the evaluation processes of the scheduler on exit
+        self.basicComponent.exitHandlers.append(self.scheduler.shutdown)
         self.registry = Registry(
             basicComponent=self.basicComponent,
             applicationManager=self.applicationManager,
@@ -143,7 +145,9 @@ class Master:
             (self.profiler.periodicallyProfileDataRate,
              self.parsedArgs.profileDataRatePeriod),
             (self.uploadLatency, 30),
+            (self.uploadLaunchTimes, 60),
             (self.updateResources, 30),
+            (self.mergeLinkEstimates, 20),
             (self.profiler.loggerManager.saveAll, 1800),
             (self.profiler.loggerManager.retrieveAll, 1900),
             (self.uploadProfiles, 2000),
@@ -183,6 +187,24 @@ class Master:
             data=data,
             destination=self.basicComponent.remoteLogger)
 
+    def uploadLaunchTimes(self):
+        launchTimes = {
+            nameConsistent: methods.calculateAll()
+            for nameConsistent, methods in
+            list(self.registry.launchTimes.items())}
+        if not len(launchTimes):
+            return
+        self.basicComponent.sendMessage(
+            messageType=MessageType.LOG,
+            messageSubType=MessageSubType.LAUNCH_TIMES,
+            data={'launchTimes': launchTimes},
+            destination=self.basicComponent.remoteLogger)
+
+    def mergeLinkEstimates(self):
+        self.profiler.mergeLinkEstimates(
+            hostID=self.basicComponent.hostID,
+            linkEstimates=self.basicComponent.linkEstimator.estimateAll())
+
     def updateResources(self):
         self.profiler.me.profileResources()
 
@@ -256,7 +278,29 @@ def parseArg():
         nargs='?',
         default=4,
         type=int,
-        help='Estimation thread number')
+        help='Number of processes that evaluate large populations')
+    parser.add_argument(
+        '--concurrentSchedules',
+        metavar='ConcurrentSchedules',
+        nargs='?',
+        default=4,
+        type=int,
+        help='Number of users that can be scheduled at the same time')
+    parser.add_argument(
+        '--decisionCacheAge',
+        metavar='DecisionCacheAge',
+        nargs='?',
+        default=300,
+        type=float,
+        help='Seconds a scheduling decision can be reused. Set to 0 to '
+             'disable')
+    parser.add_argument(
+        '--schedulingBudget',
+        metavar='SchedulingBudget',
+        nargs='?',
+        default=5000,
+        type=float,
+        help='Milliseconds a search can take when the user sets no budget')
     parser.add_argument(
         '--databaseType',
         metavar='DatabaseType',
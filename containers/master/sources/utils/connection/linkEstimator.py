@@ -0,0 +1,98 @@
+from collections import defaultdict
+from collections import deque
+from threading import Lock
+from time import time
+from typing import DefaultDict
+from typing import Deque
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+Samples = DefaultDict[str, Deque[Tuple[float, float]]]
+
+
+# Estimates the data rate and round trip time to every peer host from the
+# messages that are sent anyway. The data rate is the maximum over a window,
+# because a single transfer rarely fills the link. The round trip time is
+# the minimum over a window, because queueing only ever adds to it
+class LinkEstimator:
+
+    def __init__(
+            self,
+            window: float = 60,
+            minTransferSize: int = 64 * 1024):
+        self.window = window
+        # Smaller transfers are dominated by the round trip time
+        self.minTransferSize = minTransferSize
+        self.dataRateSamples: Samples = defaultdict(deque)
+        self.rttSamples: Samples = defaultdict(deque)
+        self.lock: Lock = Lock()
+
+    def recordTransfer(
+            self, peerHostID: str, size: int, seconds: float,
+            timestamp: float = None):
+        if not peerHostID or size < self.minTransferSize or seconds <= 0:
+            return
+        # bits per second, the same as iperf3 reports
+        self.record(
+            self.dataRateSamples, peerHostID, size * 8 / seconds, timestamp)
+
+    def recordRTT(
+            self, peerHostID: str, seconds: float, timestamp: float = None):
+        if not peerHostID or seconds <= 0:
+            return
+        # ms, the same as pythonping reports
+        self.record(self.rttSamples, peerHostID, seconds * 1000, timestamp)
+
+    def record(
+            self, samples: Samples, peerHostID: str, value: float,
+            timestamp: float = None):
+        if timestamp is None:
+            timestamp = time()
+        self.lock.acquire()
+        samples[peerHostID].append((timestamp, value))
+        self.prune(samples[peerHostID], timestamp)
+        self.lock.release()
+
+    def prune(self, peerSamples: Deque[Tuple[float, float]], now: float):
+        while len(peerSamples) and now - peerSamples[0][0] > self.window:
+            peerSamples.popleft()
+
+    def dataRate(self, peerHostID: str, now: float = None) -> Optional[float]:
+        return self.estimate(self.dataRateSamples, peerHostID, max, now)
+
+    def rtt(self, peerHostID: str, now: float = None) -> Optional[float]:
+        return self.estimate(self.rttSamples, peerHostID, min, now)
+
+    def estimate(
+            self, samples: Samples, peerHostID: str, pick,
+            now: float = None) -> Optional[float]:
+        if now is None:
+            now = time()
+        self.lock.acquire()
+        result = None
+        if peerHostID in samples:
+            peerSamples = samples[peerHostID]
+            self.prune(peerSamples, now)
+            if len(peerSamples):
+                result = pick(value for _, value in peerSamples)
+        self.lock.release()
+        return result
+
+    def estimateAll(self, now: float = None) -> Dict[str, Dict[str, float]]:
+        if now is None:
+            now = time()
+        estimates = {'dataRate': {}, 'latency': {}}
+        self.lock.acquire()
+        dataRatePeers = list(self.dataRateSamples)
+        rttPeers = list(self.rttSamples)
+        self.lock.release()
+        for peerHostID in dataRatePeers:
+            dataRate = self.dataRate(peerHostID, now)
+            if dataRate is not None:
+                estimates['dataRate'][peerHostID] = dataRate
+        for peerHostID in rttPeers:
+            rtt = self.rtt(peerHostID, now)
+            if rtt is not None:
+                estimates['latency'][peerHostID] = rtt
+        return estimates
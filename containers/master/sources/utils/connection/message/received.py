@@ -17,7 +17,8 @@ class MessageReceived(Message, ABC):
                  data,
                  source: Component,
                  receivedAtLocalTimestamp: float = .0,
-                 sentAtSourceTimestamp: float = .0):
+                 sentAtSourceTimestamp: float = .0,
+                 destination: Component = None):
         super().__init__(
             messageType=messageType,
             messageSubType=messageSubType,
@@ -26,17 +27,22 @@ class MessageReceived(Message, ABC):
             receivedAtLocalTimestamp=receivedAtLocalTimestamp,
             sentAtSourceTimestamp=sentAtSourceTimestamp)
         self.source = source
+        self.destination = destination
 
     @staticmethod
     def fromDict(messageInDict: Dict):
         source = Component.fromDict(messageInDict['source'])
+        destination = None
+        if 'destination' in messageInDict:
+            destination = Component.fromDict(messageInDict['destination'])
         messageReceived = MessageReceived(
             messageType=MessageType(messageInDict['type']),
             messageSubType=MessageSubType(messageInDict['subType']),
             messageSubSubType=MessageSubSubType(messageInDict['subSubType']),
             source=source,
             data=messageInDict['data'],
-            sentAtSourceTimestamp=messageInDict['sentAtSourceTimestamp'])
+            sentAtSourceTimestamp=messageInDict['sentAtSourceTimestamp'],
+            destination=destination)
         return messageReceived
 
     def toDict(self):
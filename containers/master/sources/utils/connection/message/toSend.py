@@ -16,7 +16,8 @@ class MessageToSend(Message, ABC):
             data: Dict,
             destination: Component,
             messageSubType: MessageSubType = MessageSubType.NONE,
-            messageSubSubType: MessageSubSubType = MessageSubSubType.NONE):
+            messageSubSubType: MessageSubSubType = MessageSubSubType.NONE,
+            source: Component = None):
         Message.__init__(
             self,
             messageType=messageType,
@@ -24,6 +25,8 @@ class MessageToSend(Message, ABC):
             messageSubSubType=messageSubSubType,
             data=data)
         self.destination = destination
+        # Sent on behalf of another component sharing this endpoint
+        self.source = source
 
     @staticmethod
     def fromDict(messageInDict: Dict):
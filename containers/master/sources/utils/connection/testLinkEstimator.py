@@ -0,0 +1,57 @@
+import struct
+import unittest
+from socket import socketpair
+from time import sleep
+from time import time
+
+from .linkEstimator import LinkEstimator
+from .messageReceiver import MessageReceiver
+from .messageSender import FORMAT
+from ..tools import encrypt
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testMaxDataRate(self):
+        estimator = LinkEstimator(window=60, minTransferSize=1000)
+        estimator.recordTransfer('a', 1000, .5, timestamp=0)
+        estimator.recordTransfer('a', 1000, 1., timestamp=10)
+        estimator.recordTransfer('a', 1000, 2., timestamp=20)
+        self.assertEqual(16000, estimator.dataRate('a', now=20))
+        # The fastest transfer leaves the window
+        self.assertEqual(8000, estimator.dataRate('a', now=65))
+        self.assertIsNone(estimator.dataRate('a', now=100))
+
+    def testSmallTransfers(self):
+        estimator = LinkEstimator(minTransferSize=1000)
+        estimator.recordTransfer('a', 999, .001)
+        estimator.recordTransfer('', 1000, .001)
+        estimator.recordTransfer('b', 1000, 0)
+        self.assertEqual({}, estimator.estimateAll()['dataRate'])
+
+    def testMinRTT(self):
+        estimator = LinkEstimator(window=60)
+        estimator.recordRTT('a', .03, timestamp=0)
+        estimator.recordRTT('a', .01, timestamp=10)
+        estimator.recordRTT('b', .02, timestamp=10)
+        estimates = estimator.estimateAll(now=20)
+        self.assertAlmostEqual(10, estimates['latency']['a'])
+        self.assertAlmostEqual(20, estimates['latency']['b'])
+
+    def testTransferTimedFromAccept(self):
+        receiving, sending = socketpair()
+        message = encrypt({'data': b'0' * 32 * 1024})
+        acceptedAt = time()
+        sending.sendall(struct.pack(FORMAT, len(message)) + message)
+        sending.close()
+        # The message waits in the kernel buffer until a thread reads it
+        sleep(.2)
+        content, size, seconds = MessageReceiver.receiveMessage(
+            receiving, acceptedAt)
+        self.assertEqual(len(message), size)
+        self.assertEqual(32 * 1024, len(content['data']))
+        self.assertGreaterEqual(seconds, .2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 from typing import Dict
+from typing import Tuple
 
 from .types import AllDataRate
 from .types import AllDelay
@@ -34,6 +35,44 @@ class AllSystemPerformance(AutoDictionary, SerializableDictionary):
         self.responseTime: AllResponseTime = \
             {} if responseTime is None else responseTime
 
+    def snapshot(self):
+        # Profilers keep updating the inner dictionaries in place, so a
+        # scheduler that runs for seconds works on copies of them. Listing
+        # the items first is atomic, iterating a growing dictionary is not
+        def copyDictInDict(dictInDict: Dict[str, Dict]) -> Dict[str, Dict]:
+            return {
+                key: dict(value) for key, value in list(dictInDict.items())}
+
+        return AllSystemPerformance(
+            dataRate=copyDictInDict(self.dataRate),
+            delay=copyDictInDict(self.delay),
+            latency=copyDictInDict(self.latency),
+            packetSize=copyDictInDict(self.packetSize),
+            processingTime=dict(self.processingTime),
+            responseTime=dict(self.responseTime))
+
+    def version(self) -> int:
+        # Equal for equal tables, so costs estimated over one snapshot can
+        # be reused over a later one if nothing the Estimator reads changed.
+        # Meant for snapshots, the live tables change while being read
+        def itemsOf(dictInDict: Dict[str, Dict]) -> Tuple:
+            return tuple(sorted(
+                (key, tuple(sorted(value.items())))
+                for key, value in dictInDict.items()))
+
+        processingTime = tuple(sorted(
+            (key,
+             value.processingTime,
+             value.resources.cpu.cores,
+             value.resources.cpu.frequency)
+            for key, value in self.processingTime.items()))
+        return hash((
+            itemsOf(self.dataRate),
+            itemsOf(self.delay),
+            itemsOf(self.latency),
+            itemsOf(self.packetSize),
+            processingTime))
+
     @staticmethod
     def fromDict(inDict: Dict):
         processingTime = {}
@@ -26,11 +26,13 @@ class AcknowledgementHandler:
         if source.role is not ComponentRole.TASK_EXECUTOR:
             return terminateMessage(source)
 
-        nameConsistent = source.nameConsistent
-        if nameConsistent not in self.registry.registeredManager.taskExecutors:
+        # nameConsistent is shared by TaskExecutors of the same task on the
+        # same actor, componentID is not
+        componentID = source.componentID
+        if componentID not in self.registry.registeredManager.taskExecutors:
             return
         taskExecutor: TaskExecutor = \
-            self.registry.registeredManager.taskExecutors[nameConsistent]
+            self.registry.registeredManager.taskExecutors[componentID]
         taskExecutor.ready.set()
 
         userID = taskExecutor.userID
@@ -41,28 +43,28 @@ class AcknowledgementHandler:
             return
         user: User = self.registry.registeredManager.users[userID]
 
-        user.lock.acquire()
-        user.taskNameToExecutor[taskExecutor.task.nameLabeled] = taskExecutor
-        if not len(user.taskNameToExecutor) == len(user.taskNameList):
-            user.lock.release()
-            return
-        for otherExecutor in user.taskNameToExecutor.values():
-            # TODO: Not efficient
-            if not otherExecutor.ready.isSet():
-                user.lock.release()
-                return
-        if user.isReady:
-            user.lock.release()
+        taskNameLabeled = taskExecutor.task.nameLabeled
+        isServiceReady = user.markReady(taskNameLabeled, taskExecutor)
+        self.basicComponent.debugLogger.debug(
+            '%s is ready for %s (%d/%d)',
+            taskNameLabeled,
+            user.nameLogPrinting,
+            user.readyCount,
+            len(user.taskNameList))
+        if not isServiceReady:
             return
-        user.isReady = True
+        timeToServiceReady = user.timeToServiceReady
+        self.registry.timeToServiceReady[
+            user.application.nameWithLabel].update(timeToServiceReady)
         self.basicComponent.sendMessage(
             messageType=MessageType.ACKNOWLEDGEMENT,
             messageSubType=MessageSubType.SERVICE_READY,
-            data={},
+            data={'timeToServiceReady': timeToServiceReady},
             destination=user)
         self.basicComponent.debugLogger.debug(
-            '%s is ready to run. ' % user.nameLogPrinting)
-        user.lock.release()
+            '%s is ready to run, %.3f ms after the first registration',
+            user.nameLogPrinting,
+            timeToServiceReady)
         return
 
     def handleTaskExecutorWaiting(
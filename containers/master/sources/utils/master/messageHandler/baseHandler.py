@@ -52,7 +52,8 @@ class MasterMessageHandler:
             registry=self.registry)
         self.profilingHandler = ProfilingHandler(
             basicComponent=self.basicComponent,
-            profiler=self.profiler)
+            profiler=self.profiler,
+            registry=self.registry)
         self.registrationHandler = RegistrationHandler(
             basicComponent=self.basicComponent,
             registry=self.registry,
@@ -138,6 +139,10 @@ class MasterMessageHandler:
                 messageSubType=MessageSubType.LATENCY_TEST,
                 messageSubSubType=MessageSubSubType.RESULT):
             return self.profilingHandler.handleLatencyResult(message)
+        elif message.typeIs(messageSubType=MessageSubType.INVENTORY_DELTA):
+            return self.profilingHandler.handleInventoryDelta(message)
+        elif message.typeIs(messageSubType=MessageSubType.LINK_ESTIMATES):
+            return self.profilingHandler.handleLinkEstimates(message)
         return
 
     def handleRegistration(self, message: MessageReceived) -> HandlerReturn:
@@ -17,6 +17,7 @@ class PlacementHandler:
         taskExecutor = self.registry.registeredManager.taskExecutors[taskToken]
         data = {
             'taskExecutorAddr': list(taskExecutor.addr),
+            'taskExecutorID': taskExecutor.componentID,
             'taskToken': taskExecutor.task.token}
         self.registry.basicComponent.sendMessage(
             messageType=MessageType.PLACEMENT,
@@ -1,12 +1,14 @@
 from json.decoder import JSONDecodeError
 from threading import Lock
 from time import sleep
+from time import time
 
 from iperf3 import Client as NetProfClient
 from iperf3 import Server as NetProfServer
 from pythonping import ping as testLatency
 
 from ..profiler.base import MasterProfiler
+from ..registry.base import Registry
 from ...component import BasicComponent
 from ...connection import MessageReceived
 from ...types import Component
@@ -19,14 +21,24 @@ class ProfilingHandler:
     def __init__(
             self,
             basicComponent: BasicComponent,
-            profiler: MasterProfiler):
+            profiler: MasterProfiler,
+            registry: Registry):
 
         self.profiler = profiler
+        self.registry = registry
         self.basicComponent = basicComponent
         self.debugLogger = self.basicComponent.debugLogger
         self._runningIperfClient = Lock()
         self._runningIperfServer = Lock()
 
+    def handleInventoryDelta(self, message: MessageReceived):
+        self.registry.updateActorInventory(message)
+
+    def handleLinkEstimates(self, message: MessageReceived):
+        self.profiler.mergeLinkEstimates(
+            hostID=message.source.hostID,
+            linkEstimates=message.data['linkEstimates'])
+
     def handleDataRateReceive(self, message: MessageReceived):
         data = message.data
         sourceAddr = data['sourceAddr']
@@ -59,6 +71,8 @@ class ProfilingHandler:
                 sourceHostID] = {}
         self.profiler.loggerManager.systemPerformance.dataRate[sourceHostID][
             targetHostID] = dataRateResult
+        self.profiler.passiveDataRate.discard((sourceHostID, targetHostID))
+        self.profiler.activeDataRateAt[(sourceHostID, targetHostID)] = time()
         self.profiler.dataRateTestEvents[sourceHostID][targetHostID].set()
         self.debugLogger.info(
             'Received BPS result from %s to %s',
@@ -76,6 +90,8 @@ class ProfilingHandler:
                 sourceHostID] = {}
         self.profiler.loggerManager.systemPerformance.latency[sourceHostID][
             targetHostID] = latencyResult
+        self.profiler.passiveLatency.discard((sourceHostID, targetHostID))
+        self.profiler.activeLatencyAt[(sourceHostID, targetHostID)] = time()
         self.profiler.latencyTestEvents[sourceHostID][targetHostID].set()
         self.debugLogger.info(
             'Received Ping result from %s to %s',
@@ -1,4 +1,9 @@
+from time import time
+from typing import Dict
+from typing import Set
+
 from .dataRate import DataRateProfiler
+from .pairRounds import Pair
 from .resources import ResourcesProfiler
 from ..logger import LoggerManager
 from ..registry.roles import Actor
@@ -28,3 +33,39 @@ class MasterProfiler(DataRateProfiler):
         self.loggerManager.mergeRunningContainers(toMerge)
         actorResourcesToMerge = {nameConsistent: actor.actorResources}
         self.loggerManager.mergeResources(actorResourcesToMerge)
+
+    def mergeLinkEstimates(self, hostID: str, linkEstimates: Dict):
+        # Estimates measured on hostID from the messages it exchanged. They
+        # fill the pairs that have not been profiled actively within the
+        # window the estimates are taken over
+        systemPerformance = self.loggerManager.systemPerformance
+        for sourceHostID, dataRate in linkEstimates['dataRate'].items():
+            self.mergePassive(
+                systemPerformance.dataRate, self.passiveDataRate,
+                self.activeDataRateAt, sourceHostID, hostID, dataRate)
+        for targetHostID, latency in linkEstimates['latency'].items():
+            self.mergePassive(
+                systemPerformance.latency, self.passiveLatency,
+                self.activeLatencyAt, hostID, targetHostID, latency)
+
+    def mergePassive(
+            self,
+            values: Dict[str, Dict[str, float]],
+            passivePairs: Set[Pair],
+            activeAt: Dict[Pair, float],
+            sourceHostID: str,
+            targetHostID: str,
+            value: float):
+        if sourceHostID == targetHostID:
+            return
+        pair = (sourceHostID, targetHostID)
+        if sourceHostID not in values:
+            values[sourceHostID] = {}
+        # Values retrieved from the logs have no time and count as old
+        if targetHostID in values[sourceHostID] \
+                and pair not in passivePairs \
+                and time() - activeAt.get(pair, 0) <= self.activeWindow:
+            return
+        values[sourceHostID][targetHostID] = value
+        passivePairs.add(pair)
+        activeAt.pop(pair, None)
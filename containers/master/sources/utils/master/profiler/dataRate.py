@@ -1,8 +1,14 @@
 from collections import defaultdict
 from threading import Event
 from time import sleep
+from time import time
 from typing import DefaultDict
+from typing import Dict
+from typing import List
+from typing import Set
 
+from .pairRounds import Pair
+from .pairRounds import pairRounds
 from ..logger import LoggerManager
 from ..registry.registered.actors import RegisteredActors
 from ...component import BasicComponent
@@ -18,7 +24,9 @@ class DataRateProfiler:
             self,
             basicComponent: BasicComponent,
             loggerManager: LoggerManager,
-            minActors: int):
+            minActors: int,
+            pairTimeout: float = 60,
+            activeWindow: float = 60):
         self.basicComponent = basicComponent
         self.loggerManager = loggerManager
         self.minHosts = minActors
@@ -31,6 +39,19 @@ class DataRateProfiler:
         self.dataRateTestEvent: Event = Event()
         self.gotEnoughActors: Event = Event()
         self.registeredActors = None
+        # Seconds a round waits for the results of its pairs
+        self.pairTimeout = pairTimeout
+        # Pairs whose value was only estimated from live traffic. Active
+        # results replace them and they do not count as profiled
+        self.passiveDataRate: Set[Pair] = set()
+        self.passiveLatency: Set[Pair] = set()
+        # When the active result of each pair was received. Estimates from
+        # live traffic replace the ones older than activeWindow seconds, the
+        # window of the LinkEstimator, so a link that changed is followed
+        # and profiled again in the next round
+        self.activeWindow = activeWindow
+        self.activeDataRateAt: Dict[Pair, float] = {}
+        self.activeLatencyAt: Dict[Pair, float] = {}
 
     def periodicallyProfileDataRate(self):
         self.gotEnoughActors.wait()
@@ -49,31 +70,57 @@ class DataRateProfiler:
         components.append(self.basicComponent.master)
         self.basicComponent.debugLogger.info(
             '%d hosts connected, begin network profiling', self.minHosts)
-        count = 1
-        total = len(components) * len(components)
-        for source in components:
-            for target in components:
-                sleep(1)
-                self.basicComponent.debugLogger.debug('%d/%d', count, total)
-                count += 1
-                sourceHostID = source.hostID
-                targetHostID = target.hostID
-                if targetHostID == sourceHostID:
-                    continue
-                if sourceHostID in \
-                        self.loggerManager.systemPerformance.dataRate:
-                    if targetHostID in \
-                            self.loggerManager.systemPerformance.dataRate[
-                                sourceHostID]:
-                        continue
+        hostIDs = []
+        for component in components:
+            if component.hostID in hostIDs:
+                continue
+            hostIDs.append(component.hostID)
+        rounds = pairRounds(hostIDs)
+        for i, pairs in enumerate(rounds):
+            pairs = [
+                (sourceHostID, targetHostID)
+                for sourceHostID, targetHostID in pairs
+                if not self.isProfiled(sourceHostID, targetHostID)]
+            # No host is in two pairs of a round, so they run together
+            for sourceHostID, targetHostID in pairs:
                 self.runDataRateTest(
                     registeredActors, sourceHostID, targetHostID)
-                self.latencyTestEvents[sourceHostID][targetHostID].wait()
-                self.dataRateTestEvents[sourceHostID][targetHostID].wait()
+            finished = self.waitForPairs(pairs)
+            self.basicComponent.debugLogger.debug(
+                'Network profiling round %d/%d: %d/%d pairs finished',
+                i + 1, len(rounds), finished, len(pairs))
         self.dataRateTestEvent.set()
         self.basicComponent.debugLogger.info(
             'Finished profiling data rate and latency.')
 
+    def isProfiled(self, sourceHostID: str, targetHostID: str) -> bool:
+        dataRate = self.loggerManager.systemPerformance.dataRate
+        if sourceHostID not in dataRate:
+            return False
+        if (sourceHostID, targetHostID) in self.passiveDataRate:
+            return False
+        return targetHostID in dataRate[sourceHostID]
+
+    def waitForPairs(self, pairs: List[Pair]) -> int:
+        deadline = time() + self.pairTimeout
+        finished = 0
+        for sourceHostID, targetHostID in pairs:
+            events = [
+                self.latencyTestEvents[sourceHostID][targetHostID],
+                self.dataRateTestEvents[sourceHostID][targetHostID]]
+            isFinished = True
+            for event in events:
+                if not event.wait(max(deadline - time(), 0)):
+                    isFinished = False
+            if isFinished:
+                finished += 1
+                continue
+            # A late result is still recorded when it arrives
+            self.basicComponent.debugLogger.warning(
+                'Network profiling from %s to %s timed out',
+                sourceHostID, targetHostID)
+        return finished
+
     def getHosts(self, registeredActors: RegisteredActors):
         hosts = {self.basicComponent.hostID}
         for actor in registeredActors.copyAll():
@@ -0,0 +1,31 @@
+from typing import List
+from typing import Tuple
+
+Pair = Tuple[str, str]
+
+
+def pairRounds(hostIDs: List[str]) -> List[List[Pair]]:
+    # Edge colouring of the complete graph with the circle method: every
+    # round pairs each host with at most one other host, so all tests of a
+    # round can run at the same time. Each direction gets its own round
+    hosts = list(hostIDs)
+    if len(hosts) < 2:
+        return []
+    if len(hosts) % 2:
+        hosts.append(None)
+    count = len(hosts)
+    rounds = []
+    for _ in range(count - 1):
+        pairs = []
+        for i in range(count // 2):
+            source = hosts[i]
+            target = hosts[count - 1 - i]
+            if source is None or target is None:
+                continue
+            pairs.append((source, target))
+        rounds.append(pairs)
+        # Keep the first host in place and rotate the others
+        hosts = [hosts[0], hosts[-1]] + hosts[1:-1]
+    reversedRounds = [
+        [(target, source) for source, target in pairs] for pairs in rounds]
+    return rounds + reversedRounds
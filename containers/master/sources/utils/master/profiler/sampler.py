@@ -0,0 +1,136 @@
+import threading
+from threading import Lock
+from time import sleep
+from time import time
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from psutil import cpu_percent as cpuPercent
+from psutil import virtual_memory as virtualMemory
+
+
+# Fixed-size ring buffer of utilization samples with an EWMA kept on insert.
+# Windows are in seconds and cover the newest samples only
+class SampleWindow:
+
+    def __init__(self, capacity: int = 300, alpha: float = .3):
+        self.capacity = capacity
+        self.alpha = alpha
+        self.values: List[float] = [.0] * capacity
+        self.timestamps: List[float] = [.0] * capacity
+        self.count = 0
+        self.next = 0
+        self.ewma = .0
+        self.lock: Lock = Lock()
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value: float, timestamp: float = None):
+        if timestamp is None:
+            timestamp = time()
+        self.lock.acquire()
+        self.values[self.next] = value
+        self.timestamps[self.next] = timestamp
+        self.next = (self.next + 1) % self.capacity
+        if self.count == 0:
+            self.ewma = value
+        else:
+            self.ewma += self.alpha * (value - self.ewma)
+        self.count = min(self.count + 1, self.capacity)
+        self.lock.release()
+
+    @property
+    def current(self) -> float:
+        if not self.count:
+            return .0
+        return self.values[self.next - 1]
+
+    def window(self, seconds: float = None, now: float = None) -> List[float]:
+        if now is None:
+            now = time()
+        self.lock.acquire()
+        samples = []
+        for i in range(1, self.count + 1):
+            index = self.next - i
+            if seconds is not None and now - self.timestamps[index] > seconds:
+                break
+            samples.append(self.values[index])
+        self.lock.release()
+        return samples
+
+    def peak(self, seconds: float = None) -> float:
+        samples = self.window(seconds)
+        if not len(samples):
+            return self.current
+        return max(samples)
+
+    def percentile(self, percent: float, seconds: float = None) -> float:
+        samples = sorted(self.window(seconds))
+        if not len(samples):
+            return self.current
+        rank = round(percent / 100 * (len(samples) - 1))
+        return samples[rank]
+
+
+# Samples CPU and memory utilization on a background thread so readers never
+# wait for psutil.cpu_percent to measure an interval
+class UtilizationSampler:
+
+    def __init__(
+            self,
+            interval: float = 1.,
+            capacity: int = 300,
+            alpha: float = .3,
+            readCPU: Callable[[], float] = None,
+            readMemory: Callable[[], float] = None):
+        self.interval = interval
+        self.cpu = SampleWindow(capacity=capacity, alpha=alpha)
+        self.memory = SampleWindow(capacity=capacity, alpha=alpha)
+        if readCPU is None:
+            readCPU = self.readCPU
+        if readMemory is None:
+            readMemory = self.readMemory
+        self._readCPU = readCPU
+        self._readMemory = readMemory
+        self.thread: Optional[threading.Thread] = None
+        self.startLock: Lock = Lock()
+
+    @staticmethod
+    def readCPU() -> float:
+        # Utilization since the previous call, does not block
+        return cpuPercent(interval=None) / 100
+
+    @staticmethod
+    def readMemory() -> float:
+        vMem = virtualMemory()
+        return vMem.used / vMem.total
+
+    def start(self):
+        self.startLock.acquire()
+        if self.thread is None:
+            # The first cpu_percent call only sets the reference point
+            self._readCPU()
+            self.thread = threading.Thread(
+                target=self.run,
+                name='UtilizationSampler',
+                daemon=True)
+            self.thread.start()
+        self.startLock.release()
+
+    def run(self):
+        while True:
+            sleep(self.interval)
+            self.sample()
+
+    def sample(self):
+        now = time()
+        self.cpu.add(self._readCPU(), now)
+        self.memory.add(self._readMemory(), now)
+
+    def ensureSampled(self):
+        # Someone asked before the first interval passed
+        if len(self.cpu):
+            return
+        self.sample()
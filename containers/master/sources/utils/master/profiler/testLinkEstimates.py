@@ -0,0 +1,74 @@
+import unittest
+from time import time
+from types import SimpleNamespace
+
+from .base import MasterProfiler
+from .dataRate import DataRateProfiler
+
+
+class Profiler(MasterProfiler):
+
+    def __init__(self):
+        # Without the ResourcesProfiler of the Master
+        DataRateProfiler.__init__(
+            self,
+            basicComponent=None,
+            loggerManager=SimpleNamespace(
+                systemPerformance=SimpleNamespace(dataRate={}, latency={})),
+            minActors=1,
+            activeWindow=60)
+
+    @property
+    def dataRate(self):
+        return self.loggerManager.systemPerformance.dataRate
+
+    def receiveActive(self, sourceHostID, targetHostID, dataRate, at=None):
+        # As ProfilingHandler.handleDataRateResult records a result
+        pair = (sourceHostID, targetHostID)
+        if sourceHostID not in self.dataRate:
+            self.dataRate[sourceHostID] = {}
+        self.dataRate[sourceHostID][targetHostID] = dataRate
+        self.passiveDataRate.discard(pair)
+        self.activeDataRateAt[pair] = time() if at is None else at
+
+
+def linkEstimates(sourceHostID: str, dataRate: float):
+    return {'dataRate': {sourceHostID: dataRate}, 'latency': {}}
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testPassiveBeforeActive(self):
+        profiler = Profiler()
+        profiler.mergeLinkEstimates('b', linkEstimates('a', 1000))
+        self.assertEqual(1000, profiler.dataRate['a']['b'])
+        self.assertFalse(profiler.isProfiled('a', 'b'))
+        profiler.receiveActive('a', 'b', 2000)
+        self.assertTrue(profiler.isProfiled('a', 'b'))
+        # The fresh active result is kept
+        profiler.mergeLinkEstimates('b', linkEstimates('a', 1000))
+        self.assertEqual(2000, profiler.dataRate['a']['b'])
+        self.assertTrue(profiler.isProfiled('a', 'b'))
+
+    def testPassiveAfterActive(self):
+        profiler = Profiler()
+        profiler.receiveActive('a', 'b', 2000, at=time() - 120)
+        profiler.mergeLinkEstimates('b', linkEstimates('a', 500))
+        # The active result is older than the window
+        self.assertEqual(500, profiler.dataRate['a']['b'])
+        self.assertFalse(profiler.isProfiled('a', 'b'))
+        self.assertNotIn(('a', 'b'), profiler.activeDataRateAt)
+        profiler.mergeLinkEstimates('b', linkEstimates('a', 400))
+        self.assertEqual(400, profiler.dataRate['a']['b'])
+
+    def testRetrievedValueReplaced(self):
+        profiler = Profiler()
+        profiler.dataRate['a'] = {'b': 2000}
+        self.assertTrue(profiler.isProfiled('a', 'b'))
+        profiler.mergeLinkEstimates('b', linkEstimates('a', 500))
+        self.assertEqual(500, profiler.dataRate['a']['b'])
+        self.assertFalse(profiler.isProfiled('a', 'b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from .pairRounds import pairRounds
+
+
+class MyTestCase(unittest.TestCase):
+
+    def assertFullMesh(self, hostIDs):
+        rounds = pairRounds(hostIDs)
+        pairs = [pair for pairsInRound in rounds for pair in pairsInRound]
+        expected = {
+            (source, target)
+            for source in hostIDs
+            for target in hostIDs
+            if source != target}
+        self.assertEqual(len(expected), len(pairs))
+        self.assertEqual(expected, set(pairs))
+        for pairsInRound in rounds:
+            hosts = [host for pair in pairsInRound for host in pair]
+            self.assertEqual(len(hosts), len(set(hosts)))
+        return rounds
+
+    def testEvenHosts(self):
+        rounds = self.assertFullMesh(['a', 'b', 'c', 'd'])
+        self.assertEqual(6, len(rounds))
+
+    def testOddHosts(self):
+        rounds = self.assertFullMesh(['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(10, len(rounds))
+
+    def testLinearRounds(self):
+        hostIDs = [str(i) for i in range(10)]
+        rounds = self.assertFullMesh(hostIDs)
+        self.assertEqual(2 * (len(hostIDs) - 1), len(rounds))
+
+    def testSingleHost(self):
+        self.assertEqual([], pairRounds(['a']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,16 +1,20 @@
 from abc import ABC
 from collections import defaultdict
-from pprint import pformat
 from queue import Queue
 from threading import Lock
 from threading import Thread
-from time import sleep
+from time import time
 from traceback import print_exc
 from typing import DefaultDict
 from typing import Dict
 from typing import List
+from typing import Tuple
+from typing import Union
 
 from .idManager import IDManager
+from .placement import CapacityLedger
+from .placement import PlacementTracker
+from .placement import TaskPlacement
 from .registered import RegisteredManager
 from .roles import Actor
 from .roles import TaskExecutor
@@ -26,13 +30,15 @@ from ..messageHandler.tools.waitMessage import waitMessage
 from ..profiler.base import MasterProfiler
 from ..profiler.decisions import Decisions
 from ..scheduler.base import BaseScheduler
-from ..scheduler.policies.nsga.base import BaseNSGA
+from ..scheduler.estimator import Estimator
 from ..scheduler.types import Decision
 from ...component import BasicComponent
 from ...connection.message.received import MessageReceived
 from ...connection.message.toSend import MessageToSend
 from ...types import Component
 from ...types import ComponentRole
+from ...types import PairsMedian
+from ...types import SequenceMedian
 from ...types import SynchronizedAttribute
 from ...types.hostProfiles import ActorResources
 from ...types.message.subType import MessageSubType
@@ -70,6 +76,17 @@ class Registry(ABC):
         self.requestQueue = Queue()
         self.scheduleLock = Lock()
         self.waitTimeout = waitTimeout
+        self.placementTracker = PlacementTracker(
+            onOverdue=self.retryPlacement)
+        self.capacityLedger = CapacityLedger()
+        # Application name -> ms from first registration to SERVICE_READY
+        self.timeToServiceReady: PairsMedian[str, SequenceMedian] = \
+            PairsMedian()
+        # Actor nameConsistent -> method -> ms from the request to the
+        # registration of a TaskExecutor, uploaded next to the launch phases
+        # the Actor measures
+        self.launchTimes: DefaultDict[str, PairsMedian] = \
+            defaultdict(PairsMedian)
 
     def registerClient(self, message: MessageReceived):
         source = message.source
@@ -86,7 +103,13 @@ class Registry(ABC):
             self, message, attributeName='registeredActor')
 
     def registerUser(self, message: MessageReceived):
-        return self._registerUser(self, message, attributeName='registeredUser')
+        user = self._registerUser(
+            self, message, attributeName='registeredUser')
+        if user is None:
+            return None
+        # Outside of the registration lock, so that users who arrive
+        # together are scheduled at the same time
+        return self.scheduleUser(user)
 
     def registerTaskExecutor(self, message: MessageReceived):
         return self._registerTaskExecutor(
@@ -133,6 +156,7 @@ class Registry(ABC):
             hostID=source.hostID,
             actorResources=actorResources)
         self.registeredManager.actors[actor] = actor
+        self.scheduler.candidateIndex.updateActor(actor)
         self.profiler.updateActorResources(actor)
         data = {
             'actorID': actorID,
@@ -148,6 +172,26 @@ class Registry(ABC):
             'Registered: %s', nameLogPrinting)
         return messageToRespond
 
+    def updateActorInventory(self, message: MessageReceived):
+        source = message.source
+        if source.componentID not in self.registeredManager.actors:
+            return
+        actor = self.registeredManager.actors[source.componentID]
+        delta = message.data['inventoryDelta']
+        resources = actor.actorResources
+        # Schedulers iterate these sets in other threads, so new sets are
+        # assigned instead of changing them in place
+        resources.images = resources.images.difference(
+            delta['imagesRemoved']).union(delta['imagesAdded'])
+        resources.runningContainers = resources.runningContainers.difference(
+            delta['containersRemoved']).union(delta['containersAdded'])
+        containerStats = delta.get('containerStats', resources.containerStats)
+        resources.containerStats = {
+            name: stats for name, stats in containerStats.items()
+            if name in resources.runningContainers}
+        self.scheduler.candidateIndex.updateActor(actor)
+        self.profiler.updateActorResources(actor)
+
     @SynchronizedAttribute
     def _registerUser(
             self, message: MessageReceived, attributeName='registeredUser'):
@@ -160,6 +204,9 @@ class Registry(ABC):
             return None
         application = self.applicationManager.applications[applicationName]
         applicationCopy: Application = application.copy(withLabel=label)
+        schedulingBudget = 0
+        if 'schedulingBudget' in data:
+            schedulingBudget = data['schedulingBudget']
         name, nameLogPrinting, nameConsistent = self.nameFactory.nameUser(
             source, userID, applicationCopy)
         user = User(
@@ -169,8 +216,14 @@ class Registry(ABC):
             addr=source.addr,
             componentID=userID,
             hostID=source.hostID,
-            application=applicationCopy)
+            application=applicationCopy,
+            schedulingBudget=schedulingBudget)
         self.registeredManager.users[user] = user
+        return user
+
+    def scheduleUser(self, user: User):
+        # Sampling runs in the background, reading it is cheap
+        self.profiler.me.profileResources()
         try:
             schedulingSuccess = self.scheduler.schedule(
                 user=user,
@@ -181,12 +234,8 @@ class Registry(ABC):
                 decisionsQueue=self.decisionsQueue)
             if not schedulingSuccess:
                 return
-            self.checkTaskExecutorForUser(user=user)
         except Exception as e:
             print_exc()
-            if isinstance(self.scheduler, BaseNSGA):
-                self.scheduler.lock.release()
-                self.scheduler.leaveWaiting()
             return terminateMessage(component=user, reason=str(e))
 
     @SynchronizedAttribute
@@ -194,11 +243,21 @@ class Registry(ABC):
                               attributeName='registeredTaskExecutor'):
         data = message.data
         source = message.source
+        if data.get('isWarm', False):
+            return self.registerWarmTaskExecutor(message)
         taskExecutorID = self.idManager.taskExecutor.next()
 
         userID = data['userID']
         actorID = data['actorID']
 
+        # A warm TaskExecutor re-registers for the user it is bound to
+        if source.componentID in self.registeredManager.taskExecutors:
+            previous = self.registeredManager.taskExecutors[
+                source.componentID]
+            if previous.isWarm:
+                self.registeredManager.removeWarmTaskExecutor(previous)
+                del self.registeredManager.taskExecutors[source.componentID]
+
         if userID not in self.registeredManager.users:
             return terminateMessage(source, 'Invalid userID')
         user: User = self.registeredManager.users[userID]
@@ -219,6 +278,15 @@ class Registry(ABC):
             taskToken=taskToken)
         if not claimSuccess:
             return terminateMessage(source, 'This Task does not belong to you')
+        user.markRegistered()
+        placement = self.placementTracker.registered(taskToken)
+        if placement is not None:
+            self.launchTimes[actor.nameConsistent][placement.method].update(
+                placement.startupTime * 1000)
+            self.basicComponent.debugLogger.debug(
+                'Took %.3f s to start %s on %s',
+                placement.startupTime, taskLabeled.nameLabeled,
+                actor.nameLogPrinting)
 
         name, nameLogPrinting, nameConsistent = \
             self.nameFactory.nameTaskExecutor(
@@ -249,6 +317,88 @@ class Registry(ABC):
             destination=source)
         self.basicComponent.debugLogger.debug(
             'Registered: %s ', nameLogPrinting)
+        self.pushChildrenAddresses(user=user, taskExecutor=taskExecutor)
+
+    def pushChildrenAddresses(self, user: User, taskExecutor: TaskExecutor):
+        taskExecutors = self.registeredManager.taskExecutors
+        taskToken = taskExecutor.task.token
+        user.lock.acquire()
+        childrenTaskTokens = list(user.taskTokenToChildren.get(taskToken, []))
+        parentTaskTokens = list(user.taskTokenToParents.get(taskToken, []))
+        user.lock.release()
+
+        # Children registered before this TaskExecutor
+        children = [
+            self.childAddress(taskExecutors[childTaskToken])
+            for childTaskToken in childrenTaskTokens
+            if childTaskToken in taskExecutors]
+        if len(children):
+            self.sendChildrenAddresses(taskExecutor, children)
+
+        # Parents registered before this TaskExecutor
+        child = [self.childAddress(taskExecutor)]
+        for parentTaskToken in parentTaskTokens:
+            if parentTaskToken not in taskExecutors:
+                continue
+            self.sendChildrenAddresses(taskExecutors[parentTaskToken], child)
+
+    @staticmethod
+    def childAddress(taskExecutor: TaskExecutor) -> Dict:
+        return {
+            'taskToken': taskExecutor.task.token,
+            'taskExecutorAddr': list(taskExecutor.addr),
+            'taskExecutorID': taskExecutor.componentID}
+
+    def sendChildrenAddresses(
+            self, taskExecutor: TaskExecutor, children: List[Dict]):
+        self.basicComponent.sendMessage(
+            messageType=MessageType.PLACEMENT,
+            messageSubType=MessageSubType.CHILDREN_ADDRESSES,
+            data={'children': children},
+            destination=taskExecutor)
+
+    def registerWarmTaskExecutor(self, message: MessageReceived):
+        data = message.data
+        source = message.source
+        actorID = data['actorID']
+        if actorID not in self.registeredManager.actors:
+            return terminateMessage(source, 'Invalid actorID')
+        actor = self.registeredManager.actors[actorID]
+        taskExecutorID = self.idManager.taskExecutor.next()
+        # Warm TaskExecutors have no task token until they are bound
+        task = TaskLabeled(
+            name=data['taskName'],
+            token='Warm-%s' % taskExecutorID)
+        name, nameLogPrinting, nameConsistent = \
+            self.nameFactory.nameWarmTaskExecutor(
+                source, taskExecutorID, task, actor)
+        taskExecutor = TaskExecutor(
+            actorID=actorID,
+            userID='',
+            task=task,
+            addr=source.addr,
+            componentID=taskExecutorID,
+            name=name,
+            nameLogPrinting=nameLogPrinting,
+            nameConsistent=nameConsistent,
+            hostID=actor.hostID,
+            waitTimeout=self.waitTimeout,
+            isWarm=True)
+        self.registeredManager.taskExecutors[taskExecutor] = taskExecutor
+        self.registeredManager.addWarmTaskExecutor(taskExecutor)
+        data = {
+            'taskExecutorID': taskExecutorID,
+            'name': taskExecutor.name,
+            'nameLogPrinting': taskExecutor.nameLogPrinting,
+            'nameConsistent': taskExecutor.nameConsistent,
+            'actorHostID': actor.hostID}
+        self.basicComponent.sendMessage(
+            messageType=MessageType.REGISTRATION,
+            messageSubType=MessageSubType.REGISTERED,
+            data=data,
+            destination=source)
+        self.basicComponent.debugLogger.debug(
+            'Registered warm: %s ', nameLogPrinting)
 
     @SynchronizedAttribute
     def _deregisterActor(
@@ -259,6 +409,7 @@ class Registry(ABC):
         del self.registeredManager.actors[source.componentID]
         del self.registeredManager.actors[source.hostID]
         del self.registeredManager.actors[source.addr[0]]
+        self.scheduler.candidateIndex.removeActor(source.hostID)
 
     @SynchronizedAttribute
     def _deregisterUser(
@@ -267,6 +418,7 @@ class Registry(ABC):
         if source.componentID not in self.registeredManager.users:
             return terminateMessage(source, reason='Not registered')
         user = self.registeredManager.users[source.componentID]
+        self.placementTracker.forgetUser(user)
         for taskExecutor in user.taskNameToExecutor.values():
             if taskExecutor.waitTimeout <= 0:
                 continue
@@ -282,6 +434,10 @@ class Registry(ABC):
         if source.componentID not in self.registeredManager.taskExecutors:
             return terminateMessage(source, reason='Not registered')
         taskExecutor = self.registeredManager.taskExecutors[source.componentID]
+        registeredManager = self.registeredManager
+        if taskExecutor.isWarm \
+                and registeredManager.removeWarmTaskExecutor(taskExecutor):
+            self.sendWarmTaskExecutorExitedMsg(taskExecutor)
         if taskExecutor.userID not in self.registeredManager.users:
             del self.registeredManager.taskExecutors[source.componentID]
             return terminateMessage(source, reason='Deregister')
@@ -289,30 +445,20 @@ class Registry(ABC):
         self._deregisterUser(self, source=user, attributeName='registeredUser')
         return terminateMessage(source, reason='Deregister')
 
-    def checkTaskExecutorForUser(self, user: User):
-        Thread(
-            target=self._checkTaskExecutorForUser,
-            args=(user,),
-            name='ResourcesPlacement-%s' % user.nameLogPrinting).start()
-
-    def _checkTaskExecutorForUser(self, user: User):
-        totalTaskCount = len(user.taskNameList)
-        while True:
-            sleep(15)
-            if user.componentID not in self.registeredManager.users:
-                break
-            unclaimedTaskCount = user.countUnclaimedTask()
-            if unclaimedTaskCount == 0:
-                break
-
+    def retryPlacement(self, placement: TaskPlacement):
+        user = placement.user
+        if user.componentID not in self.registeredManager.users:
+            self.placementTracker.forgetUser(user)
+            return
+        user.lock.acquire()
+        if placement.compactedKey in user.unclaimedTasks:
             self.debugLogger.debug(
-                '%s resources: %d/%d -> %s',
+                'Retry placing %s for %s, attempt %d',
+                placement.taskNameLabeled,
                 user.nameLogPrinting,
-                unclaimedTaskCount - unclaimedTaskCount,
-                totalTaskCount,
-                pformat(user.unclaimedTasks))
-
-            self.resourcePlace(user=user)
+                placement.attempts + 1)
+            self.placeTask(user=user, compactedKey=placement.compactedKey)
+        user.lock.release()
 
     def decisionHandlerThreadPool(self):
         Thread(target=self.handleDecision, name='DecisionHandler').start()
@@ -321,7 +467,9 @@ class Registry(ABC):
         while True:
             decision = self.decisionsQueue.get()
             self.printDecision(decision)
-            hostIDSequence = decision.hostIDSequence()
+            hostIDSequence = self.reconcileDecision(decision)
+            if hostIDSequence is None:
+                continue
             user = decision.user
             for i, hostID in enumerate(hostIDSequence):
                 actor = self.registeredManager.actors[hostID]
@@ -336,6 +484,60 @@ class Registry(ABC):
                     childrenTaskTokens=childrenTaskTokens)
             self.resourcePlace(user=user)
 
+    def reconcileDecision(self, decision: Decision) -> Union[List[str], None]:
+        # Decisions are searched concurrently over snapshots, so the hosts
+        # they picked may have left or been filled by other decisions since
+        # then. Hosts no other decision committed to after the snapshot are
+        # kept as the scheduler picked them
+        actors = self.registeredManager.actors
+        user = decision.user
+        if user.componentID not in self.registeredManager.users:
+            # Left while being scheduled
+            return None
+        ledger = self.capacityLedger
+        owner = user.componentID
+        since = decision.snapshotAt
+        taskList = list(user.application.tasksWithDependency.keys())
+        hostIDSequence = decision.hostIDSequence()
+        now = time()
+        for i, hostID in enumerate(hostIDSequence):
+            if hostID in actors and (
+                    not ledger.isContended(hostID, now, since, owner)
+                    or ledger.hasRoom(actors[hostID], now, since, owner)):
+                ledger.commit(hostID, now, owner)
+                continue
+            candidates = [
+                actor for actor in actors.copyAll()
+                if not self.scheduler.isContainerMode
+                or Estimator.hasImage(actor, taskList[i])]
+            actor = ledger.leastUtilized(
+                candidates, now, since=since, excluding=owner)
+            if actor is None and hostID not in actors:
+                actor = ledger.leastUtilized(
+                    candidates, now, needsRoom=False, since=since,
+                    excluding=owner)
+            if actor is None:
+                if hostID not in actors:
+                    self.debugLogger.warning(
+                        'No %s left to run %s for %s',
+                        ComponentRole.ACTOR.value,
+                        taskList[i],
+                        user.nameLogPrinting)
+                    return None
+                # Nothing better, keep the scheduled host
+                ledger.commit(hostID, now, owner)
+                continue
+            self.debugLogger.debug(
+                'Moved %s of %s from %s to %s',
+                taskList[i],
+                user.nameLogPrinting,
+                hostID,
+                actor.hostID)
+            hostIDSequence[i] = actor.hostID
+            # Counted against the rest of this decision too
+            ledger.commit(actor.hostID, now)
+        return hostIDSequence
+
     def printDecision(self, decision: Decision):
         evaluationRecord = decision.evaluationRecord
         evaluationRecord = [round(record, 2) for record in evaluationRecord]
@@ -343,18 +545,57 @@ class Registry(ABC):
         if logLevel != 20:
             records = '\n    EvaluationRecords:\n' \
                       '        %s' % str(evaluationRecord)
+            savedEvaluationRecord = decision.savedEvaluationRecord
+            if len(savedEvaluationRecord):
+                records += '\n    SavedEvaluationRecords (%d in total):\n' \
+                           '        %s' % (
+                               sum(savedEvaluationRecord),
+                               str(savedEvaluationRecord))
         else:
             records = ''
+        decisionCache = self.scheduler.decisionCache
+        if decisionCache is None:
+            cacheSummary = ''
+        else:
+            metrics = decisionCache.metrics()
+            cacheSummary = \
+                '    %s Decision cache: %s, hit ratio %.2f ' \
+                '(%d hits, %d misses, %d invalidated, %d expired), ' \
+                'mean hit age %.1f s\n' % (
+                    self.scheduler.name,
+                    'hit' if decision.isCached else 'miss',
+                    metrics['hitRatio'],
+                    metrics['hits'],
+                    metrics['misses'],
+                    metrics['invalidations'],
+                    metrics['expirations'],
+                    metrics['meanHitAge'])
+        fitnessCache = self.scheduler.fitnessCache
+        if fitnessCache is not None:
+            metrics = fitnessCache.metrics()
+            cacheSummary += \
+                '    %s Fitness cache: hit ratio %.2f ' \
+                '(%d hits, %d misses), %d entries\n' % (
+                    self.scheduler.name,
+                    metrics['hitRatio'],
+                    metrics['hits'],
+                    metrics['misses'],
+                    metrics['entries'])
         self.basicComponent.debugLogger.info(
             '\n========== Scheduling Summary ==========\n'
+            '    %s Queueing time: %f ms\n'
             '    %s Scheduling used time: %f ms\n'
+            '%s'
             '    %s Estimated:\n'
             '         ResponseTime for %s: %f ms\n'
             '    Details:\n'
             '%s%s'
             '\n========================================',
             self.scheduler.name,
+            decision.queueingTime,
+            self.scheduler.name,
             decision.schedulingTime,
+            cacheSummary,
             self.scheduler.name,
             decision.user.application.nameWithLabel,
             decision.cost,
@@ -380,29 +621,63 @@ class Registry(ABC):
         return childrenTaskTokens
 
     def resourcePlace(self, user: User):
+        # hostID -> TaskExecutors to start on that actor
+        manifests: Dict[str, List[Dict]] = {}
         user.lock.acquire()
         for compactedKey in user.unclaimedTasks:
-            hostID, taskNameLabeled, taskToken = compactedKey
-            coolTaskExecutors = self.registeredManager.coolTaskExecutors
-            childrenTaskTokens = user.unclaimedTasks[compactedKey]
-
-            if hostID in coolTaskExecutors:
-                if taskNameLabeled in coolTaskExecutors[hostID]:
-                    if len(coolTaskExecutors[hostID][taskNameLabeled]):
-                        self.sendReuseTaskExecutorMsg(
-                            hostID=hostID,
-                            user=user,
-                            taskNameLabeled=taskNameLabeled,
-                            taskToken=taskToken,
-                            childrenTaskTokens=childrenTaskTokens)
-                        continue
-            self.sendInitTaskExecutorMsg(
-                hostID=hostID,
+            self.placeTask(
+                user=user, compactedKey=compactedKey, manifests=manifests)
+        for hostID, tasks in manifests.items():
+            self.sendInitTaskExecutorsMsg(hostID=hostID, user=user, tasks=tasks)
+        user.lock.release()
+
+    def placeTask(
+            self,
+            user: User,
+            compactedKey: Tuple[str, str, str],
+            manifests: Dict[str, List[Dict]] = None):
+        # Caller holds user.lock. TaskExecutors to start are added to
+        # manifests when given, otherwise requested right away
+        hostID, taskNameLabeled, taskToken = compactedKey
+        coolTaskExecutors = self.registeredManager.coolTaskExecutors
+        childrenTaskTokens = user.unclaimedTasks[compactedKey]
+
+        if hostID in coolTaskExecutors:
+            if taskNameLabeled in coolTaskExecutors[hostID]:
+                if len(coolTaskExecutors[hostID][taskNameLabeled]):
+                    self.sendReuseTaskExecutorMsg(
+                        hostID=hostID,
+                        user=user,
+                        taskNameLabeled=taskNameLabeled,
+                        taskToken=taskToken,
+                        childrenTaskTokens=childrenTaskTokens)
+                    self.placementTracker.requested(
+                        user, compactedKey, method='reuse')
+                    return
+        taskName = taskNameLabeled.split('-')[0]
+        warmTaskExecutor = self.registeredManager.popWarmTaskExecutor(
+            hostID=hostID, taskName=taskName)
+        if warmTaskExecutor is not None:
+            self.sendBindWarmTaskExecutorMsg(
+                taskExecutor=warmTaskExecutor,
                 user=user,
-                taskNameLabeled=taskNameLabeled,
                 taskToken=taskToken,
                 childrenTaskTokens=childrenTaskTokens)
-        user.lock.release()
+            self.placementTracker.requested(
+                user, compactedKey, method='reuse')
+            return
+        task = {
+            'taskName': taskNameLabeled,
+            'taskToken': taskToken,
+            'childrenTaskTokens': childrenTaskTokens}
+        if manifests is None:
+            self.sendInitTaskExecutorsMsg(
+                hostID=hostID, user=user, tasks=[task])
+        else:
+            if hostID not in manifests:
+                manifests[hostID] = []
+            manifests[hostID].append(task)
+        self.placementTracker.requested(user, compactedKey, method='init')
 
     def sendReuseTaskExecutorMsg(
             self,
@@ -428,21 +703,56 @@ class Registry(ABC):
         self.basicComponent.debugLogger.debug(
             'Reuse %s', taskExecutor.nameLogPrinting)
 
-    def sendInitTaskExecutorMsg(
+    def sendBindWarmTaskExecutorMsg(
             self,
-            hostID: str,
+            taskExecutor: TaskExecutor,
             user: User,
-            taskNameLabeled: str,
             taskToken: str,
             childrenTaskTokens: List[str]):
+        data = {
+            'taskName': taskExecutor.task.name,
+            'taskToken': taskToken,
+            'userID': user.componentID,
+            'childrenTaskTokens': childrenTaskTokens}
+        self.basicComponent.sendMessage(
+            messageType=MessageType.PLACEMENT,
+            messageSubType=MessageSubType.REUSE,
+            data=data,
+            destination=taskExecutor)
+        # Lets the Actor refill its pool and count the request
+        actor = self.registeredManager.actors[taskExecutor.hostID]
+        self.basicComponent.sendMessage(
+            messageType=MessageType.PLACEMENT,
+            messageSubType=MessageSubType.WARM_EXECUTOR_BOUND,
+            data={'taskName': taskExecutor.task.name},
+            destination=actor)
+        self.basicComponent.debugLogger.debug(
+            'Bind warm %s', taskExecutor.nameLogPrinting)
+
+    def sendWarmTaskExecutorExitedMsg(self, taskExecutor: TaskExecutor):
+        # Lets the Actor start another one in its place
+        if taskExecutor.hostID not in self.registeredManager.actors:
+            return
+        actor = self.registeredManager.actors[taskExecutor.hostID]
+        self.basicComponent.sendMessage(
+            messageType=MessageType.PLACEMENT,
+            messageSubType=MessageSubType.WARM_EXECUTOR_EXITED,
+            data={'taskName': taskExecutor.task.name},
+            destination=actor)
+        self.basicComponent.debugLogger.debug(
+            'Warm %s exited', taskExecutor.nameLogPrinting)
+
+    def sendInitTaskExecutorsMsg(
+            self,
+            hostID: str,
+            user: User,
+            tasks: List[Dict]):
         actor = self.registeredManager.actors[hostID]
         data = {
             'userName': user.name,
-            'taskName': taskNameLabeled,
-            'taskToken': taskToken,
             'label': user.application.label,
             'userID': user.componentID,
-            'childrenTaskTokens': childrenTaskTokens}
+            'tasks': tasks}
         self.basicComponent.sendMessage(
             messageType=MessageType.PLACEMENT,
             messageSubType=MessageSubType.RUN_TASK_EXECUTOR,
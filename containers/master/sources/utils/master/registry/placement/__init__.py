@@ -0,0 +1,6 @@
+from .state import PlacementState
+from .startupTime import StartupTime
+from .timer import TimerService
+from .tracker import PlacementTracker
+from .tracker import TaskPlacement
+from .capacity import CapacityLedger
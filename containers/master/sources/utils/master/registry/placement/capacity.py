@@ -0,0 +1,113 @@
+from collections import defaultdict
+from collections import deque
+from threading import Lock
+from time import time
+from typing import DefaultDict
+from typing import Deque
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from ..roles import Actor
+
+# When a task was committed and the user it was committed for, if any
+Commit = Tuple[float, Union[str, None]]
+
+
+# Tasks committed to each host recently. The CPU utilization an Actor
+# reports does not show them until their TaskExecutors are running, and
+# decisions searched at the same time over one snapshot tend to pick the
+# same hosts. Each task is therefore checked against what is left on its
+# host when the decision is committed. Only the tasks that others committed
+# after a decision's snapshot are counted against it, since and excluding
+# select them
+class CapacityLedger:
+
+    def __init__(
+            self,
+            tasksPerCore: float = 4,
+            maxUtilization: float = 1.,
+            window: float = 30):
+        self.tasksPerCore = tasksPerCore
+        self.maxUtilization = maxUtilization
+        self.window = window
+        self.commits: DefaultDict[str, Deque[Commit]] = defaultdict(deque)
+        self.lock: Lock = Lock()
+
+    def pendingTasks(
+            self,
+            hostID: str,
+            now: float = None,
+            since: float = 0,
+            excluding: str = None) -> int:
+        if now is None:
+            now = time()
+        self.lock.acquire()
+        commits = self.commits[hostID]
+        while len(commits) and now - commits[0][0] > self.window:
+            commits.popleft()
+        count = 0
+        for committedAt, owner in commits:
+            if committedAt < since:
+                continue
+            if excluding is not None and owner == excluding:
+                continue
+            count += 1
+        self.lock.release()
+        return count
+
+    def utilization(
+            self,
+            actor: Actor,
+            now: float = None,
+            since: float = 0,
+            excluding: str = None) -> float:
+        cpu = actor.actorResources.cpu
+        capacity = max(cpu.cores, 1) * self.tasksPerCore
+        pending = self.pendingTasks(actor.hostID, now, since, excluding)
+        return cpu.utilization + pending / capacity
+
+    def hasRoom(
+            self,
+            actor: Actor,
+            now: float = None,
+            since: float = 0,
+            excluding: str = None) -> bool:
+        cpu = actor.actorResources.cpu
+        capacity = max(cpu.cores, 1) * self.tasksPerCore
+        return self.utilization(actor, now, since, excluding) \
+            + 1 / capacity <= self.maxUtilization
+
+    def isContended(
+            self,
+            hostID: str,
+            now: float = None,
+            since: float = 0,
+            excluding: str = None) -> bool:
+        return self.pendingTasks(hostID, now, since, excluding) > 0
+
+    def leastUtilized(
+            self,
+            actors: List[Actor],
+            now: float = None,
+            needsRoom: bool = True,
+            since: float = 0,
+            excluding: str = None) -> Union[Actor, None]:
+        best = None
+        bestUtilization = None
+        for actor in actors:
+            if needsRoom and not self.hasRoom(actor, now, since, excluding):
+                continue
+            utilization = self.utilization(actor, now, since, excluding)
+            if best is not None and utilization >= bestUtilization:
+                continue
+            best = actor
+            bestUtilization = utilization
+        return best
+
+    def commit(self, hostID: str, now: float = None, owner: str = None):
+        if now is None:
+            now = time()
+        self.lock.acquire()
+        self.commits[hostID].append((now, owner))
+        self.lock.release()
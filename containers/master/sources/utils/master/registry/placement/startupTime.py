@@ -0,0 +1,28 @@
+from typing import Union
+
+
+# Smoothed startup time and its variation, estimated the same way TCP
+# estimates round trip time (RFC 6298)
+class StartupTime:
+
+    def __init__(self, alpha: float = 1 / 8, beta: float = 1 / 4):
+        self.alpha = alpha
+        self.beta = beta
+        self.smoothed: Union[float, None] = None
+        self.variation: float = .0
+        self.count: int = 0
+
+    def update(self, seconds: float):
+        self.count += 1
+        if self.smoothed is None:
+            self.smoothed = seconds
+            self.variation = seconds / 2
+            return
+        self.variation = (1 - self.beta) * self.variation \
+                         + self.beta * abs(self.smoothed - seconds)
+        self.smoothed = (1 - self.alpha) * self.smoothed + self.alpha * seconds
+
+    def timeout(self, default: float) -> float:
+        if self.smoothed is None:
+            return default
+        return self.smoothed + 4 * self.variation
@@ -0,0 +1,9 @@
+from enum import Enum
+from enum import unique
+
+
+@unique
+class PlacementState(Enum):
+    ASSIGNED = 'assigned'
+    REQUESTED = 'requested'
+    REGISTERED = 'registered'
@@ -0,0 +1,113 @@
+import unittest
+from threading import Event
+from time import sleep
+
+from .capacity import CapacityLedger
+from .startupTime import StartupTime
+from .state import PlacementState
+from .timer import TimerService
+from .tracker import PlacementTracker
+from ....types import CPU
+from ....types.hostProfiles import ActorResources
+
+
+class User:
+    componentID = '0'
+
+
+class Actor:
+
+    def __init__(self, hostID: str, cores: int, utilization: float):
+        self.hostID = hostID
+        self.actorResources = ActorResources(
+            cpu=CPU(cores=cores, utilization=utilization))
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testTimerOrderAndCancel(self):
+        timer = TimerService()
+        fired = []
+        done = Event()
+        timer.schedule(.2, lambda: (fired.append('late'), done.set()))
+        handle = timer.schedule(.05, fired.append, 'cancelled')
+        timer.schedule(.1, fired.append, 'early')
+        timer.cancel(handle)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(fired, ['early', 'late'])
+
+    def testCancelFiredTimer(self):
+        timer = TimerService()
+        done = Event()
+        handle = timer.schedule(0, done.set)
+        self.assertTrue(done.wait(2))
+        sleep(.05)
+        timer.cancel(handle)
+        self.assertEqual(len(timer), 0)
+        timer.schedule(10, done.set)
+        self.assertEqual(len(timer), 1)
+
+    def testStartupTimeTimeout(self):
+        startupTime = StartupTime()
+        self.assertEqual(startupTime.timeout(default=15.), 15.)
+        for _ in range(20):
+            startupTime.update(2.)
+        self.assertAlmostEqual(startupTime.smoothed, 2.)
+        self.assertLess(startupTime.timeout(default=15.), 3.)
+
+    def testRetryWhenOverdue(self):
+        overdue = []
+        tracker = PlacementTracker(
+            onOverdue=overdue.append,
+            defaultTimeout=.05,
+            minimumTimeout=.05)
+        user = User()
+        tracker.requested(user, ('host', 'OCR', 'tokenA'), method='init')
+        tracker.requested(user, ('host', 'OCR', 'tokenB'), method='init')
+        self.assertIsNotNone(tracker.registered('tokenB'))
+        sleep(.3)
+        self.assertEqual([p.taskToken for p in overdue], ['tokenA'])
+        self.assertIs(overdue[0].state, PlacementState.REQUESTED)
+        tracker.requested(user, overdue[0].compactedKey, method='init')
+        self.assertEqual(overdue[0].attempts, 2)
+        tracker.forgetUser(user)
+        sleep(.3)
+        self.assertEqual(len(overdue), 1)
+
+    def testCapacityLedger(self):
+        ledger = CapacityLedger(tasksPerCore=2, window=10)
+        busy = Actor('busy', cores=1, utilization=.5)
+        idle = Actor('idle', cores=2, utilization=0)
+        self.assertTrue(ledger.hasRoom(busy, now=0))
+        ledger.commit('busy', now=0)
+        self.assertFalse(ledger.hasRoom(busy, now=1))
+        self.assertIs(ledger.leastUtilized([busy, idle], now=1), idle)
+        for _ in range(4):
+            ledger.commit('idle', now=1)
+        self.assertIsNone(ledger.leastUtilized([busy, idle], now=1))
+        self.assertIs(
+            ledger.leastUtilized([busy, idle], now=1, needsRoom=False), busy)
+        # Committed tasks are running and reported after the window
+        self.assertTrue(ledger.hasRoom(busy, now=20))
+
+    def testOtherDecisionsOnly(self):
+        ledger = CapacityLedger(tasksPerCore=2, window=10)
+        host = Actor('host', cores=1, utilization=0)
+        # Committed before the snapshot of the decision of user
+        ledger.commit('host', now=1, owner='earlier')
+        ledger.commit('host', now=3, owner='user')
+        self.assertFalse(
+            ledger.isContended('host', now=4, since=2, excluding='user'))
+        self.assertTrue(
+            ledger.hasRoom(host, now=4, since=2, excluding='user'))
+        # Committed by a decision searched at the same time
+        ledger.commit('host', now=4, owner='other')
+        ledger.commit('host', now=4, owner='other')
+        self.assertTrue(
+            ledger.isContended('host', now=5, since=2, excluding='user'))
+        self.assertFalse(
+            ledger.hasRoom(host, now=5, since=2, excluding='user'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import heapq
+from itertools import count
+from threading import Condition
+from threading import Thread
+from time import time
+from traceback import print_exc
+from typing import Callable
+from typing import List
+from typing import Set
+from typing import Tuple
+
+Timer = Tuple[float, int, Callable, Tuple]
+
+
+# One thread firing every deadline of the component in order
+class TimerService:
+
+    def __init__(self, name: str = 'TimerService'):
+        self.__timers: List[Timer] = []
+        # Handles scheduled and not fired yet
+        self.__pending: Set[int] = set()
+        self.__cancelled: Set[int] = set()
+        self.__handles = count()
+        self.__condition = Condition()
+        Thread(target=self.__run, name=name, daemon=True).start()
+
+    def schedule(self, delay: float, callback: Callable, *args) -> int:
+        handle = next(self.__handles)
+        with self.__condition:
+            heapq.heappush(
+                self.__timers, (time() + delay, handle, callback, args))
+            self.__pending.add(handle)
+            self.__condition.notify()
+        return handle
+
+    def cancel(self, handle: int):
+        with self.__condition:
+            # Handles that already fired are not in the heap anymore
+            if handle not in self.__pending:
+                return
+            self.__cancelled.add(handle)
+
+    def __len__(self) -> int:
+        with self.__condition:
+            return len(self.__timers) - len(self.__cancelled)
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                if not len(self.__timers):
+                    self.__condition.wait()
+                    continue
+                deadline, handle, callback, args = self.__timers[0]
+                timeToWait = deadline - time()
+                if timeToWait > 0:
+                    self.__condition.wait(timeToWait)
+                    continue
+                heapq.heappop(self.__timers)
+                self.__pending.discard(handle)
+                if handle in self.__cancelled:
+                    self.__cancelled.remove(handle)
+                    continue
+            try:
+                callback(*args)
+            except Exception:
+                print_exc()
@@ -0,0 +1,114 @@
+from collections import defaultdict
+from threading import Lock
+from time import time
+from typing import Callable
+from typing import DefaultDict
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+from .startupTime import StartupTime
+from .state import PlacementState
+from .timer import TimerService
+from ..roles.user import User
+
+CompactedKey = Tuple[str, str, str]
+
+
+class TaskPlacement:
+
+    def __init__(self, user: User, compactedKey: CompactedKey):
+        self.user = user
+        self.compactedKey = compactedKey
+        self.hostID, self.taskNameLabeled, self.taskToken = compactedKey
+        self.state = PlacementState.ASSIGNED
+        self.method = ''
+        self.attempts = 0
+        self.requestedAt = .0
+        self.startupTime = .0
+        self.timer: Union[int, None] = None
+
+
+class PlacementTracker:
+
+    def __init__(
+            self,
+            onOverdue: Callable[[TaskPlacement], None],
+            defaultTimeout: float = 15.,
+            minimumTimeout: float = 1.,
+            maximumTimeout: float = 120.):
+        self.onOverdue = onOverdue
+        self.defaultTimeout = defaultTimeout
+        self.minimumTimeout = minimumTimeout
+        self.maximumTimeout = maximumTimeout
+        self.timer = TimerService(name='PlacementTimer')
+        self.placements: Dict[str, TaskPlacement] = {}
+        # (hostID, method) -> time from request to registration
+        self.startupTimes: DefaultDict[Tuple[str, str], StartupTime] = \
+            defaultdict(StartupTime)
+        self.lock: Lock = Lock()
+
+    def timeout(self, hostID: str, method: str, attempts: int) -> float:
+        timeout = self.startupTimes[hostID, method].timeout(
+            default=self.defaultTimeout)
+        timeout = max(timeout, self.minimumTimeout)
+        # Back off exponentially when requests keep being overdue
+        timeout *= 2 ** (attempts - 1)
+        return min(timeout, self.maximumTimeout)
+
+    def requested(self, user: User, compactedKey: CompactedKey, method: str):
+        taskToken = compactedKey[2]
+        self.lock.acquire()
+        if taskToken not in self.placements:
+            self.placements[taskToken] = TaskPlacement(user, compactedKey)
+        placement = self.placements[taskToken]
+        if placement.timer is not None:
+            self.timer.cancel(placement.timer)
+        placement.state = PlacementState.REQUESTED
+        placement.method = method
+        placement.attempts += 1
+        placement.requestedAt = time()
+        timeout = self.timeout(
+            placement.hostID, method, placement.attempts)
+        placement.timer = self.timer.schedule(
+            timeout, self.__overdue, taskToken, placement.attempts)
+        self.lock.release()
+
+    def registered(self, taskToken: str) -> Union[TaskPlacement, None]:
+        self.lock.acquire()
+        placement = self.placements.pop(taskToken, None)
+        if placement is None:
+            self.lock.release()
+            return None
+        if placement.timer is not None:
+            self.timer.cancel(placement.timer)
+        placement.state = PlacementState.REGISTERED
+        placement.startupTime = time() - placement.requestedAt
+        self.startupTimes[placement.hostID, placement.method].update(
+            placement.startupTime)
+        self.lock.release()
+        return placement
+
+    def forgetUser(self, user: User):
+        self.lock.acquire()
+        for taskToken in list(self.placements.keys()):
+            placement = self.placements[taskToken]
+            if placement.user is not user:
+                continue
+            if placement.timer is not None:
+                self.timer.cancel(placement.timer)
+            del self.placements[taskToken]
+        self.lock.release()
+
+    def __overdue(self, taskToken: str, attempts: int):
+        self.lock.acquire()
+        placement = self.placements.get(taskToken)
+        self.lock.release()
+        if placement is None:
+            return
+        if placement.state is not PlacementState.REQUESTED:
+            return
+        if placement.attempts != attempts:
+            return
+        placement.timer = None
+        self.onOverdue(placement)
@@ -1,5 +1,7 @@
+from threading import Lock
 from typing import Dict
 from typing import Set
+from typing import Union
 
 from .actors import RegisteredActors
 from .masters import RegisteredMasters
@@ -16,3 +18,45 @@ class RegisteredManager:
         self.masters = RegisteredMasters()
         # TODO: Thread Safe
         self.coolTaskExecutors: Dict[str, Dict[str, Set[TaskExecutor]]] = {}
+        # Pre-started TaskExecutors that never served a user,
+        # hostID -> taskName -> TaskExecutors
+        self.warmTaskExecutors: Dict[str, Dict[str, Set[TaskExecutor]]] = {}
+        self.warmLock: Lock = Lock()
+
+    def addWarmTaskExecutor(self, taskExecutor: TaskExecutor):
+        self.warmLock.acquire()
+        hostID = taskExecutor.hostID
+        taskName = taskExecutor.task.name
+        if hostID not in self.warmTaskExecutors:
+            self.warmTaskExecutors[hostID] = {}
+        if taskName not in self.warmTaskExecutors[hostID]:
+            self.warmTaskExecutors[hostID][taskName] = set([])
+        self.warmTaskExecutors[hostID][taskName].add(taskExecutor)
+        self.warmLock.release()
+
+    def popWarmTaskExecutor(
+            self,
+            hostID: str,
+            taskName: str) -> Union[TaskExecutor, None]:
+        self.warmLock.acquire()
+        taskExecutor = None
+        if hostID in self.warmTaskExecutors:
+            warmSet = self.warmTaskExecutors[hostID].get(taskName)
+            if warmSet:
+                taskExecutor = warmSet.pop()
+        self.warmLock.release()
+        return taskExecutor
+
+    def removeWarmTaskExecutor(self, taskExecutor: TaskExecutor) -> bool:
+        # False if it has been bound or removed already
+        self.warmLock.acquire()
+        hostID = taskExecutor.hostID
+        taskName = taskExecutor.task.name
+        isRemoved = False
+        if hostID in self.warmTaskExecutors:
+            warmSet = self.warmTaskExecutors[hostID].get(taskName)
+            if warmSet and taskExecutor in warmSet:
+                warmSet.discard(taskExecutor)
+                isRemoved = True
+        self.warmLock.release()
+        return isRemoved
@@ -56,17 +56,17 @@ class RegisteredTaskExecutors(Registered):
     def _delitem(self, key):
         self.lock.acquire()
         componentID, nameConsistent, taskToken, addr = self.keyMap[key]
-        try:
-            del self.dict[componentID]
-            del self.dict[nameConsistent]
-            del self.dict[taskToken]
-            del self.dict[addr]
-            del self.keyMap[componentID]
-            del self.keyMap[nameConsistent]
-            del self.keyMap[taskToken]
-            del self.keyMap[addr]
-        except KeyError:
-            pass
+        taskExecutor = self.dict.get(componentID)
+        if taskExecutor is None:
+            self.lock.release()
+            return
+        # TaskExecutors in a shared runtime have the same addr, only drop
+        # the keys still pointing at the one being deleted
+        for k in (componentID, nameConsistent, taskToken, addr):
+            if self.dict.get(k) is not taskExecutor:
+                continue
+            del self.dict[k]
+            del self.keyMap[k]
         self.lock.release()
 
     def _contains(self, taskExecutor: TaskExecutor) -> bool:
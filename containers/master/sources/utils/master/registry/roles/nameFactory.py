@@ -41,6 +41,19 @@ class NameFactory:
             name, actor)
         return name, nameLogPrinting, nameConsistent
 
+    def nameWarmTaskExecutor(
+            self, source: Component, taskExecutorID: str, task: Task,
+            actor: Actor) -> Names:
+        name = '%s-%s-Warm' % (ComponentRole.TASK_EXECUTOR.value, task.name)
+        nameLogPrinting = '%s-%s_%s-%d_%s' % (
+            name,
+            taskExecutorID,
+            source.addr[0],
+            source.addr[1],
+            self.nameLogPrinting)
+        nameConsistent = self.taskExecutorNameConsistent(name, actor)
+        return name, nameLogPrinting, nameConsistent
+
     @staticmethod
     def actorName() -> str:
         return ComponentRole.ACTOR.value
@@ -20,7 +20,8 @@ class TaskExecutor(Component):
             name: str = None,
             nameLogPrinting: str = None,
             nameConsistent: str = None,
-            waitTimeout: int = 0):
+            waitTimeout: int = 0,
+            isWarm: bool = False):
         Component.__init__(
             self,
             role=ComponentRole.TASK_EXECUTOR,
@@ -37,6 +38,7 @@ class TaskExecutor(Component):
         self.ready: Event = Event()
         self.waiting = False
         self.waitTimeout = waitTimeout
+        self.isWarm = isWarm
 
     @staticmethod
     def fromDict(inDict: Dict):
@@ -50,7 +52,8 @@ class TaskExecutor(Component):
             actorID=inDict['actorID'],
             userID=inDict['userID'],
             task=TaskLabeled.fromDict(inDict['task']),
-            waitTimeout=inDict['waitTimeout'])
+            waitTimeout=inDict['waitTimeout'],
+            isWarm=inDict.get('isWarm', False))
         return taskExecutor
 
     def toDict(self) -> Dict:
@@ -65,5 +68,6 @@ class TaskExecutor(Component):
             'actorID': self.actorID,
             'userID': self.userID,
             'waitTimeout': self.waitTimeout,
+            'isWarm': self.isWarm,
             'task': self.task.toDict()}
         return inDict
@@ -1,6 +1,8 @@
 from threading import Lock
+from time import time
 from typing import Dict
 from typing import List
+from typing import Set
 from typing import Tuple
 
 from .actor import Actor
@@ -23,7 +25,8 @@ class User(Component):
             name: str = None,
             nameLogPrinting: str = None,
             nameConsistent: str = None,
-            tokenList: List[str] = None):
+            tokenList: List[str] = None,
+            schedulingBudget: float = 0):
         Component.__init__(
             self,
             role=ComponentRole.USER,
@@ -34,6 +37,9 @@ class User(Component):
             nameLogPrinting=nameLogPrinting,
             nameConsistent=nameConsistent)
         self.application = application
+        # ms the scheduler may take to place the application, 0 to use the
+        # Master's --schedulingBudget
+        self.schedulingBudget = schedulingBudget
         self.taskNameList = application.taskNameList
         self.entryTaskNameList = application.entryTaskNameList
         self.tokenList = tokenList
@@ -45,8 +51,16 @@ class User(Component):
             self.taskNameToExecutor: Dict[str, TaskExecutor] = {}
 
         self.unclaimedTasks: Dict[Tuple[str, str, str], List[str]] = {}
+        # Lets the Master push addresses once TaskExecutors register
+        self.taskTokenToChildren: Dict[str, List[str]] = {}
+        self.taskTokenToParents: Dict[str, List[str]] = {}
         self.lock: Lock = Lock()
         self.isReady = False
+        self.readyTaskNames: Set[str] = set()
+        # (taskNameLabeled, timestamp) of every task becoming ready
+        self.readyEvents: List[Tuple[str, float]] = []
+        self.firstRegisteredAt: float = .0
+        self.serviceReadyAt: float = .0
 
     def generateTaskNameToToken(self) -> Dict[str, str]:
         inDict = {}
@@ -63,6 +77,13 @@ class User(Component):
         compactedKey = (actor.hostID, taskNameLabeled, taskToken)
         self.lock.acquire()
         self.unclaimedTasks[compactedKey] = childrenTaskTokens
+        self.taskTokenToChildren[taskToken] = childrenTaskTokens
+        for childTaskToken in childrenTaskTokens:
+            if childTaskToken not in self.taskTokenToParents:
+                self.taskTokenToParents[childTaskToken] = []
+            parents = self.taskTokenToParents[childTaskToken]
+            if taskToken not in parents:
+                parents.append(taskToken)
         self.lock.release()
 
     def claimTask(self, hostID: str, taskNameLabeled: str, taskToken: str) \
@@ -76,6 +97,42 @@ class User(Component):
         self.lock.release()
         return True
 
+    def markRegistered(self):
+        self.lock.acquire()
+        if not self.firstRegisteredAt:
+            self.firstRegisteredAt = time()
+        self.lock.release()
+
+    def markReady(
+            self,
+            taskNameLabeled: str,
+            taskExecutor: TaskExecutor) -> bool:
+        # Returns True only for the READY that makes the whole service ready
+        self.lock.acquire()
+        self.taskNameToExecutor[taskNameLabeled] = taskExecutor
+        if taskNameLabeled not in self.readyTaskNames:
+            self.readyTaskNames.add(taskNameLabeled)
+            self.readyEvents.append((taskNameLabeled, time()))
+        if self.isReady \
+                or len(self.readyTaskNames) != len(self.taskNameList):
+            self.lock.release()
+            return False
+        self.isReady = True
+        self.serviceReadyAt = time()
+        self.lock.release()
+        return True
+
+    @property
+    def readyCount(self) -> int:
+        return len(self.readyTaskNames)
+
+    @property
+    def timeToServiceReady(self) -> float:
+        # From the first TaskExecutor registered to SERVICE_READY, in ms
+        if not self.serviceReadyAt or not self.firstRegisteredAt:
+            return .0
+        return (self.serviceReadyAt - self.firstRegisteredAt) * 1000
+
     def countUnclaimedTask(self) -> int:
         self.lock.acquire()
         count = len(self.unclaimedTasks)
@@ -92,7 +149,8 @@ class User(Component):
             nameConsistent=inDict['nameConsistent'],
             hostID=inDict['hostID'],
             application=Application.fromDict(inDict['application']),
-            tokenList=inDict['tokenList'])
+            tokenList=inDict['tokenList'],
+            schedulingBudget=inDict['schedulingBudget'])
         return user
 
     def toDict(self) -> Dict:
@@ -105,5 +163,6 @@ class User(Component):
             'nameConsistent': self.nameConsistent,
             'hostID': self.hostID,
             'application': self.application.toDict(),
-            'tokenList': self.tokenList, }
+            'tokenList': self.tokenList,
+            'schedulingBudget': self.schedulingBudget, }
         return inDict
@@ -1,12 +1,21 @@
 from abc import abstractmethod
 from queue import Queue
+from threading import BoundedSemaphore
 from threading import Lock
+from time import time
+from typing import List
 from typing import Union
 
 from .baseScaler.base import Scaler
+from .decisionCache import CacheKey
+from .decisionCache import DecisionCache
+from .decisionCache import Fingerprint
+from .estimator import CandidateIndex
+from .estimator import FitnessCache
 from .types import Decision
 from ..logger.allSystemPerformance import AllSystemPerformance
 from ..registry.registered.manager import RegisteredManager
+from ..registry.roles import Actor
 from ..registry.roles import User
 from ...component.basic import BasicComponent
 from ...types import Component
@@ -19,12 +28,26 @@ from ...types.message import MessageType
 class BaseScheduler:
 
     def __init__(
-            self, schedulerName: str, isContainerMode: bool, *args, **kwargs):
+            self,
+            schedulerName: str,
+            isContainerMode: bool,
+            concurrentSchedules: int = 4,
+            *args,
+            **kwargs):
         self.isContainerMode = isContainerMode
         self.name = schedulerName
         self._waitingCountLock = Lock()
         self._waitingCount = 0
         self.scaler: Scaler = None
+        # Requests beyond this many wait for a free slot
+        self.concurrentSchedules = concurrentSchedules
+        self.schedulingSlots = BoundedSemaphore(concurrentSchedules)
+        # Policies that take long enough to be worth caching set this
+        self.decisionCache: Union[DecisionCache, None] = None
+        # Set by the policies that estimate populations
+        self.fitnessCache: Union[FitnessCache, None] = None
+        # Kept up to date by the Registry
+        self.candidateIndex = CandidateIndex()
 
     def schedule(
             self,
@@ -36,6 +59,7 @@ class BaseScheduler:
             decisionsQueue: Queue[Decision],
             *args,
             **kwargs) -> bool:
+        receivedTime = time() * 1000
         allActors = registeredManager.actors.copyAll()
 
         if not len(allActors):
@@ -44,7 +68,27 @@ class BaseScheduler:
             self.scaler.warnUser(user)
             return False
 
-        if resources.cpu.utilization > .8:
+        cacheKey = None
+        fingerprint = None
+        decision = None
+        if self.decisionCache is not None:
+            cacheKey = self.decisionCache.key(
+                user=user,
+                allActors=allActors,
+                isContainerMode=self.isContainerMode,
+                candidateIndex=self.candidateIndex)
+            fingerprint = self.decisionCache.fingerprint(
+                user=user,
+                master=basicComponent.me,
+                allActors=allActors,
+                systemPerformance=systemPerformance)
+            decision = self.reuseDecision(
+                user=user,
+                cacheKey=cacheKey,
+                fingerprint=fingerprint,
+                receivedTime=receivedTime)
+
+        if decision is None and resources.cpu.utilization > .8:
             schedulingCount = self.readWaitingCount()
             if schedulingCount > 4:
                 knownMasters = registeredManager.masters.copyAll()
@@ -65,14 +109,17 @@ class BaseScheduler:
                 self.scaler.notifyUser(user, subMaster)
                 return False
 
-        decision = self._schedule(
-            user=user,
-            master=basicComponent.me,
-            allActors=allActors,
-            systemPerformance=systemPerformance,
-            isContainerMode=self.isContainerMode,
-            *args,
-            **kwargs)
+        if decision is None:
+            decision = self.searchDecision(
+                user=user,
+                master=basicComponent.me,
+                allActors=allActors,
+                systemPerformance=systemPerformance,
+                receivedTime=receivedTime,
+                *args,
+                **kwargs)
+            if cacheKey is not None:
+                self.decisionCache.store(cacheKey, fingerprint, decision)
         decisionsQueue.put(decision)
         data = {
             'userID': user.componentID,
@@ -88,6 +135,55 @@ class BaseScheduler:
         basicComponent.debugLogger.debug('Registered: %s', user.nameLogPrinting)
         return True
 
+    def searchDecision(
+            self,
+            user: User,
+            master: Component,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance,
+            receivedTime: float,
+            *args,
+            **kwargs) -> Decision:
+        self.joinWaiting()
+        self.schedulingSlots.acquire()
+        try:
+            snapshotAt = time()
+            queueingTime = snapshotAt * 1000 - receivedTime
+            decision = self._schedule(
+                user=user,
+                master=master,
+                allActors=allActors,
+                systemPerformance=systemPerformance.snapshot(),
+                isContainerMode=self.isContainerMode,
+                queueingTime=queueingTime,
+                *args,
+                **kwargs)
+        finally:
+            self.schedulingSlots.release()
+            self.leaveWaiting()
+        decision.queueingTime = queueingTime
+        decision.snapshotAt = snapshotAt
+        return decision
+
+    def reuseDecision(
+            self,
+            user: User,
+            cacheKey: CacheKey,
+            fingerprint: Fingerprint,
+            receivedTime: float) -> Union[Decision, None]:
+        cached = self.decisionCache.lookup(cacheKey, fingerprint)
+        if cached is None:
+            return None
+        decision = Decision(
+            user=user,
+            indexSequence=cached.indexSequence,
+            indexToHostID=cached.indexToHostID,
+            schedulingTime=time() * 1000 - receivedTime,
+            cost=cached.cost,
+            isCached=True,
+            snapshotAt=cached.snapshotAt)
+        return decision
+
     @abstractmethod
     def _schedule(self, *args, **kwargs) -> Decision:
         raise NotImplementedError
@@ -119,3 +215,6 @@ class BaseScheduler:
 
     def genUserTaskToken(self, user: User):
         pass
+
+    def shutdown(self):
+        pass
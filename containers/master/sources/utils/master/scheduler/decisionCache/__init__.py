@@ -0,0 +1,4 @@
+from .cache import CacheKey
+from .cache import CachedDecision
+from .cache import DecisionCache
+from .cache import Fingerprint
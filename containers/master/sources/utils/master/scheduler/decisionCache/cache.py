@@ -0,0 +1,214 @@
+from collections import OrderedDict
+from math import log
+from threading import Lock
+from time import time
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from ..estimator import CandidateIndex
+from ..estimator import Estimator
+from ..types import Decision
+from ...logger.allSystemPerformance import AllSystemPerformance
+from ...registry.roles import Actor
+from ...registry.roles import User
+from ...registry.roles.nameFactory import NameFactory
+from ....types import Component
+
+# Application name, label and the candidate hosts of every task
+CacheKey = Tuple[str, str, Tuple[Tuple[str, ...], ...]]
+Fingerprint = Dict[str, float]
+
+
+class CachedDecision:
+
+    def __init__(
+            self,
+            decision: Decision,
+            fingerprint: Fingerprint,
+            storedTime: float):
+        self.decision = decision
+        self.fingerprint = fingerprint
+        self.storedTime = storedTime
+
+
+# Recent decisions of each application, reused while the performance of the
+# hosts and links they depend on stays about the same. The fingerprint
+# holds the available CPU of every candidate host, the processing time of
+# the tasks on them and the latency, data rate and packet size between
+# them and the Master, quantized on a log scale so that noise does not
+# count as drift. Measured delays between TaskExecutors are not part of it,
+# maxAge bounds how long they can be missed
+class DecisionCache:
+
+    def __init__(
+            self,
+            maxAge: float = 300,
+            maxDrift: float = .2,
+            resolution: float = .05,
+            maxEntries: int = 128):
+        self.maxAge = maxAge
+        self.maxDrift = maxDrift
+        self.resolution = resolution
+        self.maxEntries = maxEntries
+        self.entries: OrderedDict[CacheKey, CachedDecision] = OrderedDict()
+        self.lock: Lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.expirations = 0
+        self.hitAgeTotal = .0
+        self.hitAgeMax = .0
+
+    def key(
+            self,
+            user: User,
+            allActors: List[Actor],
+            isContainerMode: bool,
+            candidateIndex: CandidateIndex = None) -> CacheKey:
+        application = user.application
+        hostIDs = sorted(actor.hostID for actor in allActors)
+        if not isContainerMode:
+            candidates = tuple(
+                tuple(hostIDs) for _ in application.tasksWithDependency)
+            return application.name, application.label, candidates
+        table = None
+        if candidateIndex is not None:
+            table = candidateIndex.candidates(application)
+        registered = set(hostIDs)
+        candidates = []
+        for taskName in application.tasksWithDependency.keys():
+            if table is None:
+                taskHostIDs = [
+                    actor.hostID for actor in allActors
+                    if Estimator.hasImage(actor, taskName)]
+            else:
+                taskHostIDs = [
+                    hostID for hostID in table[taskName]
+                    if hostID in registered]
+            candidates.append(tuple(sorted(taskHostIDs)))
+        return application.name, application.label, tuple(candidates)
+
+    def fingerprint(
+            self,
+            user: User,
+            master: Component,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance) -> Fingerprint:
+        fingerprint = {}
+        for actor in allActors:
+            cpu = actor.actorResources.cpu
+            available = cpu.cores * cpu.frequency * (1 - cpu.utilization)
+            fingerprint['cpu:%s' % actor.hostID] = self.quantize(available)
+        hostIDs = [master.hostID] + [actor.hostID for actor in allActors]
+        for name, table in (
+                ('latency', systemPerformance.latency),
+                ('dataRate', systemPerformance.dataRate),
+                ('packetSize', systemPerformance.packetSize)):
+            for source in hostIDs:
+                if source not in table:
+                    continue
+                for dest in hostIDs:
+                    if dest not in table[source]:
+                        continue
+                    fingerprint['%s:%s:%s' % (name, source, dest)] = \
+                        self.quantize(table[source][dest])
+        processingTime = systemPerformance.processingTime
+        for task in user.application.tasksWithDependency.values():
+            name = NameFactory.taskExecutorName(task, user)
+            keys = [name] + [
+                NameFactory.taskExecutorNameConsistent(name, actor)
+                for actor in allActors]
+            for key in keys:
+                if key not in processingTime:
+                    continue
+                fingerprint['processingTime:%s' % key] = self.quantize(
+                    processingTime[key].processingTime)
+        return fingerprint
+
+    def quantize(self, value: float) -> float:
+        if value <= 0:
+            return .0
+        step = log(1 + self.resolution)
+        return (1 + self.resolution) ** round(log(value) / step)
+
+    @staticmethod
+    def drift(fingerprint: Fingerprint, other: Fingerprint) -> float:
+        if fingerprint.keys() != other.keys():
+            return float('inf')
+        maximum = .0
+        for key, value in fingerprint.items():
+            otherValue = other[key]
+            largest = max(abs(value), abs(otherValue))
+            if largest == 0:
+                continue
+            maximum = max(maximum, abs(value - otherValue) / largest)
+        return maximum
+
+    def lookup(
+            self,
+            key: CacheKey,
+            fingerprint: Fingerprint,
+            now: float = None) -> Union[Decision, None]:
+        if now is None:
+            now = time()
+        self.lock.acquire()
+        cached = self.entries.get(key)
+        if cached is None:
+            self.misses += 1
+            self.lock.release()
+            return None
+        age = now - cached.storedTime
+        if age > self.maxAge:
+            del self.entries[key]
+            self.expirations += 1
+            self.misses += 1
+            self.lock.release()
+            return None
+        if self.drift(cached.fingerprint, fingerprint) > self.maxDrift:
+            del self.entries[key]
+            self.invalidations += 1
+            self.misses += 1
+            self.lock.release()
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        self.hitAgeTotal += age
+        self.hitAgeMax = max(self.hitAgeMax, age)
+        decision = cached.decision
+        self.lock.release()
+        return decision
+
+    def store(
+            self,
+            key: CacheKey,
+            fingerprint: Fingerprint,
+            decision: Decision,
+            now: float = None):
+        if now is None:
+            now = time()
+        self.lock.acquire()
+        self.entries[key] = CachedDecision(
+            decision=decision,
+            fingerprint=fingerprint,
+            storedTime=now)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+        self.lock.release()
+
+    def metrics(self) -> Dict[str, float]:
+        self.lock.acquire()
+        lookups = self.hits + self.misses
+        metrics = {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'expirations': self.expirations,
+            'hitRatio': self.hits / lookups if lookups else .0,
+            'meanHitAge': self.hitAgeTotal / self.hits if self.hits else .0,
+            'maxHitAge': self.hitAgeMax}
+        self.lock.release()
+        return metrics
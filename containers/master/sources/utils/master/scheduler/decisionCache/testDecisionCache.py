@@ -0,0 +1,117 @@
+import unittest
+from time import time
+
+from .cache import DecisionCache
+from ..base import BaseScheduler
+from ..estimator.fixtures import createApplication
+from ..types import Decision
+from ...logger.allSystemPerformance import AllSystemPerformance
+from ...registry.placement import CapacityLedger
+from ...registry.roles import Actor
+from ...registry.roles import Master
+from ...registry.roles import User
+from ....types import ComponentRole
+from ....types import CPU
+from ....types.hostProfiles import ActorResources
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.master = Master(
+            role=ComponentRole.MASTER,
+            addr=('10.0.0.1', 5000),
+            hostID='master')
+        self.actors = [
+            Actor(
+                addr=('10.0.0.%d' % (i + 2), 5000),
+                hostID='host%d' % i,
+                actorResources=ActorResources(
+                    cpu=CPU(cores=2, frequency=1000.)))
+            for i in range(3)]
+        self.user = User(application=createApplication(), hostID='user')
+        self.systemPerformance = AllSystemPerformance()
+        self.systemPerformance.latency[self.master.hostID] = {
+            actor.hostID: 10. for actor in self.actors}
+        self.cache = DecisionCache(maxAge=60, maxDrift=.2)
+        self.decision = Decision(
+            user=self.user,
+            indexSequence=['0', '1', '2', '0', '1'],
+            indexToHostID={'0': 'host0', '1': 'host1', '2': 'host2'},
+            schedulingTime=100.,
+            cost=42.)
+
+    def fingerprint(self):
+        return self.cache.fingerprint(
+            user=self.user,
+            master=self.master,
+            allActors=self.actors,
+            systemPerformance=self.systemPerformance)
+
+    def key(self):
+        return self.cache.key(
+            user=self.user, allActors=self.actors, isContainerMode=False)
+
+    def testHit(self):
+        self.cache.store(self.key(), self.fingerprint(), self.decision, 0)
+        # Small changes are within the quantization and the drift bound
+        self.actors[0].actorResources.cpu.utilization = .05
+        cached = self.cache.lookup(self.key(), self.fingerprint(), 10)
+        self.assertIs(cached, self.decision)
+        metrics = self.cache.metrics()
+        self.assertEqual(metrics['hits'], 1)
+        self.assertEqual(metrics['misses'], 0)
+        self.assertEqual(metrics['meanHitAge'], 10)
+
+    def testDrift(self):
+        self.cache.store(self.key(), self.fingerprint(), self.decision, 0)
+        self.actors[1].actorResources.cpu.utilization = .5
+        self.assertIsNone(
+            self.cache.lookup(self.key(), self.fingerprint(), 10))
+        self.assertEqual(self.cache.metrics()['invalidations'], 1)
+        self.assertEqual(self.cache.metrics()['entries'], 0)
+
+    def testExpiry(self):
+        self.cache.store(self.key(), self.fingerprint(), self.decision, 0)
+        self.assertIsNone(
+            self.cache.lookup(self.key(), self.fingerprint(), 61))
+        metrics = self.cache.metrics()
+        self.assertEqual(metrics['expirations'], 1)
+        self.assertEqual(metrics['hitRatio'], 0)
+
+    def testCandidatesChanged(self):
+        self.cache.store(self.key(), self.fingerprint(), self.decision, 0)
+        self.actors.pop()
+        self.assertIsNone(
+            self.cache.lookup(self.key(), self.fingerprint(), 10))
+
+    def testLeastRecentlyUsedEvicted(self):
+        self.cache.maxEntries = 2
+        for label in 'abc':
+            self.user.application.label = label
+            self.cache.store(self.key(), {}, self.decision, 0)
+        self.assertEqual(self.cache.metrics()['entries'], 2)
+        self.user.application.label = 'a'
+        self.assertIsNone(self.cache.lookup(self.key(), {}, 0))
+
+    def testReusedDecisionRechecked(self):
+        scheduler = BaseScheduler(schedulerName='Test', isContainerMode=False)
+        scheduler.decisionCache = self.cache
+        ledger = CapacityLedger()
+        # Searched at 1, then decision A commits to host0 at 2
+        self.decision.snapshotAt = 1.
+        self.cache.store(self.key(), self.fingerprint(), self.decision)
+        ledger.commit('host0', now=2., owner='userA')
+        reused = scheduler.reuseDecision(
+            user=self.user,
+            cacheKey=self.key(),
+            fingerprint=self.fingerprint(),
+            receivedTime=time() * 1000)
+        self.assertTrue(reused.isCached)
+        self.assertEqual(reused.snapshotAt, 1.)
+        self.assertTrue(ledger.isContended(
+            'host0', now=3., since=reused.snapshotAt, excluding='userB'))
+
+
+if __name__ == '__main__':
+    unittest.main()
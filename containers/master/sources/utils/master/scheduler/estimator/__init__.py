@@ -1 +1,6 @@
+from .candidates import CandidateIndex
 from .estimator import Estimator
+from .compiled import CompiledEstimator
+from .pool import EvaluationPool
+from .symmetry import SymmetricEncoding
+from .fitnessCache import FitnessCache
@@ -0,0 +1,88 @@
+from collections import defaultdict
+from threading import Lock
+from typing import DefaultDict
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from ...application.base import Application
+from ...registry.roles import Actor
+from ....tools.camelToSnake import camelToSnake
+
+# Task name -> hostIDs of the Actors that have its image
+CandidateTable = Dict[str, List[str]]
+
+
+# Which Actors have the image of each task, kept up to date as Actors
+# register, change their images and leave. The table of an application is
+# built once per change, so the scheduler finds the hosts of a task with one
+# lookup instead of matching names against every image of every Actor
+class CandidateIndex:
+
+    def __init__(self):
+        self.hostsByImage: DefaultDict[str, Set[str]] = defaultdict(set)
+        self.imagesByHost: Dict[str, Set[str]] = {}
+        # Increased on every change, tables built before are stale
+        self.version = 0
+        self.tables: Dict[str, Tuple[int, CandidateTable]] = {}
+        self.lock: Lock = Lock()
+
+    @staticmethod
+    def imageKey(image: str) -> Union[str, None]:
+        """
+        :param image: image name, e.g., cloudslab/fogbus2-face_detection:latest
+        :return: the snake case task name, e.g., face_detection
+        """
+        if image.startswith('cloudslab/'):
+            image = image[len('cloudslab/'):]
+        if not image.startswith('fogbus2-') or not image.endswith(':latest'):
+            return None
+        return image[len('fogbus2-'):-len(':latest')]
+
+    def updateActor(self, actor: Actor):
+        keys = set()
+        for image in actor.actorResources.images:
+            key = self.imageKey(image)
+            if key is None:
+                continue
+            keys.add(key)
+        self.lock.acquire()
+        previousKeys = self.imagesByHost.get(actor.hostID)
+        if previousKeys != keys:
+            self.removeKeys(actor.hostID)
+            self.imagesByHost[actor.hostID] = keys
+            for key in keys:
+                self.hostsByImage[key].add(actor.hostID)
+            self.version += 1
+        self.lock.release()
+
+    def removeActor(self, hostID: str):
+        self.lock.acquire()
+        if hostID in self.imagesByHost:
+            self.removeKeys(hostID)
+            self.version += 1
+        self.lock.release()
+
+    def removeKeys(self, hostID: str):
+        if hostID not in self.imagesByHost:
+            return
+        for key in self.imagesByHost[hostID]:
+            self.hostsByImage[key].discard(hostID)
+        del self.imagesByHost[hostID]
+
+    def candidates(self, application: Application) -> CandidateTable:
+        self.lock.acquire()
+        if application.name in self.tables:
+            version, table = self.tables[application.name]
+            if version == self.version:
+                self.lock.release()
+                return table
+        table = {}
+        for taskName in application.tasksWithDependency.keys():
+            key = camelToSnake(taskName)
+            table[taskName] = sorted(self.hostsByImage.get(key, ()))
+        self.tables[application.name] = (self.version, table)
+        self.lock.release()
+        return table
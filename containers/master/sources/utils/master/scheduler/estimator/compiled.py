@@ -0,0 +1,232 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from .estimator import Estimator
+from ...application.task.base import Task
+
+
+# Compiles the application DAG and the performance tables seen by an
+# Estimator into dense arrays once, so a whole population can be scored
+# with numpy instead of one Python pass per individual. Every table entry is
+# computed by the Estimator itself, and the longest path is found in the
+# same topological order, so the costs are identical to
+# Estimator.estimateCost
+class CompiledEstimator:
+
+    def __init__(self, estimator: Estimator, prune: bool = False):
+        """
+        :param estimator: the Estimator of the user to schedule
+        :param prune: whether to drop the actors that are dominated for a
+        task. Choices are then renumbered, see expand and compress
+        """
+        self.estimator = estimator
+        application = estimator.user.application
+        self.taskNum = len(estimator.taskList)
+        self.choiceNum = [
+            len(estimator.actorsByTaskName[taskName])
+            for taskName in estimator.taskList]
+        self.components = self.compileComponents()
+        # entry task index -> costs of each choice
+        self.entryCosts: List[Tuple[int, np.ndarray]] = []
+        for task in application.entryTasks:
+            taskIndex = estimator.taskNameToIndex[task.name]
+            self.entryCosts.append(
+                (taskIndex, self.costsFrom(estimator.master, taskIndex)))
+        # (parent index, child index) -> parent choice x child choice costs
+        self.edgeCosts: Dict[Tuple[int, int], np.ndarray] = {}
+        # parent index -> costs of sending the result to the Actuator
+        self.actuatorCosts: Dict[int, np.ndarray] = {}
+        self.isLeaf = np.zeros(self.taskNum, dtype=bool)
+        self.parentsOf: List[List[int]] = [[] for _ in range(self.taskNum)]
+        for parentIndex, taskName in enumerate(estimator.taskList):
+            children = application.tasksWithDependency[taskName].children
+            if not len(children):
+                self.isLeaf[parentIndex] = True
+                continue
+            for childTask in children:
+                self.compileEdge(parentIndex, childTask)
+        self.order = [
+            estimator.taskNameToIndex[taskName]
+            for taskName in estimator.taskOrder]
+        # choice of each task -> index of the actor in the Estimator
+        self.choices: List[np.ndarray] = [
+            np.arange(choiceNum) for choiceNum in self.choiceNum]
+        if prune:
+            self.pruneDominated()
+
+    def __getstate__(self):
+        # Worker processes only need the tables
+        state = self.__dict__.copy()
+        del state['estimator']
+        del state['components']
+        return state
+
+    def compileComponents(self) -> List[List[Tuple]]:
+        # Simulated TaskExecutors are created once per task and choice, so
+        # the Estimator caches stay valid across the whole population
+        estimator = self.estimator
+        application = estimator.user.application
+        components = []
+        individual = [None for _ in range(self.taskNum)]
+        for taskIndex, taskName in enumerate(estimator.taskList):
+            task = application.tasksWithDependency[taskName]
+            choices = []
+            for actor in estimator.actorsByTaskName[taskName]:
+                individual[taskIndex] = actor
+                choices.append(estimator.convertTask(individual, task))
+            components.append(choices)
+        return components
+
+    def costsFrom(self, sourceComponent, taskIndex: int) -> np.ndarray:
+        costs = np.empty(self.choiceNum[taskIndex])
+        for choice, (destComponent, destActor) in enumerate(
+                self.components[taskIndex]):
+            costs[choice] = self.estimator.sourceToDestCost(
+                sourceComponent=sourceComponent,
+                destComponent=destComponent,
+                destActor=destActor)
+        return costs
+
+    def compileEdge(self, parentIndex: int, childTask: Task):
+        estimator = self.estimator
+        if childTask.name == 'Actuator':
+            costs = np.empty(self.choiceNum[parentIndex])
+            for choice, (sourceComponent, _) in enumerate(
+                    self.components[parentIndex]):
+                costs[choice] = estimator.sourceToDestCost(
+                    sourceComponent=sourceComponent,
+                    destComponent=estimator.master,
+                    destActor=None)
+            self.actuatorCosts[parentIndex] = costs
+            return
+        childIndex = estimator.taskNameToIndex[childTask.name]
+        costs = np.empty(
+            (self.choiceNum[parentIndex], self.choiceNum[childIndex]))
+        for choice, (sourceComponent, _) in enumerate(
+                self.components[parentIndex]):
+            costs[choice] = self.costsFrom(sourceComponent, childIndex)
+        self.edgeCosts[(parentIndex, childIndex)] = costs
+        self.parentsOf[childIndex].append(parentIndex)
+
+    def pruneDominated(self):
+        # An actor is dominated for a task when another one costs no more
+        # for every parent and child choice, the entry and the Actuator,
+        # and less for at least one. Replacing it never lengthens a path,
+        # so the best placement is kept. Pruning a task changes the tables
+        # of its neighbours, hence the repeat
+        isChanged = True
+        while isChanged:
+            isChanged = False
+            for taskIndex in self.order:
+                costs = self.choiceCosts(taskIndex)
+                if costs is None or len(costs) < 2:
+                    continue
+                noWorse = (costs[:, None, :] <= costs[None, :, :]).all(2)
+                better = (costs[:, None, :] < costs[None, :, :]).any(2)
+                isDominated = (noWorse & better).any(0)
+                if not isDominated.any():
+                    continue
+                self.restrict(taskIndex, np.flatnonzero(~isDominated))
+                isChanged = True
+
+    def choiceCosts(self, taskIndex: int) -> Union[np.ndarray, None]:
+        """
+        :param taskIndex: index of the task
+        :return: choices x (every cost depending on the choice) matrix
+        """
+        columns = []
+        for entryIndex, costs in self.entryCosts:
+            if entryIndex == taskIndex:
+                columns.append(costs[:, None])
+        for parentIndex in self.parentsOf[taskIndex]:
+            columns.append(self.edgeCosts[(parentIndex, taskIndex)].T)
+        for (parentIndex, childIndex), costs in self.edgeCosts.items():
+            if parentIndex == taskIndex:
+                columns.append(costs)
+        if taskIndex in self.actuatorCosts:
+            columns.append(self.actuatorCosts[taskIndex][:, None])
+        if not len(columns):
+            return None
+        return np.hstack(columns)
+
+    def restrict(self, taskIndex: int, keep: np.ndarray):
+        self.choices[taskIndex] = self.choices[taskIndex][keep]
+        self.choiceNum[taskIndex] = len(keep)
+        self.components[taskIndex] = [
+            self.components[taskIndex][choice] for choice in keep]
+        self.entryCosts = [
+            (entryIndex, costs[keep] if entryIndex == taskIndex else costs)
+            for entryIndex, costs in self.entryCosts]
+        for (parentIndex, childIndex), costs in self.edgeCosts.items():
+            if parentIndex == taskIndex:
+                self.edgeCosts[(parentIndex, childIndex)] = costs[keep]
+            if childIndex == taskIndex:
+                self.edgeCosts[(parentIndex, childIndex)] = costs[:, keep]
+        if taskIndex in self.actuatorCosts:
+            self.actuatorCosts[taskIndex] = \
+                self.actuatorCosts[taskIndex][keep]
+
+    def expand(self, indexSequence: List[int]) -> List[int]:
+        """
+        :param indexSequence: choices of each task
+        :return: the index sequence for the Estimator
+        """
+        return [
+            int(self.choices[taskIndex][choice])
+            for taskIndex, choice in enumerate(indexSequence)]
+
+    def compress(self, indexSequence: List[int]) -> Union[List[int], None]:
+        """
+        :param indexSequence: index sequence for the Estimator
+        :return: choices of each task, or None if any actor was pruned
+        """
+        compressed = []
+        for taskIndex, index in enumerate(indexSequence):
+            choice = np.flatnonzero(self.choices[taskIndex] == index)
+            if not len(choice):
+                return None
+            compressed.append(int(choice[0]))
+        return compressed
+
+    def evaluate(self, population: np.ndarray) -> np.ndarray:
+        """
+        Estimate the total cost of every individual in a population
+        :param population: individuals x tasks matrix of actor indexes
+        :return: the cost of each individual
+        """
+        population = np.asarray(population, dtype=int)
+        if population.ndim == 1:
+            population = population.reshape(1, -1)
+        if population.shape[1] != self.taskNum:
+            raise Exception(
+                'Individual length (%d) is not correct (%d)' % (
+                    population.shape[1], self.taskNum))
+        individualNum = population.shape[0]
+        # Longest cost from an entry to the finish of each task
+        finish = np.full((individualNum, self.taskNum), -np.inf)
+        result = np.full(individualNum, -np.inf)
+        for taskIndex, costs in self.entryCosts:
+            entryCost = costs[population[:, taskIndex]]
+            taskFinish = finish[:, taskIndex]
+            np.maximum(taskFinish, entryCost, out=taskFinish)
+            np.maximum(result, entryCost, out=result)
+        for taskIndex in self.order:
+            for parentIndex in self.parentsOf[taskIndex]:
+                stepCost = self.edgeCosts[(parentIndex, taskIndex)][
+                    population[:, parentIndex], population[:, taskIndex]]
+                taskFinish = finish[:, taskIndex]
+                np.maximum(
+                    taskFinish, finish[:, parentIndex] + stepCost,
+                    out=taskFinish)
+            if taskIndex in self.actuatorCosts:
+                stepCost = self.actuatorCosts[taskIndex][
+                    population[:, taskIndex]]
+                np.maximum(
+                    result, finish[:, taskIndex] + stepCost, out=result)
+            if self.isLeaf[taskIndex]:
+                np.maximum(result, finish[:, taskIndex], out=result)
+        return result
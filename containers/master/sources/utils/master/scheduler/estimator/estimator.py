@@ -5,6 +5,7 @@ from typing import List
 from typing import Tuple
 from typing import Union
 
+from .candidates import CandidateIndex
 from ...application.task.base import Task
 from ...application.task.dependency.base import TaskWithDependency
 from ...logger.allSystemPerformance import AllSystemPerformance
@@ -24,14 +25,17 @@ class Estimator:
             master: Master,
             allActors: List[Actor],
             systemPerformance: AllSystemPerformance,
-            isContainerMode: bool):
+            isContainerMode: bool,
+            candidateIndex: CandidateIndex = None):
         self.isContainerMode = isContainerMode
+        self.candidateIndex = candidateIndex
         self.systemPerformance = systemPerformance
         self.master = master
         self.nameFactory = NameFactory(nameLogPrinting=master.nameLogPrinting)
         self.user = user
         self.taskList = list(user.application.tasksWithDependency.keys())
         self.taskNameToIndex = self.generateTaskNameToIndex()
+        self.taskOrder = self.sortTasks()
         self.allActors = allActors
         self.actorsByTaskName = self.filterActors(allActors)
 
@@ -43,22 +47,41 @@ class Estimator:
         and will be used by scheduler
         """
         availableActors = {}
+        if self.isContainerMode and self.candidateIndex is not None:
+            return self.filterActorsByIndex(allActors)
         for taskName in self.taskList:
-            imageName = 'fogbus2-%s:latest' % camelToSnake(taskName)
             availableActors[taskName] = []
             if not self.isContainerMode:
                 availableActors[taskName] = allActors
                 continue
             for actor in allActors:
-                if imageName not in actor.actorResources.images:
-                    if 'cloudslab/'+ imageName not in \
-                            actor.actorResources.images:
-                        continue
+                if not self.hasImage(actor, taskName):
+                    continue
                 availableActors[taskName].append(actor)
             if len(availableActors[taskName]) == 0:
                 raise Exception('No available actor for task: ' + taskName)
         return availableActors
 
+    def filterActorsByIndex(self, allActors: List[Actor]) \
+            -> Dict[str, List[Actor]]:
+        table = self.candidateIndex.candidates(self.user.application)
+        # Actors may have joined or left since allActors was copied
+        actorsByHostID = {actor.hostID: actor for actor in allActors}
+        availableActors = {}
+        for taskName in self.taskList:
+            availableActors[taskName] = [
+                actorsByHostID[hostID] for hostID in table[taskName]
+                if hostID in actorsByHostID]
+            if len(availableActors[taskName]) == 0:
+                raise Exception('No available actor for task: ' + taskName)
+        return availableActors
+
+    @staticmethod
+    def hasImage(actor: Actor, taskName: str) -> bool:
+        imageName = 'fogbus2-%s:latest' % camelToSnake(taskName)
+        images = actor.actorResources.images
+        return imageName in images or 'cloudslab/' + imageName in images
+
     def estimateCost(self, indexSequence: List[int]):
         """
         Estimate the total cost of a chromosome
@@ -67,22 +90,80 @@ class Estimator:
         :return: Estimated total cost of the input indexSequence
         """
         individual = self.mapIndexSequenceToActorSequence(indexSequence)
+        application = self.user.application
         # For an application, there may be multiple tasks at the entry
         entryCostList = self.entryCost(individual)
-        entryCostList = [[cost] for cost in entryCostList]
-        for costIndex, task in enumerate(self.user.application.entryTasks):
-            # The dependency of an application can be considered as a graph
-            # For each entry, use deep first search to find the maximum cost
-            # among all the routes
-            self.elseCostDFS(
-                sourceTask=task,
-                individual=individual,
-                entryCost=entryCostList,
-                currentCost=entryCostList[costIndex][0],
-                costIndex=costIndex)
-        # find the maximum cost among all the entries
-        maximums = [max(costs) for costs in entryCostList]
-        return max(maximums)
+        # The dependency of an application can be considered as a graph.
+        # The maximum cost among all the routes is the longest path, which
+        # is found by visiting each task once in topological order
+        finishCost: Dict[str, float] = {}
+        for task, cost in zip(application.entryTasks, entryCostList):
+            finishCost[task.name] = max(
+                finishCost.get(task.name, cost), cost)
+        maximum = max(entryCostList)
+        # Simulated components of each task, created once per individual
+        components = {}
+        for taskName in self.taskOrder:
+            if taskName not in finishCost:
+                # Not reachable from any entry
+                continue
+            currentCost = finishCost[taskName]
+            sourceTask = application.tasksWithDependency[taskName]
+            if not len(sourceTask.children):
+                # if there is no more task
+                maximum = max(maximum, currentCost)
+                continue
+            sourceComponent, _ = self.convertTaskOnce(
+                individual, sourceTask, components)
+            for childTask in sourceTask.children:
+                # for each child, estimate the cost of this step
+                destComponent, destActor = self.convertTaskOnce(
+                    individual, childTask, components)
+                stepCost = self.sourceToDestCost(
+                    sourceComponent=sourceComponent,
+                    destComponent=destComponent,
+                    destActor=destActor)
+                costIncreased = currentCost + stepCost
+                if childTask.name == 'Actuator':
+                    # if this is the end of current route
+                    maximum = max(maximum, costIncreased)
+                    continue
+                finishCost[childTask.name] = max(
+                    finishCost.get(childTask.name, costIncreased),
+                    costIncreased)
+        return maximum
+
+    def sortTasks(self) -> List[str]:
+        """
+        Sort the tasks so that every task comes after all its parents
+        :return: task names in topological order
+        """
+        application = self.user.application
+        inDegree = {taskName: 0 for taskName in self.taskList}
+        for taskName in self.taskList:
+            for childTask in application.tasksWithDependency[
+                    taskName].children:
+                if childTask.name == 'Actuator':
+                    continue
+                if childTask.name not in inDegree:
+                    raise Exception(
+                        'Unknown child task: %s of %s' % (
+                            childTask.name, taskName))
+                inDegree[childTask.name] += 1
+        taskOrder = [
+            taskName for taskName in self.taskList if inDegree[taskName] == 0]
+        for taskName in taskOrder:
+            for childTask in application.tasksWithDependency[
+                    taskName].children:
+                if childTask.name == 'Actuator':
+                    continue
+                inDegree[childTask.name] -= 1
+                if inDegree[childTask.name] == 0:
+                    taskOrder.append(childTask.name)
+        if len(taskOrder) != len(self.taskList):
+            raise Exception(
+                'Dependencies of %s have a cycle' % application.name)
+        return taskOrder
 
     def edgeCost(self, sourceComponent: Component, destComponent: Component) \
             -> float:
@@ -160,50 +241,15 @@ class Estimator:
             user=self.user, actor=actor, task=task)
         return taskExecutor, actor
 
-    def elseCostDFS(
+    def convertTaskOnce(
             self,
-            sourceTask: Task,
             individual: List[Actor],
-            currentCost: float,
-            entryCost: List[List[float]],
-            costIndex: int):
-        """
-        A recursive function to find the maximum cost of a graph
-        :param sourceTask: the previous task
-        :param individual: the chromosome, list of int
-        :param currentCost: cost of current recursion
-        :param entryCost: a two dimensions list. x is the number of entries,
-        y is the cost of each step
-        :param costIndex: x
-        :return: tail recursion, see www.geeksforgeeks.org/tail-recursion/
-        """
-        if sourceTask.name == 'Actuator':
-            # if this is the end of current route
-            entryCost[costIndex].append(currentCost)
-            return
-        application = self.user.application
-        # get sourceTask object
-        sourceTask = application.tasksWithDependency[sourceTask.name]
-        if not len(sourceTask.children):
-            # if there is no more task
-            entryCost[costIndex].append(currentCost)
-            return
-        sourceComponent, actor = self.convertTask(individual, sourceTask)
-        for childTask in sourceTask.children:
-            # for each child, estimate the cost of this step
-            destComponent, destActor = self.convertTask(individual, childTask)
-            stepCost = self.sourceToDestCost(
-                sourceComponent=sourceComponent,
-                destComponent=destComponent,
-                destActor=destActor)
-            costIncreased = currentCost + stepCost
-            # estimate the rest
-            self.elseCostDFS(
-                sourceTask=childTask,
-                individual=individual,
-                currentCost=costIncreased,
-                entryCost=entryCost,
-                costIndex=costIndex)
+            task: Task,
+            components: Dict[str, Tuple]) \
+            -> Union[Tuple[Component, Actor], Tuple[Component, None]]:
+        if task.name not in components:
+            components[task.name] = self.convertTask(individual, task)
+        return components[task.name]
 
     def estimateEdgeCost(self, source: Component, dest: Component) -> float:
         """
@@ -220,19 +266,20 @@ class Estimator:
     def edgeLatency(
             self, sourceComponent: Component,
             destComponent: Component) -> float:
-        if sourceComponent.hostID not in self.systemPerformance.latency:
+        latency = self.systemPerformance.latency
+        if sourceComponent.hostID not in latency:
             return .1
-        if destComponent.hostID not in self.systemPerformance.latency:
+        if destComponent.hostID not in latency[sourceComponent.hostID]:
             return .1
-        return self.systemPerformance.latency[sourceComponent.hostID][
-            destComponent.hostID]
+        return latency[sourceComponent.hostID][destComponent.hostID]
 
     def edgeDataRate(self, source: Component, dest: Component) -> float:
-        if source.hostID not in self.systemPerformance.dataRate:
+        dataRate = self.systemPerformance.dataRate
+        if source.hostID not in dataRate:
             return .1
-        if dest.hostID not in self.systemPerformance.dataRate:
+        if dest.hostID not in dataRate[source.hostID]:
             return .1
-        return self.systemPerformance.dataRate[source.hostID][dest.hostID]
+        return dataRate[source.hostID][dest.hostID]
 
     def edgePacketSize(self, source: Component, dest: Component) -> int:
         if source.hostID not in self.systemPerformance.packetSize:
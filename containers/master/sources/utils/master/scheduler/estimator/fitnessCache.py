@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict
+
+import numpy as np
+
+
+# Costs of the individuals estimated recently, shared by the generations of
+# a search and by the searches over the same snapshot. The problem version
+# identifies what the costs depend on besides the individual: the
+# performance snapshot, the application and the actors each choice maps to,
+# see GeneticProblem.problemVersion. Only the maxVersions versions used
+# last are kept, one for each search that may run at the same time, so the
+# costs of an older snapshot are dropped once a newer one is searched. Least
+# recently used costs are dropped beyond maxEntries
+class FitnessCache:
+
+    def __init__(self, maxEntries: int = 4096, maxVersions: int = 4):
+        self.maxEntries = maxEntries
+        self.maxVersions = maxVersions
+        # version -> bytes of an individual -> cost
+        self.versions: OrderedDict[int, OrderedDict[bytes, float]] = \
+            OrderedDict()
+        self.entryNum = 0
+        self.lock: Lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def compact(population: np.ndarray) -> np.ndarray:
+        # Choices are indexes of actors, a byte each is usually enough
+        population = np.asarray(population)
+        if not population.size or population.max() < 1 << 8:
+            return np.ascontiguousarray(population, dtype=np.uint8)
+        if population.max() < 1 << 16:
+            return np.ascontiguousarray(population, dtype=np.uint16)
+        return np.ascontiguousarray(population, dtype=np.int64)
+
+    def lookup(self, version: int, population: np.ndarray) -> np.ndarray:
+        """
+        :param version: problem version
+        :param population: individuals x tasks matrix of choices
+        :return: the cost of each individual, nan if unknown
+        """
+        population = self.compact(population)
+        costs = np.full(len(population), np.nan)
+        self.lock.acquire()
+        entries = self.entriesOf(version)
+        for i, individual in enumerate(population):
+            key = individual.tobytes()
+            if key not in entries:
+                self.misses += 1
+                continue
+            entries.move_to_end(key)
+            costs[i] = entries[key]
+            self.hits += 1
+        self.lock.release()
+        return costs
+
+    def store(self, version: int, population: np.ndarray, costs: np.ndarray):
+        population = self.compact(population)
+        self.lock.acquire()
+        entries = self.entriesOf(version)
+        for individual, cost in zip(population, costs):
+            key = individual.tobytes()
+            if key not in entries:
+                self.entryNum += 1
+            entries[key] = float(cost)
+        while self.entryNum > self.maxEntries:
+            oldest = next(iter(self.versions))
+            self.versions[oldest].popitem(last=False)
+            self.entryNum -= 1
+            if not len(self.versions[oldest]) and oldest != version:
+                del self.versions[oldest]
+        self.lock.release()
+
+    def entriesOf(self, version: int) -> OrderedDict:
+        # The caller holds the lock
+        if version in self.versions:
+            self.versions.move_to_end(version)
+            return self.versions[version]
+        entries = OrderedDict()
+        self.versions[version] = entries
+        while len(self.versions) > self.maxVersions:
+            _, dropped = self.versions.popitem(last=False)
+            self.entryNum -= len(dropped)
+        return entries
+
+    def metrics(self) -> Dict[str, float]:
+        self.lock.acquire()
+        lookups = self.hits + self.misses
+        metrics = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRatio': self.hits / lookups if lookups else 0.,
+            'entries': self.entryNum}
+        self.lock.release()
+        return metrics
@@ -0,0 +1,75 @@
+from random import Random
+
+from .estimator import Estimator
+from ...application.base import Application
+from ...application.task.base import Task
+from ...application.task.dependency.base import TaskWithDependency
+from ...logger.allSystemPerformance import AllSystemPerformance
+from ...registry.roles import Actor
+from ...registry.roles import Master
+from ...registry.roles import User
+from ....types import ComponentRole
+from ....types import CPU
+from ....types import ProcessingTime
+from ....types.hostProfiles import ActorResources
+
+
+def createApplication() -> Application:
+    # Sensor -> A -> (B, C) -> D -> Actuator, plus an entry E without children
+    dependencies = {
+        'A': ({'Sensor'}, {'B', 'C'}),
+        'B': ({'A'}, {'D'}),
+        'C': ({'A'}, {'D', 'Actuator'}),
+        'D': ({'B', 'C'}, {'Actuator'}),
+        'E': ({'Sensor'}, set())}
+    tasksWithDependency = {}
+    for taskName, (parents, children) in dependencies.items():
+        tasksWithDependency[taskName] = TaskWithDependency(
+            name=taskName,
+            parents=set(Task(name) for name in parents),
+            children=set(Task(name) for name in children))
+    entryTasks = [tasksWithDependency['A'], tasksWithDependency['E']]
+    return Application(
+        name='Test',
+        tasksWithDependency=tasksWithDependency,
+        entryTasks=entryTasks)
+
+
+def createEstimator(random: Random) -> Estimator:
+    master = Master(
+        role=ComponentRole.MASTER, addr=('10.0.0.1', 5000), hostID='master')
+    actors = [
+        Actor(
+            addr=('10.0.0.%d' % (i + 2), 5000),
+            hostID='host%d' % i,
+            actorResources=ActorResources(
+                cpu=CPU(cores=i + 1, frequency=1000. * (i + 1))))
+        for i in range(4)]
+    user = User(application=createApplication(), hostID='user')
+    systemPerformance = AllSystemPerformance()
+    taskExecutorNames = [
+        '%s-%s-' % (ComponentRole.TASK_EXECUTOR.value, taskName)
+        for taskName in 'ABCDE']
+    nameConsistents = [master.nameConsistent] + [
+        '%s_%s' % (name, actor.hostID)
+        for name in taskExecutorNames
+        for actor in actors]
+    # Known delays for about half of the edges, estimates for the rest
+    for source in nameConsistents:
+        systemPerformance.delay[source] = {}
+        for dest in nameConsistents:
+            if random.random() < .5:
+                systemPerformance.delay[source][dest] = random.random()
+    for name in taskExecutorNames[:3]:
+        systemPerformance.processingTime[name] = ProcessingTime(
+            taskExecutorName=name, processingTime=random.random() * 100)
+    for nameConsistent in nameConsistents[1::3]:
+        systemPerformance.processingTime[nameConsistent] = ProcessingTime(
+            taskExecutorName=nameConsistent,
+            processingTime=random.random() * 100)
+    return Estimator(
+        user=user,
+        master=master,
+        allActors=actors,
+        systemPerformance=systemPerformance,
+        isContainerMode=False)
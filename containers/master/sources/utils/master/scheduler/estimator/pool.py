@@ -0,0 +1,120 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from threading import Lock
+from time import sleep
+from time import time
+from typing import Optional
+
+import numpy as np
+
+from .compiled import CompiledEstimator
+
+
+def watchParent(parentPID: int):
+    # The Master exits with os._exit, which never tells the workers
+    def watch():
+        while os.getppid() == parentPID:
+            sleep(1)
+        os._exit(0)
+
+    threading.Thread(target=watch, name='ParentWatcher', daemon=True).start()
+
+
+def evaluateChunk(
+        compiledEstimator: CompiledEstimator,
+        population: np.ndarray) -> np.ndarray:
+    return compiledEstimator.evaluate(population)
+
+
+# Worker processes shared by every schedule call of a scheduler. Whether a
+# population is split across them is decided from measurements: how long a
+# task of an individual takes in place, and how much a call to the
+# processes adds on top of its share of that work. A population is only
+# split when each process gets at least minChunkSize individuals. Both ways
+# are tried before they are compared, and the processes start on first use
+class EvaluationPool:
+
+    def __init__(
+            self,
+            processNum: int = 4,
+            minChunkSize: int = 50,
+            smoothing: float = .2):
+        self.processNum = processNum
+        self.minChunkSize = minChunkSize
+        self.smoothing = smoothing
+        # ms per task of an individual evaluated in place
+        self.inPlaceCost: Optional[float] = None
+        # ms a call to the processes adds, without the first call, which
+        # also waits for them to start
+        self.poolOverhead: Optional[float] = None
+        self.poolCalls: int = 0
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.lock: Lock = Lock()
+
+    def evaluate(
+            self,
+            compiledEstimator: CompiledEstimator,
+            population: np.ndarray) -> np.ndarray:
+        population = np.asarray(population, dtype=int)
+        chunkNum = min(self.processNum, len(population) // self.minChunkSize)
+        startTime = time()
+        if chunkNum <= 1 or not self.isWorthSplitting(
+                population.size, chunkNum):
+            costs = compiledEstimator.evaluate(population)
+            if population.size:
+                self.inPlaceCost = self.smooth(
+                    self.inPlaceCost,
+                    (time() - startTime) * 1000 / population.size)
+            return costs
+        executor = self.start()
+        futures = [
+            executor.submit(evaluateChunk, compiledEstimator, chunk)
+            for chunk in np.array_split(population, chunkNum)]
+        costs = np.concatenate([future.result() for future in futures])
+        self.poolCalls += 1
+        if self.poolCalls > 1:
+            overhead = (time() - startTime) * 1000 \
+                       - self.inPlaceCost * population.size / chunkNum
+            self.poolOverhead = self.smooth(self.poolOverhead, overhead)
+        return costs
+
+    def isWorthSplitting(self, size: int, chunkNum: int) -> bool:
+        if self.inPlaceCost is None:
+            return False
+        if self.poolOverhead is None:
+            return True
+        inPlaceTime = self.inPlaceCost * size
+        return inPlaceTime / chunkNum + self.poolOverhead < inPlaceTime
+
+    def smooth(self, average: Optional[float], value: float) -> float:
+        if average is None:
+            return value
+        return (1 - self.smoothing) * average + self.smoothing * value
+
+    def start(self) -> ProcessPoolExecutor:
+        self.lock.acquire()
+        if self.executor is None:
+            # Forking the threads of the Master is not safe
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.processNum,
+                mp_context=get_context('spawn'),
+                initializer=watchParent,
+                initargs=(os.getpid(),))
+        executor = self.executor
+        self.lock.release()
+        return executor
+
+    @property
+    def isRunning(self) -> bool:
+        return self.executor is not None
+
+    def shutdown(self):
+        self.lock.acquire()
+        executor = self.executor
+        self.executor = None
+        self.lock.release()
+        if executor is None:
+            return
+        executor.shutdown(wait=True)
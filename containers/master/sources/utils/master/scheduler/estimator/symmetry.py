@@ -0,0 +1,128 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from .compiled import CompiledEstimator
+
+
+# Encodes the tasks that are interchangeable as how many of them each actor
+# runs, instead of one gene per task. Sibling tasks are interchangeable when
+# they have the same parents, the same children, are all entries or all not,
+# have the same actors to choose from and the same costs on each of them,
+# e.g., the parallel stages of GameOfLifeParallelized. A group of n such
+# tasks over k actors takes k genes, each being a weight from 0 to n, so that
+# the n! orders of one placement are the same individual. Groups are only
+# used when 1 < k < n. decode gives the placement of every task, the first
+# tasks of a group going to the first actors
+class SymmetricEncoding:
+
+    def __init__(self, compiledEstimator: CompiledEstimator):
+        self.compiledEstimator = compiledEstimator
+        self.groups: List[List[int]] = []
+        self.singles: List[int] = []
+        for tasks in self.findSiblings():
+            choiceNum = compiledEstimator.choiceNum[tasks[0]]
+            if len(tasks) > 1 and 1 < choiceNum < len(tasks):
+                self.groups.append(tasks)
+                continue
+            self.singles.extend(tasks)
+        self.singles.sort()
+        self.upperBound = [
+            compiledEstimator.choiceNum[taskIndex] - 1
+            for taskIndex in self.singles]
+        for tasks in self.groups:
+            self.upperBound.extend(
+                len(tasks) for _ in range(compiledEstimator.choiceNum[tasks[0]]))
+        self.variableNum = len(self.upperBound)
+
+    def findSiblings(self, decimals: int = 3) -> List[List[int]]:
+        compiled = self.compiledEstimator
+        estimator = compiled.estimator
+        application = estimator.user.application
+        entries = set(taskIndex for taskIndex, _ in compiled.entryCosts)
+        siblings: Dict[Tuple, List[int]] = {}
+        for taskIndex, taskName in enumerate(estimator.taskList):
+            task = application.tasksWithDependency[taskName]
+            actors = estimator.actorsByTaskName[taskName]
+            costs = compiled.choiceCosts(taskIndex)
+            if costs is not None:
+                # Adding 0 turns -0. into 0.
+                costs = np.round(costs, decimals) + 0.
+                costs = (costs.shape, costs.tobytes())
+            signature = (
+                frozenset(parent.name for parent in task.parents),
+                frozenset(child.name for child in task.children),
+                taskIndex in entries,
+                tuple(
+                    actors[choice].hostID
+                    for choice in compiled.choices[taskIndex]),
+                costs)
+            if signature not in siblings:
+                siblings[signature] = []
+            siblings[signature].append(taskIndex)
+        return list(siblings.values())
+
+    def decode(self, population: np.ndarray) -> np.ndarray:
+        """
+        :param population: individuals x genes matrix
+        :return: individuals x tasks matrix of choices
+        """
+        population = np.asarray(population, dtype=int)
+        if population.ndim == 1:
+            population = population.reshape(1, -1)
+        if not len(self.groups):
+            return population
+        individualNum = population.shape[0]
+        decoded = np.empty(
+            (individualNum, self.compiledEstimator.taskNum), dtype=int)
+        decoded[:, self.singles] = population[:, :len(self.singles)]
+        start = len(self.singles)
+        for tasks in self.groups:
+            choiceNum = self.compiledEstimator.choiceNum[tasks[0]]
+            weights = population[:, start:start + choiceNum]
+            start += choiceNum
+            counts = self.toCounts(weights, len(tasks))
+            # Task j of the group goes to the first choice whose
+            # cumulative count exceeds j
+            ends = np.cumsum(counts, axis=1)
+            replicas = np.arange(len(tasks))
+            decoded[:, tasks] = (ends[:, :, None] <= replicas).sum(axis=1)
+        return decoded
+
+    @staticmethod
+    def toCounts(weights: np.ndarray, total: int) -> np.ndarray:
+        """
+        Scale the weights of each row to integers summing to total, with
+        the largest remainder method
+        """
+        weights = weights.astype(float)
+        sums = weights.sum(axis=1, keepdims=True)
+        # All zero weights share the tasks equally
+        weights[sums[:, 0] == 0] = 1
+        sums = weights.sum(axis=1, keepdims=True)
+        shares = weights / sums * total
+        counts = np.floor(shares).astype(int)
+        remainders = shares - counts
+        missing = total - counts.sum(axis=1)
+        order = np.argsort(-remainders, axis=1, kind='stable')
+        ranks = np.empty_like(order)
+        rows = np.arange(len(order))[:, None]
+        ranks[rows, order] = np.arange(order.shape[1])
+        counts += ranks < missing[:, None]
+        return counts
+
+    def encode(self, indexSequence: List[int]) -> List[int]:
+        """
+        :param indexSequence: choice of each task
+        :return: the genes of it
+        """
+        genes = [int(indexSequence[taskIndex]) for taskIndex in self.singles]
+        for tasks in self.groups:
+            choiceNum = self.compiledEstimator.choiceNum[tasks[0]]
+            counts = np.bincount(
+                [indexSequence[taskIndex] for taskIndex in tasks],
+                minlength=choiceNum)
+            genes.extend(int(count) for count in counts)
+        return genes
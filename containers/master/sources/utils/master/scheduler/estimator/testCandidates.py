@@ -0,0 +1,56 @@
+import unittest
+
+from .candidates import CandidateIndex
+from .estimator import Estimator
+from .fixtures import createApplication
+from ...registry.roles import Actor
+from ....types.hostProfiles import ActorResources
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        images = [
+            {'fogbus2-a:latest', 'fogbus2-b:latest'},
+            {'cloudslab/fogbus2-b:latest', 'fogbus2-c:dev', 'c'},
+            {'fogbus2-a:latest', 'fogbus2-c:latest', 'fogbus2-d:latest',
+             'fogbus2-e:latest'}]
+        self.actors = []
+        for i, actorImages in enumerate(images):
+            self.actors.append(Actor(
+                addr=('10.0.0.%d' % (i + 2), 5000),
+                hostID='host%d' % i,
+                actorResources=ActorResources(images=set(actorImages))))
+        self.application = createApplication()
+        self.index = CandidateIndex()
+        for actor in self.actors:
+            self.index.updateActor(actor)
+
+    def assertSameAsImages(self):
+        table = self.index.candidates(self.application)
+        for taskName in self.application.tasksWithDependency.keys():
+            hostIDs = [
+                actor.hostID for actor in self.actors
+                if Estimator.hasImage(actor, taskName)]
+            self.assertEqual(table[taskName], sorted(hostIDs))
+
+    def testSameAsImages(self):
+        self.assertSameAsImages()
+
+    def testImagesChanged(self):
+        table = self.index.candidates(self.application)
+        self.assertIs(self.index.candidates(self.application), table)
+        self.actors[1].actorResources.images.add('fogbus2-d:latest')
+        self.index.updateActor(self.actors[1])
+        self.assertSameAsImages()
+        self.actors[0].actorResources.images.clear()
+        self.index.updateActor(self.actors[0])
+        self.assertSameAsImages()
+
+    def testActorRemoved(self):
+        self.index.removeActor(self.actors.pop().hostID)
+        self.assertSameAsImages()
+
+
+if __name__ == '__main__':
+    unittest.main()
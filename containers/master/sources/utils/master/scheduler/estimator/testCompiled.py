@@ -0,0 +1,46 @@
+import unittest
+from itertools import product
+from random import Random
+
+import numpy as np
+
+from .compiled import CompiledEstimator
+from .fixtures import createEstimator
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testSameAsEstimator(self):
+        random = Random(0)
+        estimator = createEstimator(random)
+        compiled = CompiledEstimator(estimator)
+        population = np.asarray([
+            [random.randint(0, 3) for _ in range(len(estimator.taskList))]
+            for _ in range(200)])
+        costs = compiled.evaluate(population)
+        for individual, cost in zip(population, costs):
+            self.assertEqual(estimator.estimateCost(list(individual)), cost)
+
+    def testPruneKeepsOptimum(self):
+        # Every placement of 5 tasks on 4 actors
+        population = np.array(list(product(range(4), repeat=5)))
+        for seed in range(10):
+            estimator = createEstimator(Random(seed))
+            compiled = CompiledEstimator(estimator)
+            pruned = CompiledEstimator(estimator, prune=True)
+            self.assertLessEqual(sum(pruned.choiceNum), sum(compiled.choiceNum))
+            prunedPopulation = np.array(list(product(
+                *[range(choiceNum) for choiceNum in pruned.choiceNum])))
+            prunedCosts = pruned.evaluate(prunedPopulation)
+            self.assertAlmostEqual(
+                prunedCosts.min(), compiled.evaluate(population).min())
+            for individual, cost in zip(prunedPopulation, prunedCosts):
+                indexSequence = pruned.expand(individual)
+                self.assertEqual(
+                    pruned.compress(indexSequence), list(individual))
+                self.assertEqual(
+                    estimator.estimateCost(indexSequence), cost)
+
+
+if __name__ == '__main__':
+    unittest.main()
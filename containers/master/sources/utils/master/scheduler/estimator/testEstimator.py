@@ -0,0 +1,70 @@
+import unittest
+from random import Random
+
+from .estimator import Estimator
+from .fixtures import createEstimator
+from ...application.task.base import Task
+
+
+def maximumRouteCost(estimator: Estimator, indexSequence) -> float:
+    # Enumerates every route from every entry, as the estimator used to
+    individual = estimator.mapIndexSequenceToActorSequence(indexSequence)
+    application = estimator.user.application
+    costs = []
+
+    def visit(task, currentCost: float):
+        if task.name == 'Actuator':
+            costs.append(currentCost)
+            return
+        task = application.tasksWithDependency[task.name]
+        if not len(task.children):
+            costs.append(currentCost)
+            return
+        sourceComponent, _ = estimator.convertTask(individual, task)
+        for childTask in task.children:
+            destComponent, destActor = estimator.convertTask(
+                individual, childTask)
+            visit(childTask, currentCost + estimator.sourceToDestCost(
+                sourceComponent=sourceComponent,
+                destComponent=destComponent,
+                destActor=destActor))
+
+    for task, entryCost in zip(
+            application.entryTasks, estimator.entryCost(individual)):
+        costs.append(entryCost)
+        visit(task, entryCost)
+    return max(costs)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testSameAsAllRoutes(self):
+        random = Random(1)
+        estimator = createEstimator(random)
+        for _ in range(200):
+            indexSequence = [
+                random.randint(0, 3) for _ in range(len(estimator.taskList))]
+            self.assertEqual(
+                maximumRouteCost(estimator, indexSequence),
+                estimator.estimateCost(indexSequence))
+
+    def testParentsFirst(self):
+        estimator = createEstimator(Random(1))
+        application = estimator.user.application
+        position = {
+            taskName: i for i, taskName in enumerate(estimator.taskOrder)}
+        for taskName, task in application.tasksWithDependency.items():
+            for childTask in task.children:
+                if childTask.name == 'Actuator':
+                    continue
+                self.assertLess(position[taskName], position[childTask.name])
+
+    def testCycle(self):
+        estimator = createEstimator(Random(1))
+        application = estimator.user.application
+        application.tasksWithDependency['D'].children.add(Task('A'))
+        self.assertRaises(Exception, estimator.sortTasks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from random import Random
+
+import numpy as np
+
+from .fitnessCache import FitnessCache
+from .fixtures import createEstimator
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testLookup(self):
+        cache = FitnessCache()
+        population = np.array([[0, 1, 2], [2, 1, 0]])
+        self.assertTrue(np.isnan(cache.lookup(1, population)).all())
+        cache.store(1, population, np.array([3., 4.]))
+        costs = cache.lookup(1, np.array([[2, 1, 0], [1, 1, 1]]))
+        self.assertEqual(costs[0], 4.)
+        self.assertTrue(np.isnan(costs[1]))
+        # Another snapshot
+        self.assertTrue(np.isnan(cache.lookup(2, population)).all())
+        metrics = cache.metrics()
+        self.assertEqual(metrics['hits'], 1)
+        self.assertEqual(metrics['misses'], 5)
+        self.assertEqual(metrics['entries'], 2)
+
+    def testBounded(self):
+        cache = FitnessCache(maxEntries=2)
+        cache.store(1, np.array([[0], [1]]), np.array([0., 1.]))
+        cache.lookup(1, np.array([[0]]))
+        cache.store(1, np.array([[2]]), np.array([2.]))
+        costs = cache.lookup(1, np.array([[0], [1], [2]]))
+        self.assertEqual(costs[0], 0.)
+        self.assertTrue(np.isnan(costs[1]))
+        self.assertEqual(costs[2], 2.)
+
+    def testOlderVersionsDropped(self):
+        cache = FitnessCache(maxVersions=2)
+        population = np.array([[0, 1], [1, 0]])
+        for version in range(3):
+            cache.store(version, population, np.array([1., 2.]))
+        self.assertEqual(list(cache.versions), [1, 2])
+        self.assertEqual(cache.entryNum, 4)
+        self.assertTrue(np.isnan(cache.lookup(0, population)).all())
+
+    def testCompactKeys(self):
+        self.assertEqual(
+            FitnessCache.compact(np.array([[0, 255]])).dtype, np.uint8)
+        self.assertEqual(
+            FitnessCache.compact(np.array([[0, 256]])).dtype, np.uint16)
+
+    def testSnapshotVersion(self):
+        systemPerformance = createEstimator(Random(0)).systemPerformance
+        snapshot = systemPerformance.snapshot()
+        self.assertEqual(
+            snapshot.version(), systemPerformance.snapshot().version())
+        source = next(iter(systemPerformance.delay))
+        systemPerformance.delay[source]['new'] = 1.
+        self.assertNotEqual(
+            snapshot.version(), systemPerformance.snapshot().version())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from random import Random
+
+import numpy as np
+
+from .compiled import CompiledEstimator
+from .fixtures import createEstimator
+from .pool import EvaluationPool
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        random = Random(2)
+        self.compiledEstimator = CompiledEstimator(createEstimator(random))
+        taskNum = self.compiledEstimator.taskNum
+        self.population = np.asarray([
+            [random.randint(0, 3) for _ in range(taskNum)]
+            for _ in range(1000)])
+
+    def testSmallPopulationInPlace(self):
+        pool = EvaluationPool(processNum=2, minChunkSize=1000)
+        costs = pool.evaluate(self.compiledEstimator, self.population)
+        self.assertFalse(pool.isRunning)
+        self.assertTrue(np.array_equal(
+            self.compiledEstimator.evaluate(self.population), costs))
+
+    def testSameInProcesses(self):
+        pool = EvaluationPool(processNum=2, minChunkSize=100)
+        expected = self.compiledEstimator.evaluate(self.population)
+        # Measured in place first, then tried in the processes
+        for _ in range(3):
+            costs = pool.evaluate(self.compiledEstimator, self.population)
+            self.assertTrue(np.array_equal(expected, costs))
+        self.assertTrue(pool.isRunning)
+        self.assertIsNotNone(pool.inPlaceCost)
+        self.assertIsNotNone(pool.poolOverhead)
+        pool.shutdown()
+        self.assertFalse(pool.isRunning)
+
+    def testSplitWhenMeasuredFaster(self):
+        pool = EvaluationPool(processNum=4)
+        pool.inPlaceCost = .001
+        pool.poolOverhead = 2.
+        # 1 ms in place against .25 ms per process plus 2 ms
+        self.assertFalse(pool.isWorthSplitting(1000, 4))
+        # 10 ms in place against 2.5 ms per process plus 2 ms
+        self.assertTrue(pool.isWorthSplitting(10000, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from itertools import product
+from random import Random
+
+import numpy as np
+
+from .compiled import CompiledEstimator
+from .estimator import Estimator
+from .fixtures import createEstimator
+from .symmetry import SymmetricEncoding
+from ...application.base import Application
+from ...application.task.base import Task
+from ...application.task.dependency.base import TaskWithDependency
+from ...logger.allSystemPerformance import AllSystemPerformance
+from ...registry.roles import Actor
+from ...registry.roles import Master
+from ...registry.roles import User
+from ....types import ComponentRole
+from ....types import CPU
+from ....types import ProcessingTime
+from ....types.hostProfiles import ActorResources
+
+
+def createWideEstimator(replicaNum: int, random: Random) -> Estimator:
+    # Sensor -> Split -> (Stage0 ... StageN) -> Actuator
+    stageNames = ['Stage%d' % i for i in range(replicaNum)]
+    tasksWithDependency = {
+        'Split': TaskWithDependency(
+            name='Split',
+            parents={Task('Sensor')},
+            children=set(Task(name) for name in stageNames))}
+    for name in stageNames:
+        tasksWithDependency[name] = TaskWithDependency(
+            name=name,
+            parents={Task('Split')},
+            children={Task('Actuator')})
+    application = Application(
+        name='Wide',
+        tasksWithDependency=tasksWithDependency,
+        entryTasks=[tasksWithDependency['Split']])
+    master = Master(
+        role=ComponentRole.MASTER, addr=('10.0.0.1', 5000), hostID='master')
+    actors = [
+        Actor(
+            addr=('10.0.0.%d' % (i + 2), 5000),
+            hostID='host%d' % i,
+            actorResources=ActorResources(
+                cpu=CPU(cores=1, frequency=1000.)))
+        for i in range(3)]
+    systemPerformance = AllSystemPerformance()
+    hostIDs = [master.hostID] + [actor.hostID for actor in actors]
+    # Links make every actor worth using for some of the edges
+    for source in hostIDs:
+        systemPerformance.latency[source] = {
+            dest: random.random() for dest in hostIDs}
+    return Estimator(
+        user=User(application=application, hostID='user'),
+        master=master,
+        allActors=actors,
+        systemPerformance=systemPerformance,
+        isContainerMode=False)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testGroups(self):
+        compiled = CompiledEstimator(createWideEstimator(6, Random(0)))
+        encoding = SymmetricEncoding(compiled)
+        self.assertEqual(len(encoding.groups), 1)
+        self.assertEqual(len(encoding.groups[0]), 6)
+        # Split, then a weight for each of the 3 actors
+        self.assertEqual(encoding.variableNum, 4)
+        self.assertEqual(encoding.upperBound, [2, 6, 6, 6])
+
+    def testDifferentCosts(self):
+        estimator = createWideEstimator(6, Random(0))
+        name = '%s-Stage0-' % ComponentRole.TASK_EXECUTOR.value
+        estimator.systemPerformance.processingTime[name] = ProcessingTime(
+            taskExecutorName=name, processingTime=50.)
+        encoding = SymmetricEncoding(CompiledEstimator(estimator))
+        self.assertEqual(len(encoding.groups), 1)
+        self.assertNotIn(
+            estimator.taskNameToIndex['Stage0'], encoding.groups[0])
+        # Split, Stage0, then a weight for each of the 3 actors
+        self.assertEqual(encoding.variableNum, 5)
+
+    def testSingleChoice(self):
+        estimator = createWideEstimator(6, Random(0))
+        compiled = CompiledEstimator(estimator)
+        for i in range(6):
+            taskIndex = estimator.taskNameToIndex['Stage%d' % i]
+            compiled.restrict(taskIndex, np.array([1]))
+        encoding = SymmetricEncoding(compiled)
+        self.assertEqual(len(encoding.groups), 0)
+        self.assertEqual(encoding.upperBound, [2, 0, 0, 0, 0, 0, 0])
+
+    def testNoGroups(self):
+        compiled = CompiledEstimator(createEstimator(Random(0)))
+        encoding = SymmetricEncoding(compiled)
+        self.assertEqual(len(encoding.groups), 0)
+        population = np.array([[0, 1, 2, 3, 0], [3, 2, 1, 0, 3]])
+        self.assertTrue((encoding.decode(population) == population).all())
+
+    def testCounts(self):
+        weights = np.array(list(product(range(7), repeat=3)))
+        counts = SymmetricEncoding.toCounts(weights, 6)
+        self.assertTrue((counts.sum(axis=1) == 6).all())
+        self.assertTrue((counts >= 0).all())
+        exact = weights.sum(axis=1) == 6
+        self.assertTrue((counts[exact] == weights[exact]).all())
+
+    def testSameOptimum(self):
+        for seed in range(5):
+            compiled = CompiledEstimator(createWideEstimator(6, Random(seed)))
+            encoding = SymmetricEncoding(compiled)
+            population = np.array(list(product(range(3), repeat=7)))
+            genes = np.array(list(product(
+                *[range(bound + 1) for bound in encoding.upperBound])))
+            decoded = encoding.decode(genes)
+            self.assertAlmostEqual(
+                compiled.evaluate(decoded).min(),
+                compiled.evaluate(population).min())
+            for individual in population[::50]:
+                encoded = encoding.encode(list(individual))
+                self.assertEqual(
+                    encoding.decode(encoded)[0][0], individual[0])
+                self.assertEqual(
+                    sorted(encoding.decode(encoded)[0][1:]),
+                    sorted(individual[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,3 @@
+from .placement import heftIndexSequence
+from .placement import upwardRanks
+from .base import HEFT
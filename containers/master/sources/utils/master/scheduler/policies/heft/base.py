@@ -0,0 +1,127 @@
+from threading import Lock
+from time import time
+from typing import List
+from typing import Set
+from typing import Union
+
+from .placement import heftIndexSequence
+from ..nsga.scaler.base import NSGAScaler
+from ...base import BaseScheduler
+from ...estimator import CompiledEstimator
+from ...estimator import Estimator
+from ...types import Decision
+from ....logger.allSystemPerformance import AllSystemPerformance
+from ....registry.roles import User
+from ....registry.roles.actor import Actor
+from ....registry.roles.master import Master
+from .....component.basic import BasicComponent
+from .....types import Address
+from .....types import Component
+
+
+# Places each user with one HEFT pass over the same cost model the GA
+# policies use, which takes milliseconds instead of seconds
+class HEFT(BaseScheduler):
+
+    def __init__(
+            self,
+            knownMasters: Set[Address],
+            minimumActors: int,
+            basicComponent: BasicComponent,
+            isContainerMode: bool,
+            concurrentSchedules: int = 4):
+        BaseScheduler.__init__(
+            self,
+            schedulerName='HEFT',
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules)
+        self.knownMasters = knownMasters
+        self.minimumActors = minimumActors
+        self.basicComponent = basicComponent
+        # The estimator of the latest schedule call, used to pick a Master
+        self.estimator: Union[Estimator, None] = None
+        self.lock = Lock()
+
+    def _schedule(
+            self,
+            user: User,
+            master: Master,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance,
+            isContainerMode: bool,
+            *args,
+            **kwargs) -> Decision:
+        startTime = time() * 1000
+        estimator = Estimator(
+            user=user,
+            master=master,
+            allActors=allActors,
+            systemPerformance=systemPerformance,
+            isContainerMode=isContainerMode,
+            candidateIndex=self.candidateIndex)
+        compiledEstimator = CompiledEstimator(estimator)
+        indexSequence = heftIndexSequence(compiledEstimator)
+        cost = float(compiledEstimator.evaluate(indexSequence)[0])
+        hostIDSequence = estimator.mapIndexSequenceToHostIDSequence(
+            indexSequence)
+        actorIndexes = {
+            actor.hostID: str(i) for i, actor in enumerate(allActors)}
+        indexToHostID = {
+            index: hostID for hostID, index in actorIndexes.items()}
+        schedulingTime = time() * 1000 - startTime
+        decision = Decision(
+            user=user,
+            indexSequence=[actorIndexes[hostID] for hostID in hostIDSequence],
+            indexToHostID=indexToHostID,
+            schedulingTime=schedulingTime,
+            cost=cost)
+        self.lock.acquire()
+        self.estimator = estimator
+        self.lock.release()
+        return decision
+
+    def getBestMaster(
+            self,
+            user: User,
+            knownMasters: List[Component],
+            *args,
+            **kwargs) -> Union[Component, None]:
+        if not len(knownMasters):
+            return None
+        self.lock.acquire()
+        estimator = self.estimator
+        self.lock.release()
+        if estimator is None:
+            return knownMasters[0]
+        return min(
+            knownMasters,
+            key=lambda master: estimator.latencyRoundTrip(
+                sourceComponent=user,
+                destComponent=master))
+
+    def prepareScaler(
+            self,
+            user: User,
+            master: Master,
+            allActors: List[Actor],
+            systemPerformance: AllSystemPerformance,
+            isContainerMode: bool,
+            *args,
+            **kwargs) -> NSGAScaler:
+        estimator = Estimator(
+            user=user,
+            master=master,
+            allActors=allActors,
+            systemPerformance=systemPerformance,
+            isContainerMode=isContainerMode,
+            candidateIndex=self.candidateIndex)
+        # The new Master runs HEFT too, so the thread number only keeps
+        # its default
+        scaler = NSGAScaler(
+            knownMasters=self.knownMasters,
+            schedulerName=self.name,
+            minimumActors=self.minimumActors,
+            estimationThreadNum=4,
+            estimator=estimator,
+            basicComponent=self.basicComponent)
+        return scaler
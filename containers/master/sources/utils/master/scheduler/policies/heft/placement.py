@@ -0,0 +1,73 @@
+from typing import List
+
+import numpy as np
+
+from ...estimator import CompiledEstimator
+
+
+def upwardRanks(compiledEstimator: CompiledEstimator) -> np.ndarray:
+    """
+    Average cost from the start of each task to the end of the application
+    :param compiledEstimator: compiled tables of the application
+    :return: the rank of each task
+    """
+    compiled = compiledEstimator
+    childrenOf: List[List[int]] = [[] for _ in range(compiled.taskNum)]
+    for parentIndex, childIndex in compiled.edgeCosts.keys():
+        childrenOf[parentIndex].append(childIndex)
+    ranks = np.zeros(compiled.taskNum)
+    for taskIndex in reversed(compiled.order):
+        rank = .0
+        if taskIndex in compiled.actuatorCosts:
+            rank = compiled.actuatorCosts[taskIndex].mean()
+        for childIndex in childrenOf[taskIndex]:
+            rank = max(
+                rank,
+                compiled.edgeCosts[(taskIndex, childIndex)].mean()
+                + ranks[childIndex])
+        ranks[taskIndex] = rank
+    return ranks
+
+
+def heftIndexSequence(compiledEstimator: CompiledEstimator) -> List[int]:
+    """
+    Heterogeneous Earliest Finish Time placement on the Estimator cost model.
+    Tasks are visited by decreasing upward rank, which keeps every parent
+    before its children, and each one goes to the actor on which it
+    finishes earliest given where its parents went
+    :param compiledEstimator: compiled tables of the application
+    :return: the index sequence, with the same encoding as the GA individuals
+    """
+    compiled = compiledEstimator
+    ranks = upwardRanks(compiled)
+    position = {taskIndex: i for i, taskIndex in enumerate(compiled.order)}
+    order = sorted(
+        compiled.order,
+        key=lambda taskIndex: (-ranks[taskIndex], position[taskIndex]))
+    entryCosts = {}
+    for taskIndex, costs in compiled.entryCosts:
+        if taskIndex in entryCosts:
+            costs = np.maximum(entryCosts[taskIndex], costs)
+        entryCosts[taskIndex] = costs
+    indexSequence = [0 for _ in range(compiled.taskNum)]
+    finish = np.zeros(compiled.taskNum)
+    for taskIndex in order:
+        # Tasks not reachable from any entry start at 0
+        finishCosts = np.zeros(compiled.choiceNum[taskIndex])
+        if taskIndex in entryCosts:
+            finishCosts = entryCosts[taskIndex].copy()
+        for parentIndex in compiled.parentsOf[taskIndex]:
+            stepCosts = compiled.edgeCosts[(parentIndex, taskIndex)][
+                indexSequence[parentIndex]]
+            np.maximum(
+                finishCosts, finish[parentIndex] + stepCosts,
+                out=finishCosts)
+        # The Actuator runs on the Master, so sending the result back is
+        # part of finishing an exit task
+        selectCosts = finishCosts
+        if taskIndex in compiled.actuatorCosts:
+            selectCosts = finishCosts + compiled.actuatorCosts[taskIndex]
+        choice = int(np.argmin(selectCosts))
+        indexSequence[taskIndex] = choice
+        finish[taskIndex] = finishCosts[choice]
+    return indexSequence
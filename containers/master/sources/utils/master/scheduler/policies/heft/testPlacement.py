@@ -0,0 +1,45 @@
+import unittest
+from itertools import product
+from random import Random
+
+import numpy as np
+
+from .placement import heftIndexSequence
+from .placement import upwardRanks
+from ...estimator import CompiledEstimator
+from ...estimator.fixtures import createEstimator
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testRanksFollowDependencies(self):
+        compiled = CompiledEstimator(createEstimator(Random(0)))
+        ranks = upwardRanks(compiled)
+        for parentIndex, childIndex in compiled.edgeCosts.keys():
+            self.assertGreaterEqual(ranks[parentIndex], ranks[childIndex])
+
+    def testCostMatchesEstimator(self):
+        for seed in range(10):
+            estimator = createEstimator(Random(seed))
+            compiled = CompiledEstimator(estimator)
+            indexSequence = heftIndexSequence(compiled)
+            self.assertEqual(len(indexSequence), compiled.taskNum)
+            for taskIndex, choice in enumerate(indexSequence):
+                self.assertLess(choice, compiled.choiceNum[taskIndex])
+            self.assertAlmostEqual(
+                compiled.evaluate(indexSequence)[0],
+                estimator.estimateCost(indexSequence))
+
+    def testCloseToOptimum(self):
+        # Every placement of 5 tasks on 4 actors
+        population = np.array(list(product(range(4), repeat=5)))
+        for seed in range(10):
+            compiled = CompiledEstimator(createEstimator(Random(seed)))
+            costs = compiled.evaluate(population)
+            cost = compiled.evaluate(heftIndexSequence(compiled))[0]
+            self.assertLessEqual(cost, np.median(costs))
+            self.assertLessEqual(cost, costs.min() * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import json
 import os
 from abc import abstractmethod
+from math import ceil
 from random import randint
 from threading import Lock
 from time import time
@@ -23,8 +24,11 @@ from pymoo.optimize import minimize as geneticMinimize
 from .geneticProblem import GeneticProblem
 from .scaler.base import NSGAScaler
 from .selections.tournament import TournamentSelection
-from .termination import TimeBasedSingleObjectiveDefaultTermination
+from .termination import AnytimeTermination
 from ...base import BaseScheduler
+from ...decisionCache import DecisionCache
+from ...estimator import EvaluationPool
+from ...estimator import FitnessCache
 from ...types import Decision
 from ....logger.allSystemPerformance import AllSystemPerformance
 from ....registry.roles import User
@@ -47,18 +51,34 @@ class BaseNSGA(BaseScheduler):
             populationSize: int,
             basicComponent: BasicComponent,
             estimationThreadNum: int,
-            isContainerMode: bool):
+            isContainerMode: bool,
+            concurrentSchedules: int = 4,
+            decisionCacheAge: float = 300,
+            schedulingBudget: float = 5000,
+            convergenceEpsilon: float = 1e-3,
+            convergencePatience: int = 10):
         BaseScheduler.__init__(
-            self, schedulerName=schedulerName, isContainerMode=isContainerMode)
+            self,
+            schedulerName=schedulerName,
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules)
         self.knownMasters = knownMasters
         self.minimumActors = minimumActors
         self.basicComponent = basicComponent
         self.generationNum = generationNum
         self.populationSize = populationSize
         self.decisionHistory: Dict[str, List[Decision]] = {}
-        self.geneticAlgorithm: GeneticAlgorithm = None
+        # The problem of the latest schedule call, used by the scaler
         self.geneticProblem: GeneticProblem = None
         self.estimationThreadNum = estimationThreadNum
+        self.evaluationPool = EvaluationPool(processNum=estimationThreadNum)
+        self.fitnessCache = FitnessCache(maxVersions=concurrentSchedules)
+        if decisionCacheAge > 0:
+            self.decisionCache = DecisionCache(maxAge=decisionCacheAge)
+        # ms a search can take when the user asks for no budget
+        self.schedulingBudget = schedulingBudget
+        self.convergenceEpsilon = convergenceEpsilon
+        self.convergencePatience = convergencePatience
         self.lock = Lock()
 
     def _schedule(
@@ -67,42 +87,65 @@ class BaseNSGA(BaseScheduler):
             master: Master,
             allActors: List[Actor],
             systemPerformance: AllSystemPerformance,
-            isContainerMode: bool) -> Decision:
-        self.joinWaiting()
-        self.lock.acquire()
-        self.geneticProblem = self.prepareGeneticProblem(
+            isContainerMode: bool,
+            queueingTime: float = 0,
+            *args,
+            **kwargs) -> Decision:
+        # Every call has its own problem and algorithm, so several users
+        # can be scheduled at the same time
+        geneticProblem = self.prepareGeneticProblem(
             user=user,
             master=master,
             allActors=allActors,
             systemPerformance=systemPerformance,
             isContainerMode=isContainerMode)
-        self.geneticAlgorithm = self.prepareGeneticAlgorithm(
+        geneticAlgorithm = self.prepareGeneticAlgorithm(
             application=user.application,
-            estimator=self.geneticProblem.estimator)
+            geneticProblem=geneticProblem)
         self.basicComponent.debugLogger.debug(
             'Scheduling using: %s', self.name)
-        termination = TimeBasedSingleObjectiveDefaultTermination(
-            maxTime=5,
-            x_tol=1e-8,
-            cv_tol=1e-6,
-            f_tol=1e-6,
-            nth_gen=5,
-            n_last=self.generationNum % 10,
-            n_max_gen=self.generationNum,
-            n_max_evals=self.generationNum >> 1)
+        budget = self.searchBudget(user, queueingTime)
+        termination = AnytimeTermination(
+            budget=budget / 1000,
+            epsilon=self.convergenceEpsilon,
+            patience=self.convergencePatience,
+            maxGenerations=self.generationNum)
         startTime = time() * 1000
         result = geneticMinimize(
-            problem=self.geneticProblem,
-            algorithm=self.geneticAlgorithm,
+            problem=geneticProblem,
+            algorithm=geneticAlgorithm,
             seed=randint(0, 100),
             termination=termination)
         schedulingTime = time() * 1000 - startTime
+        self.basicComponent.debugLogger.debug(
+            'Search for %s stopped by %s after %d generations, '
+            'budget %.2f ms',
+            user.application.nameWithLabel,
+            termination.reason,
+            len(termination.bestCosts),
+            budget)
         decision = self.handleNSGAResult(
-            user=user, result=result, schedulingTime=schedulingTime)
-        self.leaveWaiting()
-        self.lock.release()
+            user=user,
+            result=result,
+            schedulingTime=schedulingTime,
+            geneticProblem=geneticProblem)
         return decision
 
+    def searchBudget(self, user: User, queueingTime: float) -> float:
+        """
+        :param user: the user being scheduled
+        :param queueingTime: ms the request has waited
+        :return: ms the search can take
+        """
+        budget = self.schedulingBudget
+        if user.schedulingBudget > 0:
+            budget = user.schedulingBudget - queueingTime
+        # The searches running and waiting share the slots, each one taking
+        # its whole budget would make those behind it miss theirs
+        rounds = ceil(self.readWaitingCount() / self.concurrentSchedules)
+        budget /= max(rounds, 1)
+        return max(budget, 0)
+
     def prepareGeneticProblem(
             self,
             user: User,
@@ -119,9 +162,15 @@ class BaseNSGA(BaseScheduler):
             allActors=allActors,
             populationSize=self.populationSize,
             threadNum=self.estimationThreadNum,
+            evaluationPool=self.evaluationPool,
+            candidateIndex=self.candidateIndex,
+            fitnessCache=self.fitnessCache,
             isContainerMode=isContainerMode)
         return geneticProblem
 
+    def shutdown(self):
+        self.evaluationPool.shutdown()
+
     @abstractmethod
     def prepareGeneticAlgorithm(self, *args, **kwargs) -> GeneticAlgorithm:
         pass
@@ -137,8 +186,12 @@ class BaseNSGA(BaseScheduler):
             except PermissionError:
                 pass
 
-    def handleNSGAResult(self, user: User, result, schedulingTime: float) -> \
-            Decision:
+    def handleNSGAResult(
+            self,
+            user: User,
+            result,
+            schedulingTime: float,
+            geneticProblem: GeneticProblem) -> Decision:
         if len(result.X.shape) > 1:
             minIndex = np.argmin(result.F)
             cost = result.F[minIndex][0]
@@ -147,19 +200,27 @@ class BaseNSGA(BaseScheduler):
         else:
             cost = result.F[0]
             indexSequence = list(result.X.astype(int))
-        indexToHostID = self.geneticProblem.estimator.mapIndexSequenceToHostIDSequence(
-            indexSequence)
-        self.saveEstimatingProgress(self.geneticProblem.evaluationRecords)
+        # Concrete placement of every task
+        indexSequence = geneticProblem.encoding.decode(indexSequence)[0]
+        indexSequence = geneticProblem.compiledEstimator.expand(indexSequence)
+        indexToHostID = \
+            geneticProblem.estimator.mapIndexSequenceToHostIDSequence(
+                indexSequence)
         decision = Decision(
             user=user,
             indexSequence=indexSequence,
             cost=cost,
             indexToHostID=indexToHostID,
             schedulingTime=schedulingTime,
-            evaluationRecord=self.geneticProblem.evaluationRecords)
+            evaluationRecord=geneticProblem.evaluationRecords,
+            savedEvaluationRecord=geneticProblem.savedEvaluationRecords)
+        self.lock.acquire()
+        self.geneticProblem = geneticProblem
+        self.saveEstimatingProgress(geneticProblem.evaluationRecords)
         if user.application.nameWithLabel not in self.decisionHistory:
             self.decisionHistory[user.application.nameWithLabel] = []
         self.decisionHistory[user.application.nameWithLabel].append(decision)
+        self.lock.release()
         return decision
 
     @staticmethod
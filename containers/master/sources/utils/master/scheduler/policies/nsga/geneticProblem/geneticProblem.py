@@ -1,14 +1,15 @@
-from queue import Queue
-from threading import Event
-from threading import Thread
 from typing import Dict
 from typing import List
-from typing import Tuple
 
 import numpy as np
 from pymoo.model.problem import Problem
 
+from ....estimator import CandidateIndex
+from ....estimator import CompiledEstimator
 from ....estimator import Estimator
+from ....estimator import EvaluationPool
+from ....estimator import FitnessCache
+from ....estimator import SymmetricEncoding
 from .....logger.allSystemPerformance import AllSystemPerformance
 from .....registry.roles import Actor
 from .....registry.roles import Master
@@ -26,26 +27,33 @@ class GeneticProblem(Problem):
             allActors: List[Actor],
             isContainerMode: bool,
             populationSize: int,
-            threadNum: int = 4):
+            threadNum: int = 4,
+            evaluationPool: EvaluationPool = None,
+            candidateIndex: CandidateIndex = None,
+            fitnessCache: FitnessCache = None):
         self.threadNum = threadNum
         self.populationSize = populationSize
-        self.individualEvents = [Event() for _ in range(self.populationSize)]
-        self.individualQueue: Queue[Tuple[int, List[int], Event]] = Queue()
-        self.result = np.asarray([.0 for _ in range(self.populationSize)])
-        self.runEvaluationThreadPool(threadNum=threadNum)
+        self.evaluationPool = evaluationPool
+        self.fitnessCache = fitnessCache
 
         self.estimator = Estimator(
             user=user,
             master=master,
             systemPerformance=systemPerformance,
             allActors=allActors,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            candidateIndex=candidateIndex)
+        # Genes are choices among the actors left after pruning, see
+        # CompiledEstimator.expand
+        self.compiledEstimator = CompiledEstimator(self.estimator, prune=True)
+        # Interchangeable tasks share genes, see SymmetricEncoding.decode
+        self.encoding = SymmetricEncoding(self.compiledEstimator)
 
-        self.choicesEachVariable = [len(actors) - 1 for actors in
-                                    self.estimator.actorsByTaskName.values()]
-        self.variableNum = len(self.estimator.taskList)
+        self.choicesEachVariable = [
+            choiceNum - 1 for choiceNum in self.compiledEstimator.choiceNum]
+        self.variableNum = self.encoding.variableNum
         self.lowerBound = [0 for _ in range(self.variableNum)]
-        self.upperBound = self.choicesEachVariable
+        self.upperBound = self.encoding.upperBound
         Problem.__init__(
             self,
             xl=self.lowerBound,
@@ -53,7 +61,10 @@ class GeneticProblem(Problem):
             n_obj=1,
             n_var=self.variableNum,
             type_var=np.int)
+        self.version = self.problemVersion(systemPerformance)
         self.evaluationRecords = []
+        # Individuals of each generation whose cost was not estimated again
+        self.savedEvaluationRecords = []
 
     def getChoicesEachVariable(self, actorsByTaskName: Dict[str, Actor]) \
             -> List[int]:
@@ -69,22 +80,47 @@ class GeneticProblem(Problem):
             i += 1
         return choicesEachVariable
 
-    def runEvaluationThreadPool(self, threadNum: int = 4):
-        for i in range(threadNum):
-            Thread(target=self.estimationThread).start()
-
-    def estimationThread(self):
-        while True:
-            i, individual, event = self.individualQueue.get()
-            self.result[i] = self.estimator.estimateCost(individual)
-            event.set()
+    def problemVersion(self, systemPerformance: AllSystemPerformance) -> int:
+        """
+        :param systemPerformance: the snapshot being scheduled over
+        :return: equal for problems whose individuals cost the same
+        """
+        estimator = self.estimator
+        choices = []
+        for taskIndex, taskName in enumerate(estimator.taskList):
+            actors = estimator.actorsByTaskName[taskName]
+            choices.append(tuple(
+                (actors[choice].hostID,
+                 actors[choice].actorResources.cpu.cores,
+                 actors[choice].actorResources.cpu.frequency)
+                for choice in self.compiledEstimator.choices[taskIndex]))
+        return hash((
+            systemPerformance.version(),
+            estimator.user.application.nameWithLabel,
+            estimator.master.nameConsistent,
+            tuple(choices)))
 
     def _evaluate(self, indexSequenceList, out, *args, **kwargs):
-        for i, indexSequence in enumerate(indexSequenceList):
-            self.individualQueue.put(
-                (i, indexSequence, self.individualEvents[i]))
-        for event in self.individualEvents:
-            event.wait()
-            event.clear()
-        out['F'] = self.result
+        indexSequenceList = self.encoding.decode(indexSequenceList)
+        # Each distinct individual is estimated at most once
+        individuals, inverse = np.unique(
+            indexSequenceList, axis=0, return_inverse=True)
+        if self.fitnessCache is None:
+            costs = np.full(len(individuals), np.nan)
+        else:
+            costs = self.fitnessCache.lookup(self.version, individuals)
+        isMissing = np.isnan(costs)
+        if isMissing.any():
+            missing = individuals[isMissing]
+            if self.evaluationPool is None:
+                costs[isMissing] = self.compiledEstimator.evaluate(missing)
+            else:
+                costs[isMissing] = self.evaluationPool.evaluate(
+                    self.compiledEstimator, missing)
+            if self.fitnessCache is not None:
+                self.fitnessCache.store(
+                    self.version, missing, costs[isMissing])
+        out['F'] = costs[inverse.reshape(-1)]
         self.evaluationRecords.append(min(out['F']))
+        self.savedEvaluationRecords.append(
+            int(len(indexSequenceList) - isMissing.sum()))
@@ -4,8 +4,9 @@ from pymoo.algorithms.genetic_algorithm import GeneticAlgorithm
 from pymoo.algorithms.nsga2 import NSGA2 as NSGA2_
 
 from .base import BaseNSGA
-from ...estimator import Estimator
+from .geneticProblem import GeneticProblem
 from .tools.randomPopulation import randomPopulation
+from ..heft.placement import heftIndexSequence
 from ....application.base import Application
 from .....component.basic import BasicComponent
 from .....types import Address
@@ -22,6 +23,9 @@ class NSGA2(BaseNSGA):
             basicComponent: BasicComponent,
             estimationThreadNum: int,
             isContainerMode: bool,
+            concurrentSchedules: int = 4,
+            decisionCacheAge: float = 300,
+            schedulingBudget: float = 5000,
             historyRatio: float = .5, ):
         BaseNSGA.__init__(
             self,
@@ -32,30 +36,36 @@ class NSGA2(BaseNSGA):
             populationSize=populationSize,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules,
+            decisionCacheAge=decisionCacheAge,
+            schedulingBudget=schedulingBudget)
         self.historyRatio = historyRatio
 
     def prepareGeneticAlgorithm(
-            self, application: Application, estimator: Estimator) \
+            self, application: Application, geneticProblem: GeneticProblem) \
             -> GeneticAlgorithm:
         selection, crossover, mutation = self.getDefaultTriple()
-        initPopulation = self.generateInitPopulation()
+        initPopulation = self.generateInitPopulation(geneticProblem)
         geneticAlgorithm = NSGA2_(
             pop_size=self.populationSize,
             sampling=initPopulation,
             crossover=crossover,
             mutation=mutation,
             selection=selection,
-            eliminate_duplicates=False)
+            eliminate_duplicates=True)
         return geneticAlgorithm
 
-    def generateInitPopulation(self):
-        upperBounds = self.geneticProblem.upperBound
+    def generateInitPopulation(self, geneticProblem: GeneticProblem):
+        upperBounds = geneticProblem.upperBound
         lowerBounds = [0 for _ in range(len(upperBounds))]
-        variableNum = self.geneticProblem.variableNum
+        variableNum = geneticProblem.variableNum
         initPopulation = randomPopulation(
             lowerBounds=lowerBounds,
             upperBounds=upperBounds,
             variableNum=variableNum,
             populationSize=self.populationSize)
+        # Start the search from the HEFT placement
+        initPopulation[0] = geneticProblem.encoding.encode(
+            heftIndexSequence(geneticProblem.compiledEstimator))
         return initPopulation
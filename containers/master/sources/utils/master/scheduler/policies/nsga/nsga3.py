@@ -5,8 +5,9 @@ from pymoo.algorithms.nsga3 import NSGA3 as NSGA3_
 from pymoo.factory import get_reference_directions
 
 from .base import BaseNSGA
-from ...estimator import Estimator
+from .geneticProblem import GeneticProblem
 from .tools.randomPopulation import randomPopulation
+from ..heft.placement import heftIndexSequence
 from ....application.base import Application
 from .....component.basic import BasicComponent
 from .....types import Address
@@ -23,6 +24,9 @@ class NSGA3(BaseNSGA):
             basicComponent: BasicComponent,
             estimationThreadNum: int,
             isContainerMode: bool,
+            concurrentSchedules: int = 4,
+            decisionCacheAge: float = 300,
+            schedulingBudget: float = 5000,
             historyRatio: float = .5, ):
         BaseNSGA.__init__(
             self,
@@ -33,14 +37,17 @@ class NSGA3(BaseNSGA):
             populationSize=populationSize,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules,
+            decisionCacheAge=decisionCacheAge,
+            schedulingBudget=schedulingBudget)
         self.historyRatio = historyRatio
 
     def prepareGeneticAlgorithm(
-            self, application: Application, estimator: Estimator) \
+            self, application: Application, geneticProblem: GeneticProblem) \
             -> GeneticAlgorithm:
         selection, crossover, mutation = self.getDefaultTriple()
-        initPopulation = self.generateInitPopulation()
+        initPopulation = self.generateInitPopulation(geneticProblem)
         refDirs = get_reference_directions("das-dennis", 1, n_partitions=1)
         geneticAlgorithm = NSGA3_(
             pop_size=self.populationSize,
@@ -48,17 +55,20 @@ class NSGA3(BaseNSGA):
             crossover=crossover,
             mutation=mutation,
             ref_dirs=refDirs,
-            eliminate_duplicates=False)
+            eliminate_duplicates=True)
 
         return geneticAlgorithm
 
-    def generateInitPopulation(self):
-        upperBounds = self.geneticProblem.upperBound
+    def generateInitPopulation(self, geneticProblem: GeneticProblem):
+        upperBounds = geneticProblem.upperBound
         lowerBounds = [0 for _ in range(len(upperBounds))]
-        variableNum = self.geneticProblem.variableNum
+        variableNum = geneticProblem.variableNum
         initPopulation = randomPopulation(
             lowerBounds=lowerBounds,
             upperBounds=upperBounds,
             variableNum=variableNum,
             populationSize=self.populationSize)
+        # Start the search from the HEFT placement
+        initPopulation[0] = geneticProblem.encoding.encode(
+            heftIndexSequence(geneticProblem.compiledEstimator))
         return initPopulation
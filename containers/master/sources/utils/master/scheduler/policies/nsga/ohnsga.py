@@ -7,8 +7,9 @@ from pymoo.model.evaluator import Evaluator as Evaluator_
 from pymoo.model.population import Population
 
 from .base import BaseNSGA
-from ...estimator import Estimator
+from .geneticProblem import GeneticProblem
 from .tools.randomPopulation import randomPopulation
+from ..heft.placement import heftIndexSequence
 from ....application.base import Application
 from .....component.basic import BasicComponent
 from .....types import Address
@@ -25,6 +26,9 @@ class OHNSGA(BaseNSGA):
             basicComponent: BasicComponent,
             estimationThreadNum: int,
             isContainerMode: bool,
+            concurrentSchedules: int = 4,
+            decisionCacheAge: float = 300,
+            schedulingBudget: float = 5000,
             historyRatio: float = .5):
         BaseNSGA.__init__(
             self,
@@ -35,52 +39,73 @@ class OHNSGA(BaseNSGA):
             populationSize=populationSize,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules,
+            decisionCacheAge=decisionCacheAge,
+            schedulingBudget=schedulingBudget)
         self.historyRatio = historyRatio
 
     def prepareGeneticAlgorithm(
-            self, application: Application, estimator: Estimator) \
+            self, application: Application, geneticProblem: GeneticProblem) \
             -> GeneticAlgorithm:
         selection, crossover, mutation = self.getDefaultTriple()
         initPopulation = self.generateInitPopulation(
-            application=application, estimator=estimator)
+            application=application, geneticProblem=geneticProblem)
         geneticAlgorithm = NSGA2_(
             pop_size=self.populationSize,
             sampling=initPopulation,
             crossover=crossover,
             mutation=mutation,
             selection=selection,
-            eliminate_duplicates=False)
+            eliminate_duplicates=True)
         return geneticAlgorithm
 
     def generateInitPopulation(
-            self, application: Application, estimator: Estimator):
+            self, application: Application, geneticProblem: GeneticProblem):
+        self.lock.acquire()
         if application.nameWithLabel not in self.decisionHistory:
             decisionHistory = []
         else:
-            decisionHistory = self.decisionHistory[application.nameWithLabel]
+            decisionHistory = list(
+                self.decisionHistory[application.nameWithLabel])
+        self.lock.release()
         numDecisionHistory = len(decisionHistory)
         numDecisionToUse = int(numDecisionHistory * self.historyRatio)
         decisionHistory = decisionHistory[-numDecisionToUse:]
         indexSequences = self.understandHistory(
             decisionHistory=decisionHistory,
-            estimator=estimator)
-        initPopulation = self.fillWithRandomIndexSequence(indexSequences)
+            geneticProblem=geneticProblem)
+        # Start the search from the HEFT placement as well
+        indexSequences.insert(0, geneticProblem.encoding.encode(
+            heftIndexSequence(geneticProblem.compiledEstimator)))
+        initPopulation = self.fillWithRandomIndexSequence(
+            indexSequences, geneticProblem)
         return initPopulation
 
     @staticmethod
-    def understandHistory(decisionHistory, estimator):
-        indexSequences = [[] for _ in range(len(decisionHistory))]
-        for i, decision in enumerate(decisionHistory):
+    def understandHistory(decisionHistory, geneticProblem: GeneticProblem):
+        estimator = geneticProblem.estimator
+        indexSequences = []
+        for decision in decisionHistory:
             hostIDSequence = decision.hostIDSequence()
-            indexSequences[i] = \
+            indexSequence = \
                 estimator.mapHostIDSequenceToIndexSequence(hostIDSequence)
+            indexSequence = geneticProblem.compiledEstimator.compress(
+                indexSequence)
+            if indexSequence is None:
+                # Uses an actor that is dominated now
+                continue
+            indexSequences.append(
+                geneticProblem.encoding.encode(indexSequence))
         return indexSequences
 
-    def fillWithRandomIndexSequence(self, indexSequences: List[List[int]]):
-        upperBounds = self.geneticProblem.upperBound
+    def fillWithRandomIndexSequence(
+            self,
+            indexSequences: List[List[int]],
+            geneticProblem: GeneticProblem):
+        upperBounds = geneticProblem.upperBound
         lowerBounds = [0 for _ in range(len(upperBounds))]
-        variableNum = self.geneticProblem.variableNum
+        variableNum = geneticProblem.variableNum
         indexSequencesRandom = randomPopulation(
             lowerBounds=lowerBounds,
             upperBounds=upperBounds,
@@ -91,7 +116,7 @@ class OHNSGA(BaseNSGA):
             indexSequencesRandom[i] = indexSequence
 
         population = Population.new("X", indexSequencesRandom)
-        Evaluator_().eval(self.geneticProblem, population)
+        Evaluator_().eval(geneticProblem, population)
         for i in range(len(population)):
             population[i].CV = population[i].F
         return population
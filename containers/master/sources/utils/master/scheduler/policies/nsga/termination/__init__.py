@@ -1,2 +1,3 @@
 from .timeBasedSingleObjectiveDefaultTermination import \
     TimeBasedSingleObjectiveDefaultTermination
+from .anytimeTermination import AnytimeTermination
@@ -0,0 +1,60 @@
+from time import time
+from typing import List
+
+import numpy as np
+from pymoo.model.termination import Termination
+
+
+# Stops the search when the next generation would not finish within the
+# budget, when the best cost has improved by no more than epsilon (relative)
+# over the last patience generations, or after maxGenerations. The
+# optimum of the last generation is always the best found so far
+class AnytimeTermination(Termination):
+
+    def __init__(
+            self,
+            budget: float,
+            epsilon: float = 1e-3,
+            patience: int = 10,
+            maxGenerations: int = 100):
+        """
+        :param budget: seconds the search can take
+        :param epsilon: relative improvement below which the search has
+        converged
+        :param patience: number of generations the improvement is taken over
+        :param maxGenerations: upper bound of generations
+        """
+        Termination.__init__(self)
+        self.budget = budget
+        self.epsilon = epsilon
+        self.patience = patience
+        self.maxGenerations = maxGenerations
+        self.startTime = time()
+        self.lastCheckTime = self.startTime
+        self.bestCosts: List[float] = []
+        self.reason = ''
+
+    def _do_continue(self, algorithm, **kwargs):
+        now = time()
+        generationTime = now - self.lastCheckTime
+        self.lastCheckTime = now
+        if algorithm.opt is not None and len(algorithm.opt):
+            self.bestCosts.append(float(np.min(algorithm.opt.get('F'))))
+        if algorithm.n_gen >= self.maxGenerations:
+            self.reason = 'generations'
+            return False
+        if self.hasConverged():
+            self.reason = 'convergence'
+            return False
+        if now - self.startTime + generationTime > self.budget:
+            self.reason = 'deadline'
+            return False
+        return True
+
+    def hasConverged(self) -> bool:
+        if len(self.bestCosts) <= self.patience:
+            return False
+        previous = self.bestCosts[-self.patience - 1]
+        best = self.bestCosts[-1]
+        improvement = (previous - best) / max(abs(previous), 1e-12)
+        return improvement <= self.epsilon
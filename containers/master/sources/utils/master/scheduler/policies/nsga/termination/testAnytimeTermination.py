@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from .anytimeTermination import AnytimeTermination
+
+
+class Optimum:
+
+    def __init__(self, cost: float):
+        self.cost = cost
+
+    def __len__(self):
+        return 1
+
+    def get(self, name: str):
+        return np.array([[self.cost]])
+
+
+class Algorithm:
+
+    def __init__(self):
+        self.n_gen = 0
+        self.opt = None
+
+    def step(self, cost: float):
+        self.n_gen += 1
+        self.opt = Optimum(cost)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testConverged(self):
+        termination = AnytimeTermination(budget=60, patience=3)
+        algorithm = Algorithm()
+        costs = [100, 90, 80, 79.99, 79.99, 79.99]
+        for cost in costs[:-1]:
+            algorithm.step(cost)
+            self.assertTrue(termination.do_continue(algorithm))
+        algorithm.step(costs[-1])
+        self.assertFalse(termination.do_continue(algorithm))
+        self.assertEqual(termination.reason, 'convergence')
+
+    def testDeadline(self):
+        termination = AnytimeTermination(budget=0)
+        algorithm = Algorithm()
+        algorithm.step(100)
+        self.assertFalse(termination.do_continue(algorithm))
+        self.assertEqual(termination.reason, 'deadline')
+
+    def testGenerations(self):
+        termination = AnytimeTermination(budget=60, maxGenerations=3)
+        algorithm = Algorithm()
+        for cost in [3, 2]:
+            algorithm.step(cost)
+            self.assertTrue(termination.do_continue(algorithm))
+        algorithm.step(1)
+        self.assertFalse(termination.do_continue(algorithm))
+        self.assertEqual(termination.reason, 'generations')
+
+
+if __name__ == '__main__':
+    unittest.main()
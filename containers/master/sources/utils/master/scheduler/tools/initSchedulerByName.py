@@ -2,6 +2,7 @@ from typing import Set
 from typing import Union
 
 from ..base import BaseScheduler
+from ..policies.heft import HEFT
 from ..policies.nsga.nsga2 import NSGA2
 from ..policies.nsga.nsga3 import NSGA3
 from ..policies.nsga.ohnsga import OHNSGA
@@ -17,6 +18,15 @@ def initSchedulerByName(
         isContainerMode: bool,
         parsedArgs,
         **kwargs) -> Union[BaseScheduler, None]:
+    concurrentSchedules = 4
+    if parsedArgs is not None and 'concurrentSchedules' in parsedArgs:
+        concurrentSchedules = parsedArgs.concurrentSchedules
+    decisionCacheAge = 300
+    if parsedArgs is not None and 'decisionCacheAge' in parsedArgs:
+        decisionCacheAge = parsedArgs.decisionCacheAge
+    schedulingBudget = 5000
+    if parsedArgs is not None and 'schedulingBudget' in parsedArgs:
+        schedulingBudget = parsedArgs.schedulingBudget
     if schedulerName == 'OHNSGA':
         populationSize = kwargs['populationSize']
         generationNum = kwargs['generationNum']
@@ -30,7 +40,10 @@ def initSchedulerByName(
             generationNum=generationNum,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules,
+            decisionCacheAge=decisionCacheAge,
+            schedulingBudget=schedulingBudget)
         return scheduler
     elif schedulerName == 'NSGA2':
         populationSize = kwargs['populationSize']
@@ -45,7 +58,10 @@ def initSchedulerByName(
             generationNum=generationNum,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules,
+            decisionCacheAge=decisionCacheAge,
+            schedulingBudget=schedulingBudget)
         return scheduler
     elif schedulerName == 'NSGA3':
         populationSize = kwargs['populationSize']
@@ -60,16 +76,31 @@ def initSchedulerByName(
             generationNum=generationNum,
             basicComponent=basicComponent,
             estimationThreadNum=estimationThreadNum,
-            isContainerMode=isContainerMode)
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules,
+            decisionCacheAge=decisionCacheAge,
+            schedulingBudget=schedulingBudget)
+        return scheduler
+    elif schedulerName == 'HEFT':
+        scheduler = HEFT(
+            knownMasters=knownMasters,
+            minimumActors=minimumActors,
+            basicComponent=basicComponent,
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules)
         return scheduler
     elif schedulerName == 'Random':
         from ..policies.schedulerRandomPolicy import \
             SchedulerRandomPolicy
-        scheduler = SchedulerRandomPolicy(isContainerMode=isContainerMode)
+        scheduler = SchedulerRandomPolicy(
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules)
         return scheduler
     elif schedulerName == 'RoundRobin':
         from ..policies.schedulerRoundRobinPolicy import \
             SchedulerRoundRobinPolicy
-        scheduler = SchedulerRoundRobinPolicy(isContainerMode=isContainerMode)
+        scheduler = SchedulerRoundRobinPolicy(
+            isContainerMode=isContainerMode,
+            concurrentSchedules=concurrentSchedules)
         return scheduler
     return None
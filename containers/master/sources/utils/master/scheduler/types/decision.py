@@ -15,12 +15,28 @@ class Decision(SerializableDictionary):
             indexToHostID: Dict[str, str],
             schedulingTime: float,
             cost: float = -1,
-            evaluationRecord: List[float] = None):
+            evaluationRecord: List[float] = None,
+            queueingTime: float = 0,
+            isCached: bool = False,
+            savedEvaluationRecord: List[int] = None,
+            snapshotAt: float = 0):
         if evaluationRecord is None:
             self.evaluationRecord = []
         else:
             self.evaluationRecord = evaluationRecord
+        # Individuals of each generation that were not estimated again
+        if savedEvaluationRecord is None:
+            self.savedEvaluationRecord = []
+        else:
+            self.savedEvaluationRecord = savedEvaluationRecord
         self.schedulingTime = schedulingTime
+        # ms the request waited before scheduling started
+        self.queueingTime = queueingTime
+        # Reused from the decision cache instead of searched
+        self.isCached = isCached
+        # Seconds since the epoch when the performance snapshot the decision
+        # was made over was taken
+        self.snapshotAt = snapshotAt
         self.user = user
         self.indexToHostID = indexToHostID
         self.indexSequence = indexSequence
@@ -48,7 +64,11 @@ class Decision(SerializableDictionary):
             indexToHostID=inDict['indexToHostID'],
             schedulingTime=inDict['schedulingTime'],
             evaluationRecord=inDict['evaluationRecord'],
-            cost=inDict['cost'])
+            savedEvaluationRecord=inDict['savedEvaluationRecord'],
+            cost=inDict['cost'],
+            queueingTime=inDict['queueingTime'],
+            isCached=inDict['isCached'],
+            snapshotAt=inDict['snapshotAt'])
         return decision
 
     def toDict(self) -> Dict:
@@ -57,6 +77,10 @@ class Decision(SerializableDictionary):
             'indexSequence': self.indexSequence,
             'indexToHostID': self.indexToHostID,
             'evaluationRecord': self.evaluationRecord,
+            'savedEvaluationRecord': self.savedEvaluationRecord,
             'schedulingTime': self.schedulingTime,
+            'queueingTime': self.queueingTime,
+            'isCached': self.isCached,
+            'snapshotAt': self.snapshotAt,
             'cost': self.cost}
         return inDict
@@ -39,7 +39,8 @@ class PeriodicTaskRunner:
             periodicTasks = []
         basicTasks = [
             (self.basicComponent.uploadMedianReceivedPacketSize, 20),
-            (self.basicComponent.uploadDelays, 20)
+            (self.basicComponent.uploadDelays, 20),
+            (self.basicComponent.uploadLinkEstimates, 20)
         ]
         periodicTasks = [*basicTasks, *periodicTasks]
         return periodicTasks
@@ -5,6 +5,11 @@ from ..types import Address
 
 class ConnectionRequest:
 
-    def __init__(self, clientSocket: socket, clientAddr: Address):
+    def __init__(
+            self,
+            clientSocket: socket,
+            clientAddr: Address,
+            acceptedAt: float):
         self.clientSocket = clientSocket
         self.clientAddr = clientAddr
+        self.acceptedAt = acceptedAt
@@ -73,3 +73,7 @@ class RemoteLoggerMessageHandler:
                 messageSubType=MessageSubType.CONTAINER_IMAGES_AND_RUNNING_CONTAINERS):
             self.logHandler.handleImagesAndRunningContainers(message)
             return
+        if message.typeIs(
+                messageSubType=MessageSubType.LAUNCH_TIMES):
+            self.logHandler.handleLaunchTimes(message)
+            return
@@ -1,4 +1,5 @@
 from logging import Logger
+from typing import Dict
 
 from ..logger import LoggerManager
 from ...component import BasicComponent
@@ -22,6 +23,10 @@ class LogHandler:
         self.basicComponent = basicComponent
         self.debugLogger = debugLogger
         self.loggerManager = loggerManager
+        # host nameConsistent -> median ms of each TaskExecutor launch phase.
+        # The Actor measures resolve, create and start. The Master measures
+        # the time from its request to the registration, for init and reuse
+        self.launchTimes: Dict[str, Dict[str, float]] = {}
 
     def handleHostResources(self, message: MessageReceived) -> HandlerReturn:
         data = message.data
@@ -60,6 +65,21 @@ class LogHandler:
         self.loggerManager.mergeLatency(latency)
         return None
 
+    def handleLaunchTimes(self, message: MessageReceived) -> HandlerReturn:
+        launchTimes = message.data['launchTimes']
+        if message.source.role is ComponentRole.MASTER:
+            launchTimesOfHosts = launchTimes
+        else:
+            launchTimesOfHosts = {message.source.nameConsistent: launchTimes}
+        for hostNameConsistent, phases in launchTimesOfHosts.items():
+            if hostNameConsistent not in self.launchTimes:
+                self.launchTimes[hostNameConsistent] = {}
+            self.launchTimes[hostNameConsistent].update(phases)
+            self.debugLogger.debug(
+                'TaskExecutor launch times (ms) on %s: %s',
+                hostNameConsistent, self.launchTimes[hostNameConsistent])
+        return None
+
     def handleMedianReceivedPacketSize(
             self, message: MessageReceived) -> HandlerReturn:
         sizes = message.data['sizes']
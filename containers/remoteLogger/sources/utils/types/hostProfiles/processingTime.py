@@ -12,19 +12,39 @@ class ProcessingTime(AutoDictionary, SerializableDictionary):
             taskExecutorName: str,
             processingTime: int = 0,
             resources: Resources = Resources(),
-            platform: PlatformInfo = PlatformInfo()):
+            platform: PlatformInfo = PlatformInfo(),
+            cacheHits: int = 0,
+            cacheMisses: int = 0):
         self.taskExecutorName = taskExecutorName
         self.processingTime = processingTime
         self.resources = resources
         self.platform = platform
+        self.cacheHits = cacheHits
+        self.cacheMisses = cacheMisses
+
+    @property
+    def cacheHitRatio(self) -> float:
+        total = self.cacheHits + self.cacheMisses
+        if total == 0:
+            return .0
+        return self.cacheHits / total
+
+    @property
+    def cacheMissRatio(self) -> float:
+        if self.cacheHits + self.cacheMisses == 0:
+            return .0
+        return 1 - self.cacheHitRatio
 
     @staticmethod
     def fromDict(inDict: Dict):
+        # Profiles recorded before the result cache have no cache fields
         processingTime = ProcessingTime(
             platform=PlatformInfo.fromDict(inDict['platform']),
             taskExecutorName=inDict['taskExecutorName'],
             processingTime=inDict['processingTime'],
-            resources=Resources.fromDict(inDict['resources']))
+            resources=Resources.fromDict(inDict['resources']),
+            cacheHits=inDict.get('cacheHits', 0),
+            cacheMisses=inDict.get('cacheMisses', 0))
         return processingTime
 
     def toDict(self) -> Dict:
@@ -32,5 +52,9 @@ class ProcessingTime(AutoDictionary, SerializableDictionary):
             'platform': self.platform.toDict(),
             'taskExecutorName': self.taskExecutorName,
             'processingTime': self.processingTime,
-            'resources': self.resources.toDict()}
+            'resources': self.resources.toDict(),
+            'cacheHits': self.cacheHits,
+            'cacheMisses': self.cacheMisses,
+            'cacheHitRatio': self.cacheHitRatio,
+            'cacheMissRatio': self.cacheMissRatio}
         return inDict
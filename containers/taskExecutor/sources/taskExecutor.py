@@ -34,6 +34,7 @@ class TaskExecutor:
             totalCPUCores: int,
             cpuFreq: float,
             containerName: str = '',
+            isWarm: bool = False,
             logLevel=logging.DEBUG):
         self.basicComponent = BasicComponent(
             role=ComponentRole.TASK_EXECUTOR,
@@ -57,7 +58,8 @@ class TaskExecutor:
             taskToken=taskToken,
             childrenTaskTokens=childTaskTokens,
             totalCPUCores=totalCPUCores,
-            cpuFreq=cpuFreq)
+            cpuFreq=cpuFreq,
+            isWarm=isWarm)
         self.containerManager = ContainerManager(
             basicComponent=self.basicComponent,
             containerName=containerName)
@@ -81,7 +83,9 @@ class TaskExecutor:
         self.profiler.profileResources()
 
     def uploadMedianProcessTime(self):
-        if self.task.medianProcessingTime.processingTime == .0:
+        medianProcessingTime = self.task.medianProcessingTime
+        if medianProcessingTime.processingTime == .0 \
+                and medianProcessingTime.cacheHits == 0:
             return
         data = {'medianProcessTime': self.task.medianProcessingTime.toDict()}
         self.basicComponent.sendMessage(
@@ -186,6 +190,13 @@ def parseArg():
         default='',
         type=str,
         help='container name')
+    parser.add_argument(
+        '--warm',
+        metavar='Warm',
+        nargs='?',
+        default=0,
+        type=int,
+        help='1 to start without a user and wait in the warm pool')
     return parser.parse_args()
 
 
@@ -209,5 +220,6 @@ if __name__ == '__main__':
         actorID=args.actorID,
         totalCPUCores=args.totalCPUCores,
         cpuFreq=args.cpuFrequency,
+        isWarm=args.warm == 1,
         logLevel=args.verbose)
     taskExecutor_.run()
@@ -0,0 +1,108 @@
+import argparse
+import logging
+
+from utils import BasicComponent
+from utils import ComponentRole
+from utils import ConfigTaskExecutor
+from utils import PeriodicTaskRunner
+from utils import PeriodicTasks
+from utils.taskExecutor import TaskExecutorRuntime
+
+
+class Runtime:
+
+    def __init__(
+            self,
+            addr,
+            masterAddr,
+            remoteLoggerAddr,
+            actorAddr,
+            logLevel=logging.DEBUG):
+        self.basicComponent = BasicComponent(
+            role=ComponentRole.TASK_EXECUTOR,
+            addr=addr,
+            masterAddr=masterAddr,
+            remoteLoggerAddr=remoteLoggerAddr,
+            logLevel=logLevel,
+            portRange=ConfigTaskExecutor.portRange)
+        self.runtime = TaskExecutorRuntime(
+            endpoint=self.basicComponent,
+            actorAddr=actorAddr,
+            logLevel=logLevel)
+        periodicTasks = self.preparePeriodTasks()
+        self.periodicTaskRunner = PeriodicTaskRunner(
+            basicComponent=self.basicComponent,
+            periodicTasks=periodicTasks)
+
+    def run(self):
+        # The runtime itself never registers at the Master,
+        # the TaskExecutors it hosts do
+        self.basicComponent.isRegistered.set()
+        self.runtime.announce()
+        self.basicComponent.debugLogger.info(
+            'Hosting TaskExecutors at %s', str(self.basicComponent.addr))
+
+    def preparePeriodTasks(self) -> PeriodicTasks:
+        periodicTasks = [
+            (self.runtime.uploadMedianProcessTime, 30),
+            (self.runtime.updateResources, 60)]
+        return periodicTasks
+
+
+def parseArg():
+    parser = argparse.ArgumentParser(
+        description='TaskExecutor Runtime')
+    parser.add_argument(
+        '--bindIP',
+        metavar='BindIP',
+        type=str,
+        help='Runtime ip.')
+    parser.add_argument(
+        '--masterIP',
+        metavar='MasterIP',
+        type=str,
+        help='Master ip.')
+    parser.add_argument(
+        '--masterPort',
+        metavar='MasterPort',
+        type=int,
+        help='Master port')
+    parser.add_argument(
+        '--remoteLoggerIP',
+        metavar='RemoteLoggerIP',
+        type=str,
+        help='Remote logger ip.')
+    parser.add_argument(
+        '--remoteLoggerPort',
+        metavar='RemoteLoggerPort',
+        type=int,
+        help='Remote logger port')
+    parser.add_argument(
+        '--actorIP',
+        metavar='ActorIP',
+        type=str,
+        help='Actor ip.')
+    parser.add_argument(
+        '--actorPort',
+        metavar='ActorPort',
+        type=int,
+        help='Actor port')
+    parser.add_argument(
+        '--verbose',
+        metavar='Verbose',
+        nargs='?',
+        default=10,
+        type=int,
+        help='Reference python logging level, from 0 to 50 integer to show log')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parseArg()
+    runtime_ = Runtime(
+        addr=(args.bindIP, 0),
+        masterAddr=(args.masterIP, args.masterPort),
+        remoteLoggerAddr=(args.remoteLoggerIP, args.remoteLoggerPort),
+        actorAddr=(args.actorIP, args.actorPort),
+        logLevel=args.verbose)
+    runtime_.run()
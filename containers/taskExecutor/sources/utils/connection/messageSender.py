@@ -10,6 +10,7 @@ from traceback import print_exc as printExc
 from typing import Dict
 from typing import Tuple
 
+from .linkEstimator import LinkEstimator
 from .message import MessageToSend
 from ..debugLogPrinter import DebugLogPrinter
 from ..tools import encrypt
@@ -37,16 +38,22 @@ class MessageSender(Component, DebugLogPrinter):
         self.messagesToSendQueue: Queue[
             Tuple[MessageToSend, bool, bool]] = Queue()
         self.ignoreSocketError = ignoreSocketError
+        self.linkEstimator: LinkEstimator = LinkEstimator()
 
     def sendBytes(
             self,
             messageInBytes: bytes,
             destAddr: Address,
-            retries: int = 5):
+            retries: int = 5,
+            destHostID: str = ''):
         clientSocket = socket(AF_INET, SOCK_STREAM)
         try:
             clientSocket.settimeout(10)
+            connectStartedAt = time()
             clientSocket.connect(destAddr)
+            # Connecting takes one round trip
+            self.linkEstimator.recordRTT(
+                destHostID, time() - connectStartedAt)
             package = struct.pack(FORMAT, len(messageInBytes)) + messageInBytes
             clientSocket.sendall(package)
             clientSocket.close()
@@ -79,7 +86,8 @@ class MessageSender(Component, DebugLogPrinter):
             messageSubType: MessageSubType = MessageSubType.NONE,
             messageSubSubType: MessageSubSubType = MessageSubSubType.NONE,
             ignoreSocketError: bool = None,
-            showFailure: bool = True):
+            showFailure: bool = True,
+            source: Component = None):
 
         if messageToSend is None:
             messageToSend = MessageToSend(
@@ -88,6 +96,8 @@ class MessageSender(Component, DebugLogPrinter):
                 destination=destination,
                 messageSubType=messageSubType,
                 messageSubSubType=messageSubSubType)
+        if source is not None:
+            messageToSend.source = Component.fromDict(source.toDict())
         messageToSend.sentAtSourceTimestamp = time() * 1000
 
         destination = messageToSend.destination
@@ -101,13 +111,17 @@ class MessageSender(Component, DebugLogPrinter):
         while True:
             messageToSend, ignoreSocketError, showFailure = self.messagesToSendQueue.get()
             messageInDict = messageToSend.toDict()
-            messageInDict['source'] = self.toDict()
+            if messageToSend.source is None:
+                messageInDict['source'] = self.toDict()
+            else:
+                messageInDict['source'] = messageToSend.source.toDict()
             try:
                 messageInBytes = encrypt(messageInDict)
                 self.sendBytes(
                     messageInBytes=messageInBytes,
                     destAddr=messageToSend.destination.addr,
-                    retries=retries)
+                    retries=retries,
+                    destHostID=messageToSend.destination.hostID)
             except (ConnectionRefusedError, OSError):
                 if ignoreSocketError is None:
                     ignoreSocketError = self.ignoreSocketError
@@ -1,5 +1,7 @@
 from .messageHandler import TaskExecutorMessageHandler
 from .profiler import ResourcesProfiler
 from .registration import RegistrationManager
-from .tasks import *
+from .runtime import TaskExecutorRuntime
+from .tasks import BaseTask
 from .tools import initTask
+from .tools import taskRegistry
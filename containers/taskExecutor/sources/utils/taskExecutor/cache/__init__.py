@@ -0,0 +1 @@
+from .resultCache import ResultCache
@@ -0,0 +1,81 @@
+import pickle
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from time import time
+from typing import Any
+from typing import Tuple
+
+
+class ResultCache:
+
+    def __init__(
+            self,
+            maxBytes: int = 64 * 1024 * 1024,
+            ttl: float = 300):
+        self.__lock = Lock()
+        self.maxBytes = maxBytes
+        self.ttl = ttl
+        self.currentBytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (pickled result, expiry timestamp)
+        self.__entries: OrderedDict[bytes, Tuple[bytes, float]] = \
+            OrderedDict()
+
+    @staticmethod
+    def hashInput(inputData) -> bytes:
+        # Contiguous buffers such as numpy arrays are hashed in place
+        # instead of being copied into the pickle stream
+        buffers = []
+        head = pickle.dumps(
+            inputData,
+            protocol=5,
+            buffer_callback=buffers.append)
+        digest = blake2b(head, digest_size=16)
+        for buffer in buffers:
+            digest.update(buffer.raw())
+        return digest.digest()
+
+    def get(self, key: bytes) -> Tuple[bool, Any]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            resultInBytes, expiry = entry
+            if expiry < time():
+                self.__remove(key)
+                self.misses += 1
+                return False, None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+        return True, pickle.loads(resultInBytes)
+
+    def put(self, key: bytes, result):
+        resultInBytes = pickle.dumps(result, protocol=5)
+        size = len(resultInBytes)
+        if size > self.maxBytes:
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = (resultInBytes, time() + self.ttl)
+            self.currentBytes += size
+            while self.currentBytes > self.maxBytes:
+                oldestKey = next(iter(self.__entries))
+                self.__remove(oldestKey)
+
+    def __remove(self, key: bytes):
+        resultInBytes, _ = self.__entries.pop(key)
+        self.currentBytes -= len(resultInBytes)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @property
+    def hitRatio(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return .0
+        return self.hits / total
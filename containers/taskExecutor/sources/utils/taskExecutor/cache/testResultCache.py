@@ -0,0 +1,50 @@
+import unittest
+from time import sleep
+
+import numpy as np
+
+from .resultCache import ResultCache
+from ..tasks.naiveFormula0 import NaiveFormula0
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testHashNumpyBuffers(self):
+        arrayA = np.arange(1024, dtype=np.float32)
+        arrayB = arrayA.copy()
+        arrayB[-1] += 1
+        self.assertEqual(
+            ResultCache.hashInput((arrayA, 1)),
+            ResultCache.hashInput((arrayA.copy(), 1)))
+        self.assertNotEqual(
+            ResultCache.hashInput((arrayA, 1)),
+            ResultCache.hashInput((arrayB, 1)))
+
+    def testLRUByBytes(self):
+        cache = ResultCache(maxBytes=3000)
+        for i in range(3):
+            cache.put(bytes([i]), b'x' * 1000)
+        self.assertFalse(cache.get(bytes([0]))[0])
+        self.assertTrue(cache.get(bytes([2]))[0])
+        self.assertLessEqual(cache.currentBytes, cache.maxBytes)
+
+    def testTTL(self):
+        cache = ResultCache(ttl=.01)
+        cache.put(b'key', 1)
+        sleep(.02)
+        self.assertFalse(cache.get(b'key')[0])
+
+    def testTaskRun(self):
+        task = NaiveFormula0()
+        resultA, isCachedA = task.run({'a': 1, 'b': 2, 'c': 3})
+        resultB, isCachedB = task.run({'a': 1, 'b': 2, 'c': 3})
+        self.assertFalse(isCachedA)
+        self.assertTrue(isCachedB)
+        self.assertEqual(resultA, resultB)
+        self.assertEqual(task.medianProcessingTime.cacheHits, 1)
+        self.assertEqual(task.medianProcessingTime.cacheMisses, 1)
+        self.assertEqual(task.medianProcessingTime.toDict()['cacheHitRatio'], .5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,6 +35,10 @@ class TaskExecutorMessageHandler:
                 messageType=MessageType.PLACEMENT,
                 messageSubType=MessageSubType.LOOKUP):
             self.handleTaskExecutorInfo(message)
+        elif message.typeIs(
+                messageType=MessageType.PLACEMENT,
+                messageSubType=MessageSubType.CHILDREN_ADDRESSES):
+            self.handleChildrenAddresses(message)
         elif message.typeIs(
                 messageType=MessageType.DATA,
                 messageSubType=MessageSubType.INTERMEDIATE_DATA):
@@ -64,40 +68,49 @@ class TaskExecutorMessageHandler:
             nameLogPrinting=nameLogPrinting,
             componentID=componentID,
             hostID=hostID)
-        self.containerManager.tryRenamingContainerName(newName=nameLogPrinting)
         self.task.medianProcessingTime.taskExecutorName = \
             self.basicComponent.name
-        self.registrationManager.lookupChildren()
+        if not self.registrationManager.isWarm:
+            self.registrationManager.lookupChildren()
         self.basicComponent.isRegistered.set()
 
     def handleTaskExecutorInfo(self, message: MessageReceived):
         data = message.data
         addr = data['taskExecutorAddr']
-        taskExecutorAddr = addr[0], addr[1]
-        taskToken = data['taskToken']
-        if taskToken not in self.registrationManager.childrenTaskTokens:
-            return
+        self.registrationManager.addChild(
+            taskToken=data['taskToken'],
+            addr=(addr[0], addr[1]),
+            taskExecutorID=data.get('taskExecutorID'))
 
-        self.registrationManager.childrenAddresses[taskToken] = taskExecutorAddr
-        childrenCount = len(self.registrationManager.childrenTaskTokens)
-        gotCount = len(self.registrationManager.childrenAddresses.keys())
-        if childrenCount != gotCount:
-            return
+    def handleChildrenAddresses(self, message: MessageReceived):
+        for child in message.data['children']:
+            addr = child['taskExecutorAddr']
+            self.registrationManager.addChild(
+                taskToken=child['taskToken'],
+                addr=(addr[0], addr[1]),
+                taskExecutorID=child['taskExecutorID'])
 
     def handleData(self, message: MessageReceived):
 
         data = message.data
         intermediateData = data['intermediateData']
-        result = self.task.exec(intermediateData)
-        processingTime = time() * 1000 - message.receivedAtLocalTimestamp
-        self.task.updateProcessingTime(processingTime)
+        result, isCached = self.task.run(intermediateData)
+        # Cache hits would pull the median towards zero while the estimator
+        # uses it as the cost of actually running the task
+        if not isCached:
+            processingTime = time() * 1000 - message.receivedAtLocalTimestamp
+            self.task.updateProcessingTime(processingTime)
         if result is None:
             return
         # print(self.task.taskName, self.registrationManager.childrenAddresses)
         if len(self.registrationManager.childrenAddresses.keys()):
             data['intermediateData'] = result
-            for addr in self.registrationManager.childrenAddresses.values():
-                child = Component(addr=addr)
+            childrenAddresses = self.registrationManager.childrenAddresses
+            childrenIDs = self.registrationManager.childrenIDs
+            for taskToken, addr in childrenAddresses.items():
+                child = Component(
+                    addr=addr,
+                    componentID=childrenIDs.get(taskToken))
                 self.basicComponent.sendMessage(
                     messageType=MessageType.DATA,
                     messageSubType=MessageSubType.INTERMEDIATE_DATA,
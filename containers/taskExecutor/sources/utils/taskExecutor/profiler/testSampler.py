@@ -0,0 +1,52 @@
+import unittest
+from time import time
+
+from .sampler import SampleWindow
+from .sampler import UtilizationSampler
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testRingBuffer(self):
+        window = SampleWindow(capacity=4, alpha=.5)
+        for value in [.1, .2, .3, .4, .5, .6]:
+            window.add(value)
+        self.assertEqual(4, len(window))
+        self.assertEqual(.6, window.current)
+        self.assertEqual([.6, .5, .4, .3], window.window())
+        self.assertEqual(.6, window.peak())
+
+    def testEWMA(self):
+        window = SampleWindow(alpha=.5)
+        window.add(1.)
+        window.add(0.)
+        self.assertEqual(.5, window.ewma)
+
+    def testWindowInSeconds(self):
+        window = SampleWindow()
+        now = time()
+        window.add(.9, now - 120)
+        window.add(.2, now - 10)
+        window.add(.3, now)
+        self.assertEqual(.3, window.peak(seconds=60))
+        self.assertEqual(.9, window.peak())
+
+    def testPercentile(self):
+        window = SampleWindow(capacity=100)
+        for i in range(100):
+            window.add(i / 100)
+        self.assertEqual(.94, window.percentile(95))
+
+    def testSampleWithoutWaiting(self):
+        sampler = UtilizationSampler(
+            readCPU=lambda: .7,
+            readMemory=lambda: .4)
+        startTime = time()
+        sampler.ensureSampled()
+        self.assertLess(time() - startTime, .1)
+        self.assertEqual(.7, sampler.cpu.current)
+        self.assertEqual(.4, sampler.memory.current)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from time import sleep
+from threading import Event
 from typing import Dict
 from typing import List
 
@@ -21,7 +21,8 @@ class RegistrationManager:
             childrenTaskTokens: List[str],
             basicComponent: BasicComponent,
             totalCPUCores: int,
-            cpuFreq: float):
+            cpuFreq: float,
+            isWarm: bool = False):
         self.childrenTaskTokens = childrenTaskTokens
         self.taskToken = taskToken
         self.taskName = taskName
@@ -29,8 +30,15 @@ class RegistrationManager:
         self.userID = userID
         self.basicComponent = basicComponent
         self.childrenAddresses: Dict[str, tuple] = {}
+        self.childrenIDs: Dict[str, str] = {}
+        self.gotAllChildren: Event = Event()
+        # The Master pushes children's addresses, only ask for them when
+        # nothing arrived for this long
+        self.lookupFallbackInterval = 10
         self.totalCPUCores = totalCPUCores
         self.cpuFreq = cpuFreq
+        # Started ahead of demand by the Actor, not yet bound to any user
+        self.isWarm = isWarm
 
     def setCredentials(
             self,
@@ -42,6 +50,10 @@ class RegistrationManager:
         self.taskName = taskName
         self.taskToken = taskToken
         self.childrenTaskTokens = childrenTaskTokens
+        self.childrenAddresses = {}
+        self.childrenIDs = {}
+        self.gotAllChildren.clear()
+        self.isWarm = False
 
     def registerAt(
             self,
@@ -59,18 +71,27 @@ class RegistrationManager:
             'userID': userID,
             'actorID': self.actorID,
             'taskName': taskName,
-            'taskToken': taskToken}
+            'taskToken': taskToken,
+            'isWarm': self.isWarm}
         self.basicComponent.sendMessage(
             messageType=MessageType.REGISTRATION,
             messageSubType=MessageSubType.REGISTER,
             data=data,
             destination=self.basicComponent.master)
 
+    def addChild(self, taskToken: str, addr: tuple, taskExecutorID: str):
+        if taskToken not in self.childrenTaskTokens:
+            return
+        self.childrenAddresses[taskToken] = addr
+        # Tells apart children hosted by the same runtime at the same addr
+        if taskExecutorID is not None:
+            self.childrenIDs[taskToken] = taskExecutorID
+        if len(self.childrenAddresses) == len(self.childrenTaskTokens):
+            self.gotAllChildren.set()
+
     def lookupChildren(self):
-        while True:
-            childrenCount = len(self.childrenTaskTokens)
-            gotCount = len(self.childrenAddresses.keys())
-            if childrenCount == gotCount:
+        while len(self.childrenAddresses) != len(self.childrenTaskTokens):
+            if self.gotAllChildren.wait(timeout=self.lookupFallbackInterval):
                 break
             for childTaskToken in self.childrenTaskTokens:
                 if childTaskToken in self.childrenAddresses:
@@ -81,7 +102,6 @@ class RegistrationManager:
                     messageSubType=MessageSubType.LOOKUP,
                     data=data,
                     destination=self.basicComponent.master)
-            sleep(2)
         data = {'taskToken': self.taskToken}
         self.basicComponent.sendMessage(
             messageType=MessageType.ACKNOWLEDGEMENT,
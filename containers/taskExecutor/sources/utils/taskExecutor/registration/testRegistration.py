@@ -0,0 +1,69 @@
+import unittest
+from threading import Thread
+from time import sleep
+
+from .manager import RegistrationManager
+from ...types import Component
+from ...types import ComponentRole
+from ...types import MessageSubType
+
+
+class BasicComponent:
+    master = Component(role=ComponentRole.MASTER, addr=('127.0.0.1', 5001))
+
+    def __init__(self):
+        self.sent = []
+        self.debugLogger = self
+
+    def sendMessage(self, **kwargs):
+        self.sent.append(kwargs['messageSubType'])
+
+    def debug(self, *args):
+        pass
+
+
+def newRegistrationManager(basicComponent, childrenTaskTokens):
+    return RegistrationManager(
+        userID='0',
+        actorID='0',
+        taskName='OCR',
+        taskToken='parent',
+        childrenTaskTokens=childrenTaskTokens,
+        basicComponent=basicComponent,
+        totalCPUCores=1,
+        cpuFreq=1.)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testReadyWhenChildrenArePushed(self):
+        basicComponent = BasicComponent()
+        registrationManager = newRegistrationManager(
+            basicComponent, ['childA', 'childB'])
+        lookup = Thread(target=registrationManager.lookupChildren)
+        lookup.start()
+        sleep(.1)
+        registrationManager.addChild('childA', ('127.0.0.1', 1), '1')
+        registrationManager.addChild('unknown', ('127.0.0.1', 2), '2')
+        registrationManager.addChild('childB', ('127.0.0.1', 3), '3')
+        lookup.join(timeout=1)
+        self.assertFalse(lookup.is_alive())
+        self.assertEqual(basicComponent.sent, [MessageSubType.READY])
+        self.assertEqual(registrationManager.childrenIDs['childB'], '3')
+
+    def testLookupWhenNothingIsPushed(self):
+        basicComponent = BasicComponent()
+        registrationManager = newRegistrationManager(
+            basicComponent, ['childA'])
+        registrationManager.lookupFallbackInterval = .1
+        lookup = Thread(target=registrationManager.lookupChildren)
+        lookup.start()
+        sleep(.15)
+        registrationManager.addChild('childA', ('127.0.0.1', 1), '1')
+        lookup.join(timeout=1)
+        self.assertEqual(basicComponent.sent[0], MessageSubType.LOOKUP)
+        self.assertEqual(basicComponent.sent[-1], MessageSubType.READY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,3 @@
+from .component import WorkerComponent
+from .runtime import TaskExecutorRuntime
+from .worker import TaskExecutorWorker
@@ -0,0 +1,88 @@
+from threading import Event
+from typing import Callable
+from typing import Dict
+
+from ...component import BasicComponent
+from ...debugLogPrinter import DebugLogPrinter
+from ...types import Component
+from ...types import ComponentRole
+from ...types import MessageSubSubType
+from ...types import MessageSubType
+from ...types import MessageType
+
+RenameCallback = Callable[[str, str], None]
+
+
+# Stands in for the BasicComponent of one TaskExecutor hosted by a
+# TaskExecutorRuntime. It has its own identity but shares the endpoint, so
+# messages are sent on its behalf and routed back to it by componentID
+class WorkerComponent(Component, DebugLogPrinter):
+
+    def __init__(
+            self,
+            endpoint: BasicComponent,
+            workerID: str,
+            onRename: RenameCallback,
+            logLevel: int):
+        Component.__init__(
+            self,
+            role=ComponentRole.TASK_EXECUTOR,
+            addr=endpoint.addr,
+            componentID=workerID,
+            hostID=endpoint.hostID)
+        DebugLogPrinter.__init__(
+            self,
+            logLevel=logLevel,
+            loggerName=self.nameLogPrinting)
+        self.endpoint = endpoint
+        self.onRename = onRename
+        self.me = self
+        self.master = Component(
+            role=ComponentRole.MASTER,
+            addr=endpoint.master.addr)
+        self.remoteLogger = endpoint.remoteLogger
+        self.isRegistered: Event = Event()
+
+    def setName(
+            self,
+            addr,
+            name: str = None,
+            nameLogPrinting: str = None,
+            nameConsistent: str = None,
+            componentID: str = None,
+            hostID: str = None,
+            setIsRegistered: bool = False):
+        previousID = self.componentID
+        self.setIdentities(
+            addr=addr,
+            name=name,
+            componentID=componentID,
+            nameLogPrinting=nameLogPrinting,
+            nameConsistent=nameConsistent,
+            hostID=hostID)
+        self.renewDebugLogger(
+            debugLoggerName=self.nameLogPrinting,
+            logLevel=self.logLevel)
+        if previousID != self.componentID:
+            self.onRename(previousID, self.componentID)
+        if setIsRegistered:
+            self.isRegistered.set()
+
+    def sendMessage(
+            self,
+            data: Dict,
+            destination: Component,
+            messageType: MessageType = MessageType.NONE,
+            messageSubType: MessageSubType = MessageSubType.NONE,
+            messageSubSubType: MessageSubSubType = MessageSubSubType.NONE):
+        self.endpoint.sendMessage(
+            data=data,
+            destination=destination,
+            messageType=messageType,
+            messageSubType=messageSubType,
+            messageSubSubType=messageSubSubType,
+            source=self)
+
+    def handleMessage(self, message):
+        # Replaced by TaskExecutorMessageHandler
+        pass
@@ -0,0 +1,151 @@
+from itertools import count
+from threading import Lock
+from threading import Thread
+from typing import Dict
+from typing import Union
+
+from .worker import TaskExecutorWorker
+from ..profiler import ResourcesProfiler
+from ..tools import initTask
+from ...component import BasicComponent
+from ...connection import MessageReceived
+from ...container.manager import ContainerManager
+from ...tools.terminate import terminate
+from ...types import Component
+from ...types import ComponentRole
+from ...types import CPU
+from ...types import Memory
+from ...types import MessageSubType
+from ...types import MessageType
+from ...types import Resources
+
+
+class TaskExecutorRuntime:
+
+    def __init__(
+            self,
+            endpoint: BasicComponent,
+            actorAddr,
+            logLevel: int):
+        self.endpoint = endpoint
+        self.logLevel = logLevel
+        self.actor = Component(role=ComponentRole.ACTOR, addr=actorAddr)
+        self.containerManager = ContainerManager(basicComponent=endpoint)
+        self.workers: Dict[str, TaskExecutorWorker] = {}
+        self.workersLock: Lock = Lock()
+        self.workerIDs = count()
+        self.resources = Resources(cpu=CPU(), memory=Memory())
+        self.profiler = ResourcesProfiler(
+            basicComponent=endpoint,
+            resources=self.resources)
+        self.endpoint.handleMessage = self.handleMessage
+        # TERMINATION is handled before handleMessage and would stop every
+        # TaskExecutor in this process
+        self.endpoint.handleTermination = self.handleTermination
+
+    def announce(self):
+        self.endpoint.sendMessage(
+            messageType=MessageType.PLACEMENT,
+            messageSubType=MessageSubType.TASK_EXECUTOR_RUNTIME,
+            data={},
+            destination=self.actor)
+
+    def handleMessage(self, message: MessageReceived):
+        if message.typeIs(
+                messageType=MessageType.PLACEMENT,
+                messageSubType=MessageSubType.RUN_TASK_EXECUTOR):
+            self.startWorker(message.data)
+            return
+        worker = self.findWorker(message)
+        if worker is None:
+            return
+        isBlocking = message.typeIs(
+            messageType=MessageType.REGISTRATION,
+            messageSubType=MessageSubType.REGISTERED) or message.typeIs(
+            messageType=MessageType.ACKNOWLEDGEMENT,
+            messageSubType=MessageSubType.WAIT)
+        if not isBlocking:
+            worker.basicComponent.handleMessage(message)
+            return
+        # Looking up children and waiting to be reused sleep until they are
+        # done, which must not hold the handler threads every worker shares
+        Thread(
+            target=worker.basicComponent.handleMessage,
+            args=(message,),
+            name='Worker-%s' % worker.componentID).start()
+
+    def handleTermination(self, message: MessageReceived):
+        if not message.typeIs(messageSubType=MessageSubType.STOP):
+            return
+        worker = self.findWorker(message)
+        if worker is None:
+            self.endpoint.debugLogger.warning(
+                'Exiting: %s', message.data['reason'])
+            terminate()
+            return
+        self.removeWorker(worker)
+        worker.basicComponent.debugLogger.info(
+            'Stopped: %s', message.data['reason'])
+
+    def findWorker(
+            self,
+            message: MessageReceived) -> Union[TaskExecutorWorker, None]:
+        if message.destination is None:
+            return None
+        self.workersLock.acquire()
+        worker = self.workers.get(message.destination.componentID)
+        self.workersLock.release()
+        return worker
+
+    def startWorker(self, data: Dict):
+        taskName = data['taskName']
+        task = initTask(taskName)
+        if task is None:
+            self.endpoint.debugLogger.error('TaskName invalid: %s', taskName)
+            return
+        workerID = 'Worker-%d' % next(self.workerIDs)
+        worker = TaskExecutorWorker(
+            endpoint=self.endpoint,
+            containerManager=self.containerManager,
+            workerID=workerID,
+            task=task,
+            userID=data['userID'],
+            actorID=data['actorID'],
+            taskName=taskName,
+            taskToken=data['taskToken'],
+            childTaskTokens=data['childrenTaskTokens'],
+            totalCPUCores=data['totalCPUCores'],
+            cpuFreq=data['cpuFrequency'],
+            isWarm=data.get('isWarm', False),
+            onRename=self.renameWorker,
+            logLevel=self.logLevel)
+        task.medianProcessingTime.resources = self.resources
+        self.workersLock.acquire()
+        self.workers[workerID] = worker
+        self.workersLock.release()
+        worker.register()
+        self.endpoint.debugLogger.debug(
+            'Started %s for %s', workerID, taskName)
+
+    def renameWorker(self, previousID: str, componentID: str):
+        self.workersLock.acquire()
+        if previousID in self.workers:
+            self.workers[componentID] = self.workers.pop(previousID)
+        self.workersLock.release()
+
+    def removeWorker(self, worker: TaskExecutorWorker):
+        self.workersLock.acquire()
+        if self.workers.get(worker.componentID) is worker:
+            del self.workers[worker.componentID]
+        self.workersLock.release()
+
+    def uploadMedianProcessTime(self):
+        self.workersLock.acquire()
+        workers = list(self.workers.values())
+        self.workersLock.release()
+        for worker in workers:
+            worker.uploadMedianProcessTime()
+
+    def updateResources(self):
+        # Profiled once for the whole process
+        self.profiler.profileResources()
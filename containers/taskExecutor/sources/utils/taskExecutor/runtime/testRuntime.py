@@ -0,0 +1,73 @@
+import unittest
+
+from .component import WorkerComponent
+from ...connection import MessageReceived
+from ...connection import MessageToSend
+from ...types import Component
+from ...types import ComponentRole
+from ...types import MessageSubType
+from ...types import MessageType
+
+
+class Endpoint:
+    addr = ('127.0.0.1', 5000)
+    hostID = '127.0.0.1'
+    master = Component(role=ComponentRole.MASTER, addr=('127.0.0.1', 5001))
+    remoteLogger = Component(
+        role=ComponentRole.REMOTE_LOGGER,
+        addr=('127.0.0.1', 5002))
+
+    def __init__(self):
+        self.sent = []
+
+    def sendMessage(self, **kwargs):
+        self.sent.append(kwargs)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testSendOnBehalfOfWorker(self):
+        endpoint = Endpoint()
+        worker = WorkerComponent(
+            endpoint=endpoint,
+            workerID='Worker-0',
+            onRename=lambda previousID, componentID: None,
+            logLevel=50)
+        worker.sendMessage(
+            messageType=MessageType.ACKNOWLEDGEMENT,
+            messageSubType=MessageSubType.READY,
+            data={},
+            destination=worker.master)
+        self.assertIs(endpoint.sent[0]['source'], worker)
+        self.assertEqual(worker.addr, endpoint.addr)
+
+    def testRenameAfterRegistered(self):
+        renamed = []
+        worker = WorkerComponent(
+            endpoint=Endpoint(),
+            workerID='Worker-0',
+            onRename=lambda previousID, componentID: renamed.append(
+                (previousID, componentID)),
+            logLevel=50)
+        worker.setName(addr=worker.addr, componentID='7')
+        self.assertEqual(renamed, [('Worker-0', '7')])
+        self.assertFalse(worker.isRegistered.isSet())
+
+    def testDestinationIsKept(self):
+        destination = Component(
+            role=ComponentRole.TASK_EXECUTOR,
+            addr=('127.0.0.1', 5000),
+            componentID='7')
+        messageToSend = MessageToSend(
+            messageType=MessageType.DATA,
+            messageSubType=MessageSubType.INTERMEDIATE_DATA,
+            data={},
+            destination=destination)
+        messageInDict = messageToSend.toDict()
+        messageInDict['source'] = Endpoint.master.toDict()
+        message = MessageReceived.fromDict(messageInDict)
+        self.assertEqual(message.destination.componentID, '7')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+from typing import List
+
+from .component import RenameCallback
+from .component import WorkerComponent
+from ..messageHandler import TaskExecutorMessageHandler
+from ..registration import RegistrationManager
+from ..tasks.base import BaseTask
+from ...component import BasicComponent
+from ...container.manager import ContainerManager
+from ...types import MessageSubType
+from ...types import MessageType
+
+
+class TaskExecutorWorker:
+
+    def __init__(
+            self,
+            endpoint: BasicComponent,
+            containerManager: ContainerManager,
+            workerID: str,
+            task: BaseTask,
+            userID: str,
+            actorID: str,
+            taskName: str,
+            taskToken: str,
+            childTaskTokens: List[str],
+            totalCPUCores: int,
+            cpuFreq: float,
+            onRename: RenameCallback,
+            isWarm: bool = False,
+            logLevel: int = 10):
+        self.task = task
+        self.basicComponent = WorkerComponent(
+            endpoint=endpoint,
+            workerID=workerID,
+            onRename=onRename,
+            logLevel=logLevel)
+        self.registrationManager = RegistrationManager(
+            basicComponent=self.basicComponent,
+            userID=userID,
+            actorID=actorID,
+            taskName=taskName,
+            taskToken=taskToken,
+            childrenTaskTokens=childTaskTokens,
+            totalCPUCores=totalCPUCores,
+            cpuFreq=cpuFreq,
+            isWarm=isWarm)
+        self.messageHandler = TaskExecutorMessageHandler(
+            containerManager=containerManager,
+            basicComponent=self.basicComponent,
+            task=self.task,
+            registrationManager=self.registrationManager)
+
+    @property
+    def componentID(self) -> str:
+        return self.basicComponent.componentID
+
+    def register(self):
+        self.registrationManager.registerAt(
+            userID=self.registrationManager.userID,
+            taskName=self.registrationManager.taskName,
+            taskToken=self.registrationManager.taskToken,
+            masterAddr=self.basicComponent.master.addr)
+
+    def uploadMedianProcessTime(self):
+        medianProcessingTime = self.task.medianProcessingTime
+        if medianProcessingTime.processingTime == .0 \
+                and medianProcessingTime.cacheHits == 0:
+            return
+        data = {'medianProcessTime': medianProcessingTime.toDict()}
+        self.basicComponent.sendMessage(
+            messageType=MessageType.LOG,
+            messageSubType=MessageSubType.MEDIAN_PROCESSING_TIME,
+            data=data,
+            destination=self.basicComponent.remoteLogger)
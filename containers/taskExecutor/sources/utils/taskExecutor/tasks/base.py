@@ -1,5 +1,9 @@
 from abc import abstractmethod
+from typing import Any
+from typing import Tuple
+from typing import Union
 
+from ..cache import ResultCache
 from ...types import ProcessingTime
 from ...types import SequenceMedian
 
@@ -14,11 +18,38 @@ class BaseTask:
         self.medianProcessingTime = ProcessingTime(
             taskExecutorName=taskName)
         self.processedCount = 0
+        self.resultCache: Union[ResultCache, None] = None
 
     @abstractmethod
     def exec(self, inputData):
         pass
 
+    def enableResultCache(
+            self,
+            maxBytes: int = 64 * 1024 * 1024,
+            ttl: float = 300):
+        # Only for tasks whose result depends on nothing but the input
+        self.resultCache = ResultCache(maxBytes=maxBytes, ttl=ttl)
+
+    def run(self, inputData) -> Tuple[Any, bool]:
+        if self.resultCache is None:
+            return self.exec(inputData), False
+        # The key has to be computed before exec because tasks may modify
+        # the input in place
+        key = self.resultCache.hashInput(inputData)
+        isCached, result = self.resultCache.get(key)
+        if isCached:
+            self.updateCacheStatistics()
+            return result, True
+        result = self.exec(inputData)
+        self.resultCache.put(key, result)
+        self.updateCacheStatistics()
+        return result, False
+
+    def updateCacheStatistics(self):
+        self.medianProcessingTime.cacheHits = self.resultCache.hits
+        self.medianProcessingTime.cacheMisses = self.resultCache.misses
+
     def updateProcessingTime(self, processingTime: float):
         self.processingTime.update(processingTime)
         self.medianProcessingTime.processingTime = self.processingTime.median()
@@ -3,6 +3,12 @@ import numpy as np
 
 from .base import BaseTask
 
+# Number of set bits of every byte value, used when numpy does not provide
+# bitwise_count (numpy < 2.0)
+_popCountTable = np.array(
+    [bin(i).count('1') for i in range(256)],
+    dtype=np.uint8)
+
 
 class BlurAndPHash(BaseTask):
     def __init__(self):
@@ -27,7 +33,7 @@ class BlurAndPHash(BaseTask):
         if self.preStopPHash is None:
             self.preStopPHash = currPHash
             self.prePHash = currPHash
-            return frame, isLastFrame
+            return frame, isLastFrame, currPHash
 
         diffStop = self.hamDistance(self.preStopPHash, currPHash)
         diffPre = self.hamDistance(self.prePHash, currPHash)
@@ -42,11 +48,14 @@ class BlurAndPHash(BaseTask):
             return None
         self.n = 0
         self.preStopPHash = currPHash
-        return frame, isLastFrame
+        return frame, isLastFrame, currPHash
 
     def getPHash(self, img):
         pHash = None
-        laplacian = cv2.Laplacian(img, cv2.CV_64F).var()
+        # meanStdDev is several times faster than ndarray.var on a full frame
+        _, stdDev = cv2.meanStdDev(
+            cv2.Laplacian(img, cv2.CV_64F).reshape(-1))
+        laplacian = stdDev[0][0] ** 2
         if laplacian <= self.thresholdLaplacian:
             return pHash
         imgGray = cv2.resize(
@@ -63,21 +72,20 @@ class BlurAndPHash(BaseTask):
         matrix.resize(self.hashLen, self.hashLen)
         matrixFlatten = matrix.flatten()
 
-        medianValue = sum(matrixFlatten) * 1. / len(matrixFlatten)
-        pHash = 0
-        for i in matrixFlatten:
-            pHash <<= 1
-            if i >= medianValue:
-                pHash += 1
+        medianValue = matrixFlatten.mean(dtype=np.float64)
+        # The most significant bit is the first coefficient, the same order
+        # as shifting the bits one by one into an integer
+        bits = np.packbits(matrixFlatten >= medianValue)
+        pHash = bits.view('>u8').astype(np.uint64)
         return pHash
 
     @staticmethod
     def hamDistance(x, y):
-        tmp = x ^ y
-        distance = 0
-
-        while tmp > 0:
-            distance += tmp & 1
-            tmp >>= 1
+        tmp = np.bitwise_xor(x, y)
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(tmp).sum())
+        return int(_popCountTable[tmp.view(np.uint8)].sum())
 
-        return distance
+    @staticmethod
+    def pHashToInt(pHash) -> int:
+        return int.from_bytes(pHash.astype('>u8').tobytes(), 'big')
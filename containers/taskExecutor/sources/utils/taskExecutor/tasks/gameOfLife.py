@@ -11,11 +11,14 @@ class GameOfLife(BaseTask):
         self.world = None
         self.height = None
         self.width = None
+        self.focusAreaUnscaled = focusArea
         self.focusArea = focusArea
+        self.enableResultCache()
 
     def adjustFocusArea(self):
-
-        focusArea = [list(point) for point in self.focusArea]
+        # Scale from the unscaled area every time so that the result only
+        # depends on the input
+        focusArea = [list(point) for point in self.focusAreaUnscaled]
         for i in range(2):
             for j in range(2):
                 focusArea[i][j] *= self.height // 32
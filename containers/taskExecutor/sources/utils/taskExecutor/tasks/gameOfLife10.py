@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife10(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            52,
-            'GameOfLife10',
-            ((30, 56), (32, 58)))
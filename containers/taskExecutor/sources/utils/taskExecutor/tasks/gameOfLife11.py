@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife11(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            53,
-            'GameOfLife11',
-            ((30, 58), (32, 60)))
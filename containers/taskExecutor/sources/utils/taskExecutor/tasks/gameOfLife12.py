@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife12(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            54,
-            'GameOfLife12',
-            ((28, 48), (30, 52)))
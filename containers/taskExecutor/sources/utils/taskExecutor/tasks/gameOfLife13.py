@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife13(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            55,
-            'GameOfLife13',
-            ((28, 52), (30, 56)))
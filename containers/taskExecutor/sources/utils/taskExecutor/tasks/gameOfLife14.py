@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife14(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            56,
-            'GameOfLife14',
-            ((30, 52), (32, 54)))
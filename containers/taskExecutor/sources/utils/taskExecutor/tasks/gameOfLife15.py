@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife15(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            57,
-            'GameOfLife15',
-            ((30, 54), (32, 56)))
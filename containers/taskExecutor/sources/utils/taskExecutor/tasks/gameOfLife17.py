@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife17(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            59,
-            'GameOfLife17',
-            ((30, 50), (32, 52)))
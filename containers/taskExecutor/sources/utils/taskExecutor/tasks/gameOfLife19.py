@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife19(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            61,
-            'GameOfLife19',
-            ((24, 40), (28, 48)))
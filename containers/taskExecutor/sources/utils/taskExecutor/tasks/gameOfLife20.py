@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife20(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            62,
-            'GameOfLife20',
-            ((28, 40), (30, 44)))
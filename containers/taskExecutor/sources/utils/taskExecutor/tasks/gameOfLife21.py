@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife21(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            63,
-            'GameOfLife21',
-            ((28, 44), (30, 48)))
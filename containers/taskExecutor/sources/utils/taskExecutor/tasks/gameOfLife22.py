@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife22(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            64,
-            'GameOfLife22',
-            ((30, 44), (32, 46)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife23(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            65,
-            'GameOfLife23',
-            ((30, 46), (32, 48)))
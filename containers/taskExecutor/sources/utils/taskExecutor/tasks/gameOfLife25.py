@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife25(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            67,
-            'GameOfLife25',
-            ((30, 42), (32, 44)))
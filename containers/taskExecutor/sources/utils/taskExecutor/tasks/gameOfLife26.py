@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife26(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            68,
-            'GameOfLife26',
-            ((28, 32), (30, 36)))
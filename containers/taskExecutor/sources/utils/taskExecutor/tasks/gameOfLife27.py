@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife27(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            69,
-            'GameOfLife27',
-            ((28, 36), (30, 40)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife29(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            71,
-            'GameOfLife29',
-            ((30, 38), (32, 40)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife31(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            73,
-            'GameOfLife31',
-            ((30, 34), (32, 36)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife34(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            76,
-            'GameOfLife34',
-            ((24, 16), (28, 24)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife35(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            77,
-            'GameOfLife35',
-            ((24, 24), (28, 32)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife36(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            78,
-            'GameOfLife36',
-            ((28, 24), (30, 28)))
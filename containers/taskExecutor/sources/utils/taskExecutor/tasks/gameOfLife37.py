@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife37(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            79,
-            'GameOfLife37',
-            ((28, 28), (30, 32)))
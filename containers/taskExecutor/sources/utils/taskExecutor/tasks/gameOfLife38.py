@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife38(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            80,
-            'GameOfLife38',
-            ((30, 28), (32, 30)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife4(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            46,
-            'GameOfLife4',
-            ((24, 48), (28, 56)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife40(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            82,
-            'GameOfLife40',
-            ((30, 24), (32, 26)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife41(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            83,
-            'GameOfLife41',
-            ((30, 26), (32, 28)))
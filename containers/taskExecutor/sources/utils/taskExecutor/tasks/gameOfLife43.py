@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife43(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            85,
-            'GameOfLife43',
-            ((28, 20), (30, 24)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife44(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            86,
-            'GameOfLife44',
-            ((30, 20), (32, 22)))
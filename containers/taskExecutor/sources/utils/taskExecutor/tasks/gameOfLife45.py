@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife45(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            87,
-            'GameOfLife45',
-            ((30, 22), (32, 24)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife46(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            88,
-            'GameOfLife46',
-            ((30, 16), (32, 18)))
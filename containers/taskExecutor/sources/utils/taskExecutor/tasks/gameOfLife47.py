@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife47(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            89,
-            'GameOfLife47',
-            ((30, 18), (32, 20)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife49(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            91,
-            'GameOfLife49',
-            ((24, 8), (28, 16)))
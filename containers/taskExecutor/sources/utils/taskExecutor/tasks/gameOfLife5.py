@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife5(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            47,
-            'GameOfLife5',
-            ((24, 56), (28, 64)))
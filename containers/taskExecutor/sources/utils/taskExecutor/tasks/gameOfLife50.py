@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife50(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            92,
-            'GameOfLife50',
-            ((28, 8), (30, 12)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife51(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            93,
-            'GameOfLife51',
-            ((28, 12), (30, 16)))
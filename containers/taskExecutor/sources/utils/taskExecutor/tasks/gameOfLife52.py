@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife52(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            94,
-            'GameOfLife52',
-            ((30, 12), (32, 14)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife53(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            95,
-            'GameOfLife53',
-            ((30, 14), (32, 16)))
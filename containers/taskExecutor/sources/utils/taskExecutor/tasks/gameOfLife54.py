@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife54(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            96,
-            'GameOfLife54',
-            ((30, 8), (32, 10)))
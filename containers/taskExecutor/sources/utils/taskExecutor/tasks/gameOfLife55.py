@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife55(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            97,
-            'GameOfLife55',
-            ((30, 10), (32, 12)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife56(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            98,
-            'GameOfLife56',
-            ((28, 0), (30, 4)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife57(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            99,
-            'GameOfLife57',
-            ((28, 4), (30, 8)))
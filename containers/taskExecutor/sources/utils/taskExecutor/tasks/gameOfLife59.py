@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife59(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            101,
-            'GameOfLife59',
-            ((30, 6), (32, 8)))
@@ -1,9 +0,0 @@
-from .gameOfLife import GameOfLife
-
-
-class GameOfLife61(GameOfLife):
-    def __init__(self):
-        super().__init__(
-            103,
-            'GameOfLife61',
-            ((30, 2), (32, 4)))
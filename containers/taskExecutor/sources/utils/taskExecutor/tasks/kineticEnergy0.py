@@ -4,6 +4,7 @@ from .base import BaseTask
 class KineticEnergy0(BaseTask):
     def __init__(self):
         super().__init__(taskID=104, taskName='KineticEnergy0')
+        self.enableResultCache()
 
     def exec(self, inputData):
         m, v0 = inputData['m'], inputData['v0']
@@ -4,6 +4,7 @@ from .base import BaseTask
 class KineticEnergy1(BaseTask):
     def __init__(self):
         super().__init__(taskID=105, taskName='KineticEnergy1')
+        self.enableResultCache()
 
     def exec(self, inputData):
         m, v1 = inputData['m'], inputData['v1']
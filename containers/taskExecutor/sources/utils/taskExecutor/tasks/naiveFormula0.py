@@ -4,6 +4,7 @@ from .base import BaseTask
 class NaiveFormula0(BaseTask):
     def __init__(self):
         super().__init__(taskID=108, taskName='NaiveFormula0')
+        self.enableResultCache()
 
     def exec(self, inputData):
         a = inputData['a']
@@ -4,6 +4,7 @@ from .base import BaseTask
 class NaiveFormula1(BaseTask):
     def __init__(self):
         super().__init__(taskID=109, taskName='NaiveFormula1')
+        self.enableResultCache()
 
     def exec(self, inputData):
         a = inputData['a']
@@ -4,6 +4,7 @@ from .base import BaseTask
 class NaiveFormula2(BaseTask):
     def __init__(self):
         super().__init__(taskID=110, taskName='NaiveFormula2')
+        self.enableResultCache()
 
     def exec(self, inputData):
         a = inputData['a']
@@ -1,7 +1,8 @@
 import editdistance
-import pytesseract
 
 from .base import BaseTask
+from .blurAndPHash import BlurAndPHash
+from .tesseract import TesseractRecognizer
 
 
 class OCR(BaseTask):
@@ -10,12 +11,20 @@ class OCR(BaseTask):
         self.text = ''
         self.preText = None
         self.thresholdEditDistance = 800
+        self.thresholdDiffSkip = 0
+        self.preOCRPHash = None
+        self.skippedCount = 0
+        self.recognizer = TesseractRecognizer()
 
     def exec(self, inputData):
-        (frame, isLastFrame) = inputData
+        frame, isLastFrame = inputData[:2]
         if isLastFrame:
             return self.text
-        currText = pytesseract.image_to_string(frame)
+        # BlurAndPHash appends the pHash of the frame
+        if len(inputData) > 2 and self.isSameAsPreOCRFrame(inputData[2]):
+            self.skippedCount += 1
+            return None
+        currText = self.recognizer.imageToString(frame)
         if self.preText is None:
             self.text = currText
             self.preText = currText
@@ -27,6 +36,16 @@ class OCR(BaseTask):
         self.preText = currText
         return None
 
+    def isSameAsPreOCRFrame(self, pHash) -> bool:
+        if pHash is None:
+            return False
+        if self.preOCRPHash is not None:
+            diff = BlurAndPHash.hamDistance(self.preOCRPHash, pHash)
+            if diff <= self.thresholdDiffSkip:
+                return True
+        self.preOCRPHash = pHash
+        return False
+
     @staticmethod
     def editDistance(textA, textB):
         return editdistance.eval(textA, textB)
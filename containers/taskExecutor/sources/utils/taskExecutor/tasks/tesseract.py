@@ -0,0 +1,101 @@
+import ctypes
+import ctypes.util
+from threading import Lock
+
+import numpy as np
+import pytesseract
+
+# Same page segmentation mode as the tesseract command line default
+PSM_AUTO = 3
+
+
+def loadLibTesseract():
+    names = [
+        ctypes.util.find_library('tesseract'),
+        'libtesseract.so.5',
+        'libtesseract.so.4',
+        'libtesseract.so',
+        'libtesseract.dylib']
+    for name in names:
+        if name is None:
+            continue
+        try:
+            return ctypes.CDLL(name)
+        except OSError:
+            continue
+    return None
+
+
+# Keeps one tesseract instance with the language model loaded for the whole
+# lifetime of the task. Falls back to pytesseract, which starts the tesseract
+# command for every image, when libtesseract cannot be loaded
+class TesseractRecognizer:
+
+    def __init__(self, language: str = 'eng'):
+        self.language = language
+        self.__lock = Lock()
+        self.__api = None
+        self.__lib = loadLibTesseract()
+        if self.__lib is None:
+            return
+        self.__declareFunctions()
+        api = self.__lib.TessBaseAPICreate()
+        if self.__lib.TessBaseAPIInit3(
+                api, None, language.encode('utf-8')) != 0:
+            self.__lib.TessBaseAPIDelete(api)
+            return
+        self.__lib.TessBaseAPISetPageSegMode(api, PSM_AUTO)
+        self.__api = api
+
+    @property
+    def isPersistent(self) -> bool:
+        return self.__api is not None
+
+    def __declareFunctions(self):
+        lib = self.__lib
+        lib.TessBaseAPICreate.restype = ctypes.c_void_p
+        lib.TessBaseAPIInit3.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+        lib.TessBaseAPIInit3.restype = ctypes.c_int
+        lib.TessBaseAPISetPageSegMode.argtypes = [
+            ctypes.c_void_p, ctypes.c_int]
+        lib.TessBaseAPISetImage.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        lib.TessBaseAPIGetUTF8Text.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.POINTER(ctypes.c_char)
+        lib.TessDeleteText.argtypes = [ctypes.POINTER(ctypes.c_char)]
+        lib.TessBaseAPIEnd.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIDelete.argtypes = [ctypes.c_void_p]
+
+    def imageToString(self, frame) -> str:
+        if self.__api is None:
+            return pytesseract.image_to_string(frame, lang=self.language)
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        height, width = frame.shape[:2]
+        bytesPerPixel = 1 if frame.ndim == 2 else frame.shape[2]
+        with self.__lock:
+            self.__lib.TessBaseAPISetImage(
+                self.__api,
+                frame.ctypes.data,
+                width,
+                height,
+                bytesPerPixel,
+                width * bytesPerPixel)
+            textPointer = self.__lib.TessBaseAPIGetUTF8Text(self.__api)
+            if not textPointer:
+                return ''
+            text = ctypes.string_at(textPointer).decode('utf-8')
+            self.__lib.TessDeleteText(textPointer)
+        return text
+
+    def close(self):
+        with self.__lock:
+            if self.__api is None:
+                return
+            self.__lib.TessBaseAPIEnd(self.__api)
+            self.__lib.TessBaseAPIDelete(self.__api)
+            self.__api = None
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from . import tesseract
+from .ocr import OCR
+
+
+class Recognizer:
+
+    def __init__(self, texts):
+        self.texts = list(texts)
+        self.frames = []
+
+    def imageToString(self, frame) -> str:
+        self.frames.append(frame)
+        return self.texts.pop(0)
+
+
+def frameOf(value: int):
+    return np.full((8, 8, 3), value, dtype=np.uint8)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.task = OCR()
+        self.task.thresholdEditDistance = 0
+
+    def testSamePHashSkipped(self):
+        self.task.recognizer = Recognizer(['first page'])
+        self.assertIsNone(self.task.exec((frameOf(0), False, 0b1010)))
+        self.assertIsNone(self.task.exec((frameOf(1), False, 0b1010)))
+        self.assertEqual(1, self.task.skippedCount)
+        self.assertEqual(1, len(self.task.recognizer.frames))
+        self.assertEqual('first page', self.task.exec((None, True)))
+
+    def testChangedPHashRecognized(self):
+        self.task.recognizer = Recognizer(['first page', 'second page'])
+        self.task.exec((frameOf(0), False, 0b1010))
+        self.task.exec((frameOf(1), False, 0b0101))
+        self.assertEqual(0, self.task.skippedCount)
+        self.assertEqual(2, len(self.task.recognizer.frames))
+        self.assertEqual(
+            'first pagesecond page', self.task.exec((None, True)))
+
+    def testWithoutPHash(self):
+        # Frames that were not sent through BlurAndPHash are all recognized
+        self.task.recognizer = Recognizer(['first page', 'first page'])
+        self.task.exec((frameOf(0), False))
+        self.task.exec((frameOf(0), False))
+        self.assertEqual(0, self.task.skippedCount)
+        self.assertEqual(2, len(self.task.recognizer.frames))
+
+    def testFallbackWithoutLibTesseract(self):
+        with patch.object(tesseract, 'loadLibTesseract', return_value=None):
+            recognizer = tesseract.TesseractRecognizer()
+        self.assertFalse(recognizer.isPersistent)
+        frame = frameOf(0)
+        with patch.object(
+                tesseract.pytesseract, 'image_to_string',
+                return_value='page') as imageToString:
+            self.assertEqual('page', recognizer.imageToString(frame))
+        imageToString.assert_called_once_with(frame, lang='eng')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from time import time
+
+import cv2
+import numpy as np
+
+from .blurAndPHash import BlurAndPHash
+
+
+def legacyPHash(task: BlurAndPHash, img):
+    laplacian = cv2.Laplacian(img, cv2.CV_64F).var()
+    if laplacian <= task.thresholdLaplacian:
+        return None
+    imgGray = cv2.resize(
+        cv2.cvtColor(img, cv2.COLOR_RGB2GRAY),
+        (task.hashLen, task.hashLen),
+        cv2.INTER_AREA)
+    matrix = cv2.dct(cv2.dct(imgGray.astype(np.float32)))
+    matrixFlatten = matrix.flatten()
+    medianValue = sum(matrixFlatten) * 1. / len(matrixFlatten)
+    pHash = 0
+    for i in matrixFlatten:
+        pHash <<= 1
+        if i >= medianValue:
+            pHash += 1
+    return pHash
+
+
+def legacyHamDistance(x, y):
+    tmp = x ^ y
+    distance = 0
+    while tmp > 0:
+        distance += tmp & 1
+        tmp >>= 1
+    return distance
+
+
+def randomFrames(count: int):
+    generator = np.random.default_rng(0)
+    return [
+        generator.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        for _ in range(count)]
+
+
+class MyTestCase(unittest.TestCase):
+    task = BlurAndPHash()
+    frames = randomFrames(20)
+
+    def testSameHash(self):
+        for frame in self.frames:
+            pHash = self.task.getPHash(frame)
+            self.assertEqual(
+                self.task.pHashToInt(pHash),
+                legacyPHash(self.task, frame))
+
+    def testSameHamDistance(self):
+        for frameA, frameB in zip(self.frames, self.frames[1:]):
+            pHashA = self.task.getPHash(frameA)
+            pHashB = self.task.getPHash(frameB)
+            self.assertEqual(
+                self.task.hamDistance(pHashA, pHashB),
+                legacyHamDistance(
+                    self.task.pHashToInt(pHashA),
+                    self.task.pHashToInt(pHashB)))
+
+    def testBlurredFrame(self):
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        self.assertIsNone(self.task.getPHash(frame))
+
+    def testFasterThanLegacy(self):
+        startTime = time()
+        for frame in self.frames:
+            legacyHamDistance(
+                legacyPHash(self.task, frame),
+                legacyPHash(self.task, frame))
+        before = (time() - startTime) * 1000 / len(self.frames)
+
+        startTime = time()
+        for frame in self.frames:
+            self.task.hamDistance(
+                self.task.getPHash(frame),
+                self.task.getPHash(frame))
+        after = (time() - startTime) * 1000 / len(self.frames)
+        self.assertLess(after, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1,3 @@
 from .initTask import initTask
+from .taskRegistry import taskRegistry
+from .taskRegistry import TaskRegistry
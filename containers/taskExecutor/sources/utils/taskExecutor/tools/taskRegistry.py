@@ -0,0 +1,143 @@
+from importlib import import_module
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+from ..tasks.base import BaseTask
+
+# taskName -> (module in tasks, class name, keyword arguments)
+TaskSpec = Tuple[str, str, Dict[str, Any]]
+
+# Area of every GameOfLifeN tile, ((top, left), (bottom, right)) in a 32 x 64
+# world. GameOfLifeN has task ID 42 + N
+GAME_OF_LIFE_FOCUS_AREAS = (
+    ((0, 0), (16, 32)),
+    ((0, 32), (16, 64)),
+    ((16, 32), (24, 48)),
+    ((16, 48), (24, 64)),
+    ((24, 48), (28, 56)),
+    ((24, 56), (28, 64)),
+    ((28, 56), (30, 60)),
+    ((28, 60), (30, 64)),
+    ((30, 60), (32, 62)),
+    ((30, 62), (32, 64)),
+    ((30, 56), (32, 58)),
+    ((30, 58), (32, 60)),
+    ((28, 48), (30, 52)),
+    ((28, 52), (30, 56)),
+    ((30, 52), (32, 54)),
+    ((30, 54), (32, 56)),
+    ((30, 48), (32, 50)),
+    ((30, 50), (32, 52)),
+    ((24, 32), (28, 40)),
+    ((24, 40), (28, 48)),
+    ((28, 40), (30, 44)),
+    ((28, 44), (30, 48)),
+    ((30, 44), (32, 46)),
+    ((30, 46), (32, 48)),
+    ((30, 40), (32, 42)),
+    ((30, 42), (32, 44)),
+    ((28, 32), (30, 36)),
+    ((28, 36), (30, 40)),
+    ((30, 36), (32, 38)),
+    ((30, 38), (32, 40)),
+    ((30, 32), (32, 34)),
+    ((30, 34), (32, 36)),
+    ((16, 0), (24, 16)),
+    ((16, 16), (24, 32)),
+    ((24, 16), (28, 24)),
+    ((24, 24), (28, 32)),
+    ((28, 24), (30, 28)),
+    ((28, 28), (30, 32)),
+    ((30, 28), (32, 30)),
+    ((30, 30), (32, 32)),
+    ((30, 24), (32, 26)),
+    ((30, 26), (32, 28)),
+    ((28, 16), (30, 20)),
+    ((28, 20), (30, 24)),
+    ((30, 20), (32, 22)),
+    ((30, 22), (32, 24)),
+    ((30, 16), (32, 18)),
+    ((30, 18), (32, 20)),
+    ((24, 0), (28, 8)),
+    ((24, 8), (28, 16)),
+    ((28, 8), (30, 12)),
+    ((28, 12), (30, 16)),
+    ((30, 12), (32, 14)),
+    ((30, 14), (32, 16)),
+    ((30, 8), (32, 10)),
+    ((30, 10), (32, 12)),
+    ((28, 0), (30, 4)),
+    ((28, 4), (30, 8)),
+    ((30, 4), (32, 6)),
+    ((30, 6), (32, 8)),
+    ((30, 0), (32, 2)),
+    ((30, 2), (32, 4)),
+)
+
+
+class TaskRegistry:
+
+    def __init__(self):
+        self.specs: Dict[str, TaskSpec] = {}
+
+    def register(
+            self,
+            taskName: str,
+            moduleName: str,
+            className: str = None,
+            kwargs: Dict[str, Any] = None):
+        if className is None:
+            className = taskName
+        if kwargs is None:
+            kwargs = {}
+        self.specs[taskName] = (moduleName, className, kwargs)
+
+    def registerFamily(
+            self,
+            familyName: str,
+            moduleName: str,
+            parameters: Tuple[Dict[str, Any], ...],
+            className: str = None):
+        # Members are named familyName0, familyName1, ... and share one class
+        if className is None:
+            className = familyName
+        for i, kwargs in enumerate(parameters):
+            taskName = '%s%d' % (familyName, i)
+            self.register(
+                taskName,
+                moduleName,
+                className,
+                kwargs={'taskName': taskName, **kwargs})
+
+    def has(self, taskName: str) -> bool:
+        return taskName in self.specs
+
+    def create(self, taskName: str) -> Union[BaseTask, None]:
+        if taskName not in self.specs:
+            return None
+        moduleName, className, kwargs = self.specs[taskName]
+        # Only the module of the requested task is imported, so executors of
+        # light tasks do not load cv2, pytesseract, etc.
+        module = import_module('..tasks.%s' % moduleName, __package__)
+        taskClass = getattr(module, className)
+        return taskClass(**kwargs)
+
+
+taskRegistry = TaskRegistry()
+taskRegistry.register('FaceDetection', 'faceDetection')
+taskRegistry.register('EyeDetection', 'eyeDetection')
+taskRegistry.register('ColorTracking', 'colorTracking')
+taskRegistry.register('BlurAndPHash', 'blurAndPHash')
+taskRegistry.register('OCR', 'ocr')
+taskRegistry.registerFamily(
+    'GameOfLife',
+    'gameOfLife',
+    tuple(
+        {'taskID': 42 + i, 'focusArea': focusArea}
+        for i, focusArea in enumerate(GAME_OF_LIFE_FOCUS_AREAS)))
+for i in range(4):
+    taskRegistry.register('KineticEnergy%d' % i, 'kineticEnergy%d' % i)
+for i in range(4):
+    taskRegistry.register('NaiveFormula%d' % i, 'naiveFormula%d' % i)
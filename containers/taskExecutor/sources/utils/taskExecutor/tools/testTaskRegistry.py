@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import unittest
+from time import time
+from typing import List
+from typing import Tuple
+
+from .taskRegistry import taskRegistry
+
+COLD_START = '''
+import sys
+from utils.taskExecutor import initTask
+task = initTask('%s')
+print(task.taskName, 'cv2' in sys.modules, 'pytesseract' in sys.modules)
+'''
+
+EAGER_START = '''
+from importlib import import_module
+for moduleName, _, _ in %r:
+    import_module('utils.taskExecutor.tasks.%%s' %% moduleName)
+'''
+
+
+def runPython(code: str) -> Tuple[float, List[str]]:
+    startTime = time()
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return (time() - startTime) * 1000, output.decode().split()
+
+
+class MyTestCase(unittest.TestCase):
+
+    def testCreateAll(self):
+        for taskName in taskRegistry.specs:
+            task = taskRegistry.create(taskName)
+            self.assertEqual(task.taskName, taskName)
+
+    def testGameOfLifeFamily(self):
+        task = taskRegistry.create('GameOfLife5')
+        self.assertEqual(task.taskID, 47)
+        self.assertEqual(task.focusArea, ((24, 56), (28, 64)))
+        self.assertIsNone(taskRegistry.create('GameOfLife62'))
+
+    def testLazyColdStart(self):
+        lazyTime, output = runPython(COLD_START % 'NaiveFormula0')
+        self.assertEqual(output, ['NaiveFormula0', 'False', 'False'])
+        eagerTime, _ = runPython(
+            EAGER_START % list(taskRegistry.specs.values()) + COLD_START
+            % 'NaiveFormula0')
+        self.assertLess(lazyTime, eagerTime)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,7 +16,8 @@ class ActorResources(Resources):
             images: Images = None,
             runningContainers: RunningContainers = None,
             cpu: CPU = CPU(),
-            memory: Memory = Memory()):
+            memory: Memory = Memory(),
+            containerStats: Dict[str, Dict] = None):
         Resources.__init__(
             self,
             cpu=cpu,
@@ -30,12 +31,18 @@ class ActorResources(Resources):
             self.runningContainers = set()
         else:
             self.runningContainers = runningContainers
+        # container name -> CPU and memory usage sampled by the Actor
+        if containerStats is None:
+            self.containerStats = {}
+        else:
+            self.containerStats = containerStats
 
     def toDict(self):
         inDict = {
             'platform': self.platform.toDict(),
             'images': list(self.images),
             'runningContainers': list(self.runningContainers),
+            'containerStats': self.containerStats,
             'cpu': self.cpu.toDict(),
             'memory': self.memory.toDict()}
         return inDict
@@ -51,5 +58,6 @@ class ActorResources(Resources):
             images=inDict['images'],
             runningContainers=inDict['runningContainers'],
             cpu=CPU.fromDict(inDict['cpu']),
-            memory=Memory.fromDict(inDict['memory']))
+            memory=Memory.fromDict(inDict['memory']),
+            containerStats=inDict.get('containerStats'))
         return profiles
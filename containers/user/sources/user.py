@@ -31,6 +31,7 @@ class User:
             videoPath: str,
             golInitText: str,
             containerName: str = '',
+            schedulingBudget: float = 0,
             logLevel=DEBUG):
         self.containerName = containerName
         self.basicComponent = BasicComponent(
@@ -49,7 +50,8 @@ class User:
         self.registrationManager = RegistrationManager(
             basicComponent=self.basicComponent,
             appName=appName,
-            label=label)
+            label=label,
+            schedulingBudget=schedulingBudget)
         self.actuator = initActuator(
             appName=appName,
             label=self.registrationManager.label,
@@ -203,6 +205,14 @@ def parseArg():
         default='Qifan Deng',
         type=str,
         help='GameOfLife initial world text')
+    parser.add_argument(
+        '--schedulingBudget',
+        metavar='SchedulingBudget',
+        nargs='?',
+        default=0,
+        type=float,
+        help='Milliseconds the Master may take to place this application. '
+             'Set to 0 to leave it to the Master')
     return parser.parse_args()
 
 
@@ -218,5 +228,6 @@ if __name__ == "__main__":
         showWindow=args.showWindow,
         videoPath=args.videoPath,
         golInitText=args.golInitText,
+        schedulingBudget=args.schedulingBudget,
         logLevel=args.verbose)
     user_.run()
@@ -45,3 +45,10 @@ class MessageSubType(Enum):
     PROBE = 'probe'
     NO_ACTOR = 'noActor'
     PROFILES = 'profiles'
+    WARM_EXECUTOR_BOUND = 'warmExecutorBound'
+    WARM_EXECUTOR_EXITED = 'warmExecutorExited'
+    TASK_EXECUTOR_RUNTIME = 'taskExecutorRuntime'
+    CHILDREN_ADDRESSES = 'childrenAddresses'
+    LAUNCH_TIMES = 'launchTimes'
+    INVENTORY_DELTA = 'inventoryDelta'
+    LINK_ESTIMATES = 'linkEstimates'
@@ -15,9 +15,13 @@ class RegistrationManager:
             self,
             basicComponent: BasicComponent,
             appName: str,
-            label: str):
+            label: str,
+            schedulingBudget: float = 0):
 
         self.label = label
+        # ms the Master may take to place the application, 0 to use its own
+        # --schedulingBudget
+        self.schedulingBudget = schedulingBudget
         self.appName = appName
         self.basicComponent = basicComponent
         self.actorsCount = 0
@@ -32,6 +36,7 @@ class RegistrationManager:
         data = {
             'label': self.label,
             'applicationName': self.appName,
+            'schedulingBudget': self.schedulingBudget,
             'hostID': self.basicComponent.hostID}
 
         self.basicComponent.sendMessage(